@@ -1,5 +1,4 @@
 import os
-import time
 
 import numpy as np
 from tqdm import tqdm
@@ -17,12 +16,19 @@ def upload_dataset(ds: Dataset, client: Client) -> list[int]:
         ds (Dataset): The dataset containing audio files and labels.
         client (Client): The Behavioral Signals API client.
     Returns:
-        list[int]: A list of process IDs corresponding to the uploaded audio files.
+        list[int]: A list of process IDs corresponding to the uploaded audio files
+        (None for files that failed to upload).
     """
-    pids = []
-    for _, row in enumerate(ds):
-        process = client.upload_audio(file_path=row["audio"]["path"])
-        pids.append(process.pid)
+    paths = [row["audio"]["path"] for row in ds]
+    pids = [None] * len(paths)
+
+    pbar = tqdm(total=len(paths), desc="Uploading audio files ...", unit="files")
+    for result in client.upload_many(paths, max_concurrency=8):
+        if result.ok:
+            pids[result.index] = result.process.pid
+        else:
+            print(f"Upload of {result.source} failed: {result.error}")
+        pbar.update(1)
 
     return pids
 
@@ -39,27 +45,24 @@ def get_all_results(ds: Dataset, client: Client) -> list[str]:
         list[str]: A list of final labels for each audio file, indicating whether it is
         "spoofed" or "bonafide". If the results cannot be retrieved, it returns "failed" for that file.
     """
-    pbar = tqdm(total=len(ds), desc="Waiting all processes to be finished ...", unit="processes")
-    done = [False] * len(ds)
-
-    while not all(done):
-        for i, row in enumerate(ds):
-            if done[i]:
-                continue
-            pid = row["pid"]
-            process = client.get_process(pid=pid)
-            if not process.is_pending and not done[i]:
-                if process.is_failed:
-                    print(f"Process {pid} failed: {process.statusmsg}")
-                done[i] = True
-                pbar.update(1)
-        time.sleep(1.0)
+    pids = [pid for pid in ds["pid"] if pid is not None]
+    pbar = tqdm(total=len(pids), desc="Waiting all processes to be finished ...", unit="processes")
+
+    # Statuses are refreshed in bulk through list_processes, not with one request per pid
+    processes = {}
+    for process in client.wait_for_completion(pids, poll_interval=1.0):
+        if process.is_failed:
+            print(f"Process {process.pid} failed: {process.statusmsg}")
+        processes[process.pid] = process
+        pbar.update(1)
 
     predicted = []
-    for _, row in enumerate(ds):
-        pid = row["pid"]
-        process = client.get_process(pid=pid)
+    for pid in ds["pid"]:
         final_label = "failed"
+        process = processes.get(pid)
+        if process is None:
+            predicted.append(final_label)
+            continue
 
         if process.is_completed:
             data = client.get_result(pid=pid)
@@ -0,0 +1,89 @@
+"""Benchmark: per-speaker summaries of many results, Python loops vs ``aggregate_results``.
+
+Builds ``--results`` results of ``--items`` items each, with diarization, and computes the
+duration-weighted label fractions and mean posteriors of every (recording, speaker, task):
+
+* ``python loop``: the usual hand-written aggregation, looping over the items and their
+  predictions and attributing each item to the diarization segment it overlaps the most.
+* ``aggregate_results``: the vectorized aggregation, reported with and without building
+  the (cached) ``to_columns`` views it reads.
+
+Usage:
+    python bench_aggregation.py --results 500 --items 1000 --speakers 2
+"""
+
+import time
+import argparse
+from collections import defaultdict
+
+from fake_api import make_result
+
+from behavioralsignals import aggregate_results
+from behavioralsignals.models import ResultResponse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Result aggregation benchmark")
+    parser.add_argument("--results", type=int, default=500, help="Number of results")
+    parser.add_argument("--items", type=int, default=1000, help="Result items per result")
+    parser.add_argument("--speakers", type=int, default=2, help="Speakers per recording")
+    return parser.parse_args()
+
+
+def python_aggregate(results):
+    duration = defaultdict(float)
+    labels = defaultdict(lambda: defaultdict(float))
+    posteriors = defaultdict(lambda: defaultdict(lambda: [0.0, 0.0]))
+    for result in results:
+        turns = sorted(
+            (item for item in result.results if item.task == "diarization"), key=lambda d: d.st
+        )
+        for item in result.results:
+            if item.task == "diarization" or item.level != "segment":
+                continue
+            st, et = item.st, item.et
+            speaker, best = None, 0.0
+            for turn in turns:
+                overlap = min(et, turn.et) - max(st, turn.st)
+                if overlap > 0 and overlap >= best:
+                    speaker, best = turn.finalLabel, overlap
+            key = (result.pid, speaker, item.task)
+            weight = et - st
+            duration[key] += weight
+            labels[key][item.finalLabel] += weight
+            for p in item.prediction:
+                totals = posteriors[key][p.label]
+                totals[0] += float(p.posterior) * weight
+                totals[1] += weight
+    return duration, labels, posteriors
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = [
+        ResultResponse.model_validate(
+            make_result(pid, args.items, seed=pid, speakers=args.speakers)
+        )
+        for pid in range(args.results)
+    ]
+    n_items = sum(len(result.results) for result in results)
+    print(f"Aggregating {args.results} results with {n_items} items in total")
+
+    t0 = time.perf_counter()
+    duration, _, _ = python_aggregate(results)
+    loop_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for result in results:
+        result.to_columns()
+    columns_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    aggregates = aggregate_results(results)
+    aggregate_s = time.perf_counter() - t0
+    assert len(aggregates) == len(duration)
+
+    print(f"{'python loop':>30} | {loop_s:7.3f}s")
+    print(f"{'aggregate_results':>30} | {aggregate_s:7.3f}s | {loop_s / aggregate_s:6.1f}x")
+    total_s = columns_s + aggregate_s
+    print(f"{'to_columns + aggregate_results':>30} | {total_s:7.3f}s | {loop_s / total_s:6.1f}x")
@@ -0,0 +1,117 @@
+"""Benchmark: memory and time to first chunk of ``make_audio_stream`` on long recordings.
+
+Generates a ``--minutes`` long 16 kHz recording, as a 16-bit mono WAV and as the other
+``--formats`` (encoded with ffmpeg), and streams each of them, once with the previous
+implementation (decoding the whole file with pydub and building a list of every chunk)
+and once with ``make_audio_stream``, which reads WAV files from a memory map and decodes
+other formats chunk by chunk from ffmpeg's output. Each run happens in a fresh subprocess
+and reports its time to the first chunk, total time and peak RSS.
+
+Usage:
+    python bench_audio_decoding.py --minutes 60 --formats flac mp3
+"""
+
+import os
+import sys
+import time
+import wave
+import argparse
+import resource
+import tempfile
+import subprocess
+
+import numpy as np
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Audio decoding benchmark")
+    parser.add_argument("--minutes", type=float, default=60, help="Length of the recording")
+    parser.add_argument("--formats", nargs="*", default=["flac", "mp3"], help="Formats besides WAV")
+    parser.add_argument("--chunk_size", type=float, default=0.25, help="Chunk size in seconds")
+    parser.add_argument("--mode", choices=["legacy", "streaming"], help=argparse.SUPPRESS)
+    parser.add_argument("--file_path", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def legacy_audio_stream(file_path: str, chunk_size: float):
+    # What make_audio_stream used to do
+    from pydub import AudioSegment
+    from pydub.utils import make_chunks
+
+    snd = AudioSegment.from_file(file_path)
+    snd = snd.set_sample_width(2)
+    snd = snd.set_channels(1)
+    chunks = make_chunks(snd, chunk_size * 1000)
+    return iter([chunk.raw_data for chunk in chunks]), snd.frame_rate
+
+
+def run_stream(mode: str, file_path: str, chunk_size: float):
+    from behavioralsignals.utils import make_audio_stream
+
+    baseline = peak_rss_mb()
+    t0 = time.perf_counter()
+    if mode == "legacy":
+        audio_stream, _ = legacy_audio_stream(file_path, chunk_size)
+    else:
+        audio_stream, _ = make_audio_stream(file_path, chunk_size)
+    n_bytes = len(next(audio_stream))
+    first_s = time.perf_counter() - t0
+    for chunk in audio_stream:
+        n_bytes += len(chunk)
+    elapsed = time.perf_counter() - t0
+
+    name = os.path.splitext(file_path)[1][1:]
+    print(
+        f"{name:>5} | {mode:>9} | first chunk {first_s * 1000:8.1f} ms | {elapsed:6.2f}s"
+        f" | {n_bytes / 2**20:6.1f} MB of PCM"
+        f" | peak RSS {peak_rss_mb():7.1f} MB (before {baseline:.1f} MB)"
+    )
+
+
+def write_recording(file_path: str, minutes: float, sample_rate: int = 16000):
+    rng = np.random.default_rng(0)
+    with wave.open(file_path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        for _ in range(int(minutes * 60)):
+            f.writeframes(rng.integers(-3000, 3000, sample_rate, dtype=np.int16).tobytes())
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.mode:
+        run_stream(args.mode, args.file_path, args.chunk_size)
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        wav_path = os.path.join(tmp, "recording.wav")
+        write_recording(wav_path, args.minutes)
+        file_paths = [wav_path]
+        for audio_format in args.formats:
+            file_path = os.path.join(tmp, f"recording.{audio_format}")
+            subprocess.run(["ffmpeg", "-loglevel", "error", "-i", wav_path, file_path], check=True)
+            file_paths.append(file_path)
+
+        print(f"Streaming a {args.minutes:g} minute recording in {args.chunk_size}s chunks")
+        for file_path in file_paths:
+            for mode in ("legacy", "streaming"):
+                subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--mode",
+                        mode,
+                        "--file_path",
+                        file_path,
+                        "--chunk_size",
+                        str(args.chunk_size),
+                    ],
+                    check=True,
+                )
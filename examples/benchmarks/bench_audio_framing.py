@@ -0,0 +1,99 @@
+"""Benchmark: CPU cost of framing outgoing audio chunks into streaming messages.
+
+Frames ``--seconds`` of 16kHz 16-bit audio, captured as int16 numpy arrays of
+``--chunk_ms`` milliseconds (as from a microphone callback), into ``pb.AudioStream``
+messages:
+
+* ``protobuf``: what ``stream_audio`` used to do, ``chunk.tobytes()`` by the producer and a
+  new ``pb.AudioStream`` per chunk, with ``cid`` and ``x_auth_token`` set again and
+  serialized by gRPC. The audio is copied 3 times (``tobytes``, message, serialization).
+* ``framer``: ``AudioFramer`` joining the pre-serialized ``cid``/``x_auth_token`` prefix
+  and the chunk's buffer into the message, copying the audio once.
+* ``framer+coalesce``: the same with ``frame_duration``, coalescing the chunks into
+  ``--frame_ms`` messages, which also cuts the number of messages.
+
+gRPC's own copy of every message into its send buffer is the same for all and not counted.
+Each is measured in-process and end-to-end against a local fake streaming servicer, which
+answers every message with one result.
+
+Usage:
+    python bench_audio_framing.py --seconds 600 --chunk_ms 10 --frame_ms 100
+"""
+
+import time
+import argparse
+
+import numpy as np
+from fake_streaming import FakeStreamingServer
+
+from behavioralsignals import Client, StreamingOptions
+from behavioralsignals.framing import AudioFramer
+from behavioralsignals.generated import api_pb2 as pb
+
+
+SAMPLE_RATE = 16000
+BYTES_PER_SECOND = SAMPLE_RATE * 2
+COPIES = {"protobuf": 3, "framer": 1, "framer+coalesce": 1}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Audio framing benchmark")
+    parser.add_argument("--seconds", type=int, default=600, help="Seconds of audio to frame")
+    parser.add_argument("--chunk_ms", type=int, default=10, help="Duration of each chunk")
+    parser.add_argument("--frame_ms", type=int, default=100, help="Coalesced frame duration")
+    return parser.parse_args()
+
+
+def protobuf_messages(chunks, options):
+    yield pb.AudioStream(cid=1, x_auth_token="key", config=options.to_pb_config())
+    for chunk in chunks:
+        yield pb.AudioStream(cid=1, x_auth_token="key", audio_content=chunk.tobytes())
+
+
+def report(name: str, messages: int, seconds: float, audio_seconds: float):
+    copied = COPIES[name] * BYTES_PER_SECOND / 1000
+    print(
+        f"{name:>16} | {messages / seconds:9.0f} msgs/s | {audio_seconds / seconds:8.0f}x "
+        f"real time | {copied:4.0f} KB copied per second of audio"
+    )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    samples = SAMPLE_RATE * args.chunk_ms // 1000
+    audio = np.zeros(SAMPLE_RATE * args.seconds, dtype=np.int16)
+    chunks = [audio[i : i + samples] for i in range(0, len(audio), samples)]
+    options = StreamingOptions(sample_rate=SAMPLE_RATE, encoding="LINEAR_PCM")
+    coalesced = options.model_copy(update={"frame_duration": args.frame_ms / 1000})
+
+    print(f"In-process framing of {args.seconds}s of audio in {args.chunk_ms}ms chunks:")
+    for name, frame in (
+        ("protobuf", lambda: (m.SerializeToString() for m in protobuf_messages(chunks, options))),
+        ("framer", lambda: AudioFramer(1, "key", options).messages(chunks)),
+        ("framer+coalesce", lambda: AudioFramer(1, "key", coalesced).messages(chunks)),
+    ):
+        t0 = time.perf_counter()
+        n_messages = sum(1 for _ in frame())
+        report(name, n_messages, time.perf_counter() - t0, args.seconds)
+
+    print("End-to-end against a local fake streaming servicer:")
+    with FakeStreamingServer(results_per_message=1) as server:
+        client = Client(1, "key", streaming_api_url=server.address, use_ssl=False, lazy_auth=True)
+        channel = client.transport.streaming_channel()
+        legacy = channel.stream_stream(
+            "/behavioral_api.grpc.v1.BehavioralStreamingApi/StreamAudio",
+            request_serializer=pb.AudioStream.SerializeToString,
+            response_deserializer=pb.StreamResult.FromString,
+        )
+        for name, run in (
+            ("protobuf", lambda: legacy(protobuf_messages(chunks, options))),
+            ("framer", lambda: client.behavioral.stream_audio(chunks, options, raw=True)),
+            (
+                "framer+coalesce",
+                lambda: client.behavioral.stream_audio(chunks, coalesced, raw=True),
+            ),
+        ):
+            t0 = time.perf_counter()
+            n_messages = sum(1 for _ in run())
+            report(name, n_messages, time.perf_counter() - t0, args.seconds)
+        client.close()
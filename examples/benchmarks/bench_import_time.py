@@ -0,0 +1,92 @@
+"""Benchmark: time to ``import behavioralsignals``, with a regression budget.
+
+Runs ``python -X importtime -c "import behavioralsignals"`` in ``--runs`` fresh interpreters
+and reports the median cumulative import time, next to the time of importing only the
+required REST dependencies (``pydantic`` and ``requests``). The difference is the SDK's own
+import overhead, which is checked against ``--budget_ms``.
+
+It also checks that the streaming and audio dependencies (``grpc``, ``protobuf``, ``pydub``)
+and other optional ones are not loaded by the import, since they are only needed once
+streaming or the audio utilities are used.
+
+Exits with status 1 when the budget is exceeded or a lazy dependency is loaded, so it can
+run as a CI check.
+
+Usage:
+    python bench_import_time.py --runs 9 --budget_ms 200
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+
+
+LAZY_MODULES = ("grpc", "google.protobuf", "pydub", "asyncio", "httpx", "numpy", "pyarrow")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Import time benchmark")
+    parser.add_argument("--runs", type=int, default=9, help="Number of fresh interpreters")
+    parser.add_argument(
+        "--budget_ms", type=float, default=200.0, help="Maximum SDK import overhead (ms)"
+    )
+    return parser.parse_args()
+
+
+def import_time(statement: str) -> tuple[float, set]:
+    """Returns the cumulative import time (ms) of the top-level imports of ``statement``
+    and the names of all the modules it loaded."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    total_us = 0
+    modules = set()
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        # Top-level imports are not indented
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def median_import_time(statement: str, runs: int) -> tuple[float, set]:
+    timings, modules = [], set()
+    for _ in range(runs):
+        elapsed, loaded = import_time(statement)
+        timings.append(elapsed)
+        modules |= loaded
+    return statistics.median(timings), modules
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    sdk_ms, modules = median_import_time("import behavioralsignals", args.runs)
+    deps_ms, _ = median_import_time("import pydantic, requests", args.runs)
+    overhead_ms = sdk_ms - deps_ms
+
+    print(f"{'import behavioralsignals':>28} | {sdk_ms:7.1f} ms")
+    print(f"{'import pydantic, requests':>28} | {deps_ms:7.1f} ms")
+    print(f"{'SDK overhead':>28} | {overhead_ms:7.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    loaded = sorted(
+        m for m in LAZY_MODULES if any(n == m or n.startswith(m + ".") for n in modules)
+    )
+    failed = False
+    if loaded:
+        print(f"FAIL: lazily loaded dependencies were imported: {', '.join(loaded)}")
+        failed = True
+    if overhead_ms > args.budget_ms:
+        print(f"FAIL: import overhead exceeds the budget of {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
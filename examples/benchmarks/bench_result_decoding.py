@@ -0,0 +1,76 @@
+"""Benchmark: decoding large results returned by get_result.
+
+Compares, over a realistic result payload of ``--items`` result items:
+
+* ``dict + ResultResponse(**data)``: what ``get_result`` used to do, decoding the body to a
+  dict with ``response.json()`` and validating the dict again into models.
+* ``model_validate_json``: the current ``get_result`` fast path, validating the models
+  straight from the response bytes in a single pass.
+* ``get_result_json``: the unvalidated path, returning plain decoded JSON (orjson when
+  installed) without building any models.
+
+Usage:
+    python bench_result_decoding.py --items 10000
+"""
+
+import json
+import time
+import argparse
+
+from fake_api import FakeAPIServer, make_result
+
+from behavioralsignals import Client
+from behavioralsignals.base import json_loads
+from behavioralsignals.models import ResultResponse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Result decoding benchmark")
+    parser.add_argument("--items", type=int, default=10000, help="Result items per result")
+    parser.add_argument("--repeat", type=int, default=10, help="Repetitions (best is reported)")
+    return parser.parse_args()
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def report(name: str, seconds: float, baseline: float):
+    print(f"{name:>32} | {seconds * 1000:8.1f} ms | {baseline / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    body = json.dumps(make_result(pid=1, n_items=args.items)).encode()
+    print(f"Decoding a {len(body) / 1e6:.1f} MB result with {args.items} items")
+
+    print("In-process decoding:")
+    baseline = best_of(lambda: ResultResponse(**json.loads(body)), args.repeat)
+    report("dict + ResultResponse(**data)", baseline, baseline)
+    report(
+        "model_validate_json",
+        best_of(lambda: ResultResponse.model_validate_json(body), args.repeat),
+        baseline,
+    )
+    report("unvalidated JSON", best_of(lambda: json_loads(body), args.repeat), baseline)
+
+    print("End-to-end against a local stand-in server:")
+    with FakeAPIServer(auth_latency=0, result_items=args.items) as server:
+        client = Client(1, "key", api_url=server.url).behavioral
+        path = f"clients/{client.config.cid}/processes/1/results"
+
+        def legacy():
+            data = client._send_request(path=path, method="GET")
+            return ResultResponse(**data)
+
+        baseline = best_of(legacy, args.repeat)
+        report("dict + ResultResponse(**data)", baseline, baseline)
+        report("get_result", best_of(lambda: client.get_result(pid=1), args.repeat), baseline)
+        report(
+            "get_result_json", best_of(lambda: client.get_result_json(pid=1), args.repeat), baseline
+        )
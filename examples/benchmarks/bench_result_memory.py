@@ -0,0 +1,80 @@
+"""Benchmark: memory held by large result collections.
+
+Decodes ``--results`` results of ``--items`` result items each and reports the bytes held
+per result item (measured with ``tracemalloc``) for:
+
+* ``ResultResponse``: the pydantic models returned by ``get_result``.
+* ``CompactResult``: the slotted copy returned by ``ResultResponse.to_compact()``, with
+  numbers parsed once and labels interned.
+
+It also checks that compact results convert back to equal models.
+
+Usage:
+    python bench_result_memory.py --results 20 --items 10000
+"""
+
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+
+from fake_api import make_result
+
+from behavioralsignals.models import ResultResponse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Result memory benchmark")
+    parser.add_argument("--results", type=int, default=20, help="Number of results to hold")
+    parser.add_argument("--items", type=int, default=10000, help="Result items per result")
+    return parser.parse_args()
+
+
+def measure(build) -> tuple[int, float, list]:
+    """Returns the bytes still allocated by ``build()``, its duration and its return value."""
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, value
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    bodies = [
+        json.dumps(make_result(pid=pid, n_items=args.items, seed=pid)).encode()
+        for pid in range(args.results)
+    ]
+    n_items = args.results * args.items
+    print(f"Holding {args.results} results of {args.items} items ({n_items} items in total)")
+
+    model_bytes, model_time, models = measure(
+        lambda: [ResultResponse.model_validate_json(body) for body in bodies]
+    )
+    # Converting from the models is how results are compacted in practice, but only the
+    # compact copies themselves are measured
+    compact_bytes, compact_time, compact = measure(lambda: [m.to_compact() for m in models])
+
+    for result, original in zip(compact, models):
+        restored = result.to_model()
+        for a, b in zip(restored.results, original.results):
+            assert a.task == b.task and a.st == b.st and a.et == b.et
+            assert [float(p.posterior) for p in a.prediction] == [
+                float(p.posterior) for p in b.prediction
+            ]
+    del models
+
+    print(f"{'representation':>16} | {'bytes/item':>10} | {'total':>9} | {'build':>8}")
+    for name, size, elapsed in (
+        ("ResultResponse", model_bytes, model_time),
+        ("CompactResult", compact_bytes, compact_time),
+    ):
+        print(
+            f"{name:>16} | {size / n_items:10.0f} | {size / 1e6:7.1f}MB | {elapsed * 1000:6.0f}ms"
+        )
+    print(f"CompactResult uses {model_bytes / compact_bytes:.1f}x less memory")
@@ -0,0 +1,92 @@
+"""Benchmark: peak memory and time to first item of fetching a huge result.
+
+Serves a result of ``--items`` result items with ``--embedding_dim``-dimensional embeddings
+from a local stand-in API server and consumes it, in a fresh subprocess each, with:
+
+* ``get_result``: downloads the whole body, then validates it into a ``ResultResponse``.
+* ``iter_result``: parses the body incrementally while it downloads and yields each
+  ``ResultItem`` as soon as it is decoded.
+
+Each run reports the time until its first item is available, the total time and its peak RSS.
+
+Usage:
+    python bench_result_streaming.py --items 5000 --embedding_dim 728
+"""
+
+import sys
+import time
+import argparse
+import resource
+import subprocess
+
+from fake_api import FakeAPIServer
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Result streaming benchmark")
+    parser.add_argument("--items", type=int, default=5000, help="Result items in the result")
+    parser.add_argument("--embedding_dim", type=int, default=728, help="Embedding dimension")
+    parser.add_argument("--mode", choices=["get_result", "iter_result"], help=argparse.SUPPRESS)
+    parser.add_argument("--api_url", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def peak_rss_mb() -> float:
+    # On Linux, ru_maxrss survives exec and would include the peak of the parent process
+    # (which holds the whole payload), so the high water mark of this process is read instead
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is reported in bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1 << 20)
+
+
+def run_fetch(mode: str, api_url: str):
+    from behavioralsignals import Behavioral
+
+    client = Behavioral(1, "key", api_url=api_url)
+    baseline = peak_rss_mb()
+    t0 = time.perf_counter()
+    first = None
+    n_items = 0
+
+    if mode == "get_result":
+        for _ in client.get_result(pid=1).results:
+            first = first or time.perf_counter() - t0
+            n_items += 1
+    else:
+        for _ in client.iter_result(pid=1):
+            first = first or time.perf_counter() - t0
+            n_items += 1
+
+    elapsed = time.perf_counter() - t0
+    print(
+        f"{mode:>11} | {n_items} items | first after {first:6.3f}s | total {elapsed:6.2f}s | "
+        f"peak RSS {peak_rss_mb():7.1f} MB (before {baseline:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.mode:
+        run_fetch(args.mode, args.api_url)
+        sys.exit(0)
+
+    with FakeAPIServer(
+        auth_latency=0, result_items=args.items, embedding_dim=args.embedding_dim
+    ) as server:
+        # Generate the payload up front, so that it is not part of the measurements
+        import requests
+
+        body = requests.get(f"{server.url}/clients/1/processes/1/results").content
+        print(f"Fetching a {len(body) / 1e6:.1f} MB result with {args.items} items")
+        del body
+
+        for mode in ("get_result", "iter_result"):
+            subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--api_url", server.url], check=True
+            )
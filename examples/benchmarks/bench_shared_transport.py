@@ -0,0 +1,86 @@
+"""Benchmark: connection reuse and startup latency of the shared client transport.
+
+Compares two ways of using the SDK against a local stand-in API server that adds a
+fixed latency to ``/auth`` (standing in for the TLS handshake + auth round trip):
+
+* ``standalone``: a separate ``Behavioral`` and ``Deepfakes`` client, each with its
+  own session and authentication (how every sub-client behaved before).
+* ``shared``: one ``Client`` whose ``behavioral``/``deepfakes`` sub-clients share a
+  single connection pool and a single authentication.
+
+It then runs a multi-threaded ``get_process`` workload and reports how many TCP
+connections the server had to accept. Pools smaller than the number of threads keep
+discarding and reopening connections, which shows up as a much larger count.
+
+Usage:
+    python bench_shared_transport.py --threads 32 --requests 50
+"""
+
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from fake_api import FakeAPIServer
+
+from behavioralsignals import Client, Deepfakes, Behavioral
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Shared transport benchmark")
+    parser.add_argument("--threads", type=int, default=32, help="Number of worker threads")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per thread")
+    parser.add_argument(
+        "--pool_maxsize", type=int, default=None, help="Shared pool size (default: --threads)"
+    )
+    parser.add_argument(
+        "--auth_latency", type=float, default=0.05, help="Simulated /auth latency (s)"
+    )
+    return parser.parse_args()
+
+
+def run_workload(clients, threads: int, requests_per_thread: int):
+    def worker(i):
+        client = clients[i % len(clients)]
+        for pid in range(requests_per_thread):
+            client.get_process(pid=pid)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+
+
+def bench(server: FakeAPIServer, mode: str, args):
+    server.reset()
+    options = {"api_url": server.url}
+
+    t0 = time.perf_counter()
+    if mode == "standalone":
+        # Default-sized pools, as every sub-client used to get
+        clients = [Behavioral(1, "key", **options), Deepfakes(1, "key", **options)]
+        closeables = clients
+    else:
+        client = Client(1, "key", pool_maxsize=args.pool_maxsize or args.threads, **options)
+        clients = [client.behavioral, client.deepfakes]
+        closeables = [client]
+    startup = time.perf_counter() - t0
+    auth_requests = server.auth_requests
+
+    t0 = time.perf_counter()
+    run_workload(clients, args.threads, args.requests)
+    elapsed = time.perf_counter() - t0
+
+    for c in closeables:
+        c.close()
+
+    total = args.threads * args.requests
+    print(
+        f"{mode:>10} | startup {startup * 1000:7.1f} ms | auth calls {auth_requests} | "
+        f"{total} requests in {elapsed:.2f}s ({total / elapsed:8.0f} req/s) | "
+        f"TCP connections {server.connections}"
+    )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    with FakeAPIServer(auth_latency=args.auth_latency) as server:
+        for mode in ("standalone", "shared"):
+            bench(server, mode, args)
@@ -0,0 +1,86 @@
+"""Benchmark: messages per second decoded by stream_audio.
+
+Compares three ways of turning the ``pb.StreamResult`` messages of a stream into Python
+objects, which is CPU-bound work on the real-time path and limits how many streams one
+process can handle:
+
+* ``MessageToDict``: what ``stream_audio`` used to do, serializing each message to a dict
+  and validating that into a ``StreamingResultResponse``.
+* ``from_pb``: the current conversion, reading the typed fields directly.
+* ``raw``: ``stream_audio(..., raw=True)``, yielding the protobuf messages as they are.
+
+Each is measured in-process on a pre-built message and end-to-end against a local fake
+streaming servicer, which answers every audio chunk with one message.
+
+Usage:
+    python bench_stream_decoding.py --messages 20000 --results 4
+"""
+
+import time
+import argparse
+
+from fake_streaming import FakeStreamingServer, make_stream_result
+from google.protobuf.json_format import MessageToDict
+
+from behavioralsignals import Client, StreamingOptions
+from behavioralsignals.models import StreamingResultResponse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Streaming result decoding benchmark")
+    parser.add_argument("--messages", type=int, default=20000, help="Messages per stream")
+    parser.add_argument("--results", type=int, default=4, help="Result items per message")
+    return parser.parse_args()
+
+
+def legacy_decode(message) -> StreamingResultResponse:
+    resp_dict = MessageToDict(message, always_print_fields_with_no_presence=True)
+    return StreamingResultResponse(**resp_dict)
+
+
+def report(name: str, n_messages: int, seconds: float, baseline: float):
+    rate = n_messages / seconds
+    print(f"{name:>14} | {rate:9.0f} msgs/s | {baseline / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    message = make_stream_result(0, n_results=args.results)
+    assert legacy_decode(message) == StreamingResultResponse.from_pb(message)
+
+    print(f"In-process decoding of {args.messages} messages with {args.results} results:")
+    timings = {}
+    for name, decode in (
+        ("MessageToDict", legacy_decode),
+        ("from_pb", StreamingResultResponse.from_pb),
+    ):
+        t0 = time.perf_counter()
+        for _ in range(args.messages):
+            decode(message)
+        timings[name] = time.perf_counter() - t0
+    for name, seconds in timings.items():
+        report(name, args.messages, seconds, timings["MessageToDict"])
+
+    print("End-to-end against a local fake streaming servicer:")
+    options = StreamingOptions(sample_rate=16000, encoding="LINEAR_PCM")
+    chunk = bytes(3200)  # 100ms of 16kHz 16-bit audio
+    with FakeStreamingServer(results_per_message=args.results) as server:
+        client = Client(
+            1, "key", streaming_api_url=server.address, use_ssl=False, lazy_auth=True
+        ).behavioral
+
+        def run(decode, raw: bool) -> float:
+            t0 = time.perf_counter()
+            audio = (chunk for _ in range(args.messages))
+            for response in client.stream_audio(audio, options, raw=raw):
+                if decode is not None:
+                    decode(response)
+            return time.perf_counter() - t0
+
+        timings = {
+            "MessageToDict": run(legacy_decode, raw=True),
+            "from_pb": run(None, raw=False),
+            "raw": run(None, raw=True),
+        }
+        for name, seconds in timings.items():
+            report(name, args.messages, seconds, timings["MessageToDict"])
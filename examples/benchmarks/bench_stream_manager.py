@@ -0,0 +1,144 @@
+"""Benchmark: many concurrent live streams, thread per stream vs ``StreamManager``.
+
+Simulates ``--streams`` live phone lines against a fake streaming servicer running in a
+separate process. A single producer thread pushes one 100ms audio chunk to every line
+every 100ms for ``--seconds`` seconds, and each chunk is answered with one result:
+
+* ``threads``: one thread per line blocking on ``stream_audio``, fed through a queue.
+* ``manager``: one ``StreamManager`` with pushed audio (``send``/``end``), driving every
+  stream from a single event loop thread.
+
+Each mode runs in its own process and reports its thread count, CPU time, peak RSS and
+the results received.
+
+Usage:
+    python bench_stream_manager.py --streams 500 --seconds 10
+"""
+
+import sys
+import time
+import queue
+import argparse
+import resource
+import threading
+import subprocess
+
+from behavioralsignals import Client, StreamManager, StreamingOptions
+
+
+CHUNK = bytes(3200)  # 100ms of 16kHz 16-bit audio
+OPTIONS = StreamingOptions(sample_rate=16000, encoding="LINEAR_PCM")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Concurrent streams benchmark")
+    parser.add_argument("--streams", type=int, default=500, help="Number of concurrent streams")
+    parser.add_argument("--seconds", type=int, default=10, help="Seconds of audio per stream")
+    parser.add_argument("--channels", type=int, default=4, help="streaming_channels")
+    parser.add_argument("--mode", choices=["threads", "manager"], help=argparse.SUPPRESS)
+    parser.add_argument("--address", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def peak_rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def produce(send, end, streams: int, seconds: int):
+    """Pushes a chunk to every stream every 100ms, then ends them."""
+    start = time.perf_counter()
+    for tick in range(seconds * 10):
+        for key in range(streams):
+            send(key, CHUNK)
+        time.sleep(max(0.0, start + (tick + 1) * 0.1 - time.perf_counter()))
+    for key in range(streams):
+        end(key)
+
+
+def run_threads(client, streams: int, seconds: int) -> tuple[int, int]:
+    queues = [queue.Queue() for _ in range(streams)]
+    received = [0] * streams
+
+    def _audio(q):
+        while (chunk := q.get()) is not None:
+            yield chunk
+
+    def _consume(key):
+        for _ in client.behavioral.stream_audio(_audio(queues[key]), OPTIONS):
+            received[key] += 1
+
+    threads = [threading.Thread(target=_consume, args=(key,)) for key in range(streams)]
+    for thread in threads:
+        thread.start()
+    n_threads = threading.active_count()
+    produce(lambda k, c: queues[k].put(c), lambda k: queues[k].put(None), streams, seconds)
+    for thread in threads:
+        thread.join()
+    return n_threads, sum(received)
+
+
+def run_manager(client, streams: int, seconds: int) -> tuple[int, int]:
+    received = 0
+    with StreamManager(client) as manager:
+        for key in range(streams):
+            manager.add(key, OPTIONS)
+        n_threads = threading.active_count()
+        producer = threading.Thread(
+            target=produce, args=(manager.send, manager.end, streams, seconds)
+        )
+        producer.start()
+        ended = 0
+        while ended < streams:
+            event = manager.get()
+            if event.done:
+                ended += 1
+            else:
+                received += 1
+        producer.join()
+    return n_threads, received
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.mode:
+        client = Client(
+            1,
+            "key",
+            streaming_api_url=args.address,
+            use_ssl=False,
+            lazy_auth=True,
+            streaming_channels=args.channels,
+        )
+        run = run_threads if args.mode == "threads" else run_manager
+        cpu, t0 = time.process_time(), time.perf_counter()
+        n_threads, received = run(client, args.streams, args.seconds)
+        cpu, elapsed = time.process_time() - cpu, time.perf_counter() - t0
+        print(
+            f"{args.mode:>8} | {n_threads:4d} threads | CPU {cpu:6.2f}s in {elapsed:5.1f}s | "
+            f"peak RSS {peak_rss_mb():6.1f} MB | {received} results"
+        )
+        sys.exit(0)
+
+    server = subprocess.Popen(
+        [sys.executable, "fake_streaming.py", "--max_workers", str(args.streams + 16)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        address = server.stdout.readline().strip()
+        print(f"{args.streams} concurrent streams of {args.seconds}s of audio:")
+        for mode in ("threads", "manager"):
+            subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--address", address]
+                + ["--streams", str(args.streams), "--seconds", str(args.seconds)]
+                + ["--channels", str(args.channels)],
+                check=True,
+            )
+    finally:
+        server.stdin.close()
+        server.wait()
@@ -0,0 +1,85 @@
+"""Benchmark: cost and output of the streaming latency instrumentation (``StreamMetrics``).
+
+Against a local fake streaming servicer whose results cover the audio received so far:
+
+* overhead: streams ``--seconds`` of audio in ``--chunk_ms`` chunks as fast as possible,
+  with and without ``metrics``, and reports the best message rate of ``--repeat`` runs.
+* lag: streams ``--paced_seconds`` of audio in real time to a server that needs half the
+  duration of a chunk to process it, then to one that needs ``--overload`` times it, and
+  prints the recorded histograms: the overloaded server falls further behind with every
+  chunk, which shows in ``result_lag`` and ``audio_backlog``.
+
+Usage:
+    python bench_stream_metrics.py --seconds 600 --chunk_ms 20 --paced_seconds 5
+"""
+
+import time
+import argparse
+
+from fake_streaming import FakeStreamingServer
+
+from behavioralsignals import Client, StreamMetrics, StreamingOptions
+
+
+SAMPLE_RATE = 16000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Streaming latency instrumentation benchmark")
+    parser.add_argument("--seconds", type=int, default=600, help="Seconds of audio to stream")
+    parser.add_argument("--chunk_ms", type=int, default=20, help="Duration of each chunk")
+    parser.add_argument("--paced_seconds", type=float, default=5, help="Real-time audio")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of the unpaced stream")
+    parser.add_argument("--overload", type=float, default=1.2, help="Slow server factor")
+    return parser.parse_args()
+
+
+def paced(chunks, chunk_seconds: float):
+    start = time.monotonic()
+    for i, chunk in enumerate(chunks):
+        time.sleep(max(start + i * chunk_seconds - time.monotonic(), 0))
+        yield chunk
+
+
+def stream(chunks, options, delay: float = 0.0, metrics=None, chunk_seconds=None) -> float:
+    with FakeStreamingServer(results_per_message=4, timeline=True, delay=delay) as server:
+        client = Client(1, "key", streaming_api_url=server.address, use_ssl=False, lazy_auth=True)
+        client.connect_streaming(timeout=5)
+        source = chunks if chunk_seconds is None else paced(chunks, chunk_seconds)
+        t0 = time.perf_counter()
+        for _ in client.behavioral.stream_audio(source, options, metrics=metrics):
+            pass
+        elapsed = time.perf_counter() - t0
+        client.close()
+    return elapsed
+
+
+def print_summary(metrics: StreamMetrics):
+    for name, summary in metrics.summary().items():
+        if not summary["count"]:
+            continue
+        print(
+            f"  {name:>20} | n={summary['count']:6d} | p50 {summary['p50'] * 1000:8.1f} ms"
+            f" | p99 {summary['p99'] * 1000:8.1f} ms | max {summary['max'] * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    chunk_seconds = args.chunk_ms / 1000
+    chunk = bytes(2 * int(SAMPLE_RATE * chunk_seconds))
+    options = StreamingOptions(sample_rate=SAMPLE_RATE, encoding="LINEAR_PCM")
+
+    chunks = [chunk] * int(args.seconds / chunk_seconds)
+    print(f"Streaming {args.seconds}s of audio in {args.chunk_ms}ms chunks, unpaced:")
+    for name, metrics in (("no metrics", None), ("metrics", StreamMetrics())):
+        # Best of a few runs, end-to-end rates being noisy
+        elapsed = min(stream(chunks, options, metrics=metrics) for _ in range(args.repeat))
+        print(f"{name:>12} | {len(chunks) / elapsed:9.0f} msgs/s")
+
+    chunks = [chunk] * int(args.paced_seconds / chunk_seconds)
+    for name, factor in (("healthy", 0.5), ("overloaded", args.overload)):
+        print(f"{args.paced_seconds:g}s of real-time audio, {name} server ({factor:g}x real time):")
+        metrics = StreamMetrics()
+        stream(chunks, options, factor * chunk_seconds, metrics, chunk_seconds)
+        print_summary(metrics)
@@ -0,0 +1,74 @@
+"""Benchmark: time to first result of short streams with a cold vs a warm channel.
+
+Runs ``--streams`` short streams one after the other against a local fake streaming
+servicer and reports the time from starting each stream to receiving its first result:
+
+* ``cold``: a new client per stream, so every stream opens (and closes) its own channel,
+  paying for the TCP, TLS and HTTP/2 handshakes, as ``stream_audio`` used to do.
+* ``warm``: one client whose shared channel is opened once with ``connect_streaming``
+  and reused by every stream.
+
+With ``--tls`` the server uses a self-signed certificate, so the handshakes include TLS
+as they do against the real API (network round trips are not simulated).
+
+Usage:
+    python bench_streaming_channel.py --streams 200 --tls
+"""
+
+import time
+import argparse
+import statistics
+
+from fake_streaming import FakeStreamingServer
+
+from behavioralsignals import Client, StreamingOptions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Streaming channel reuse benchmark")
+    parser.add_argument("--streams", type=int, default=200, help="Number of streams")
+    parser.add_argument("--chunks", type=int, default=5, help="Audio chunks per stream")
+    parser.add_argument("--tls", action="store_true", help="Use TLS with a self-signed cert")
+    return parser.parse_args()
+
+
+def time_to_first_result(client, chunks: int) -> float:
+    options = StreamingOptions(sample_rate=16000, encoding="LINEAR_PCM")
+    audio = (bytes(3200) for _ in range(chunks))  # 100ms chunks of 16kHz 16-bit audio
+    t0 = time.perf_counter()
+    first = None
+    for _ in client.stream_audio(audio, options):
+        first = first or time.perf_counter() - t0
+    return first
+
+
+def report(name: str, timings: list):
+    timings = sorted(timings)
+    p95 = timings[int(0.95 * (len(timings) - 1))]
+    median = statistics.median(timings)
+    print(f"{name:>5} | median {median * 1000:7.2f} ms | p95 {p95 * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    with FakeStreamingServer(tls=args.tls) as server:
+
+        def make_client():
+            return Client(
+                1, "key", streaming_api_url=server.address, use_ssl=args.tls, lazy_auth=True
+            )
+
+        cold = []
+        for _ in range(args.streams):
+            with make_client() as client:
+                cold.append(time_to_first_result(client.behavioral, args.chunks))
+
+        warm = []
+        with make_client() as client:
+            client.connect_streaming(timeout=10)
+            for _ in range(args.streams):
+                warm.append(time_to_first_result(client.behavioral, args.chunks))
+
+    print(f"Time to first result of {args.streams} streams ({'TLS' if args.tls else 'plaintext'}):")
+    report("cold", cold)
+    report("warm", warm)
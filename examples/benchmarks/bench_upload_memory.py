@@ -0,0 +1,87 @@
+"""Benchmark: peak memory of uploading a large audio file.
+
+Uploads a (sparse) file of ``--size_mb`` megabytes to a local stand-in API server, once
+with ``requests``' ``files=`` encoding (what ``upload_audio`` used to do, building the whole
+multipart body in memory) and once through ``upload_audio``, which streams the body with
+``MultipartEncoder``. Each upload runs in a fresh subprocess and reports its peak RSS.
+
+Usage:
+    python bench_upload_memory.py --size_mb 2048
+"""
+
+import os
+import sys
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+from fake_api import FakeAPIServer
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Upload memory benchmark")
+    parser.add_argument("--size_mb", type=int, default=2048, help="Size of the uploaded file")
+    parser.add_argument("--mode", choices=["legacy", "streaming"], help=argparse.SUPPRESS)
+    parser.add_argument("--file_path", help=argparse.SUPPRESS)
+    parser.add_argument("--api_url", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def run_upload(mode: str, file_path: str, api_url: str):
+    from behavioralsignals import Behavioral
+
+    client = Behavioral(1, "key", api_url=api_url)
+    baseline = peak_rss_mb()
+    t0 = time.perf_counter()
+
+    if mode == "legacy":
+        with open(file_path, "rb") as f:
+            client.session.post(
+                f"{api_url}/clients/1/processes/audio",
+                headers=client._get_default_headers(),
+                data={"name": "large.wav", "embeddings": False},
+                files={"file": f},
+            )
+    else:
+        client.upload_audio(file_path=file_path)
+
+    elapsed = time.perf_counter() - t0
+    print(
+        f"{mode:>9} | {elapsed:6.2f}s | peak RSS {peak_rss_mb():8.1f} MB (before upload {baseline:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.mode:
+        run_upload(args.mode, args.file_path, args.api_url)
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as tmp, FakeAPIServer(auth_latency=0) as server:
+        file_path = os.path.join(tmp, "large.wav")
+        with open(file_path, "wb") as f:
+            f.truncate(args.size_mb << 20)
+
+        print(f"Uploading a {args.size_mb} MB file")
+        for mode in ("legacy", "streaming"):
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--mode",
+                    mode,
+                    "--file_path",
+                    file_path,
+                    "--api_url",
+                    server.url,
+                ],
+                check=True,
+            )
@@ -0,0 +1,172 @@
+"""A minimal local stand-in for the Behavioral Signals REST API, used by the benchmarks.
+
+It serves just enough of the API surface for the SDK to work against it and counts the
+TCP connections and requests it receives, so the benchmarks can report connection reuse.
+"""
+
+import json
+import time
+import random
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+TASKS = {
+    "emotion": ["happy", "angry", "neutral", "sad"],
+    "positivity": ["positive", "neutral", "negative"],
+    "strength": ["strong", "neutral", "weak"],
+    "gender": ["male", "female"],
+    "deepfake": ["bonafide", "spoofed"],
+}
+
+
+def make_result(
+    pid: int, n_items: int = 1000, embedding_dim: int = 0, seed: int = 0, speakers: int = 0
+) -> dict:
+    """Builds a realistic result payload with ``n_items`` segment results.
+
+    With ``speakers``, every segment also gets a "diarization" item labelled with one of
+    that many speakers (not counted in ``n_items``).
+    """
+    rng = random.Random(seed)
+    results = []
+    t = 0.0
+    tasks = list(TASKS)
+    for i in range(n_items):
+        task = tasks[i % len(tasks)]
+        if i % len(tasks) == 0:
+            t += rng.uniform(0.5, 4.0)
+            if speakers:
+                speaker = f"SPEAKER_{rng.randrange(speakers):02d}"
+                results.append(
+                    {
+                        "id": str(i // len(tasks)),
+                        "startTime": f"{t:.3f}",
+                        "endTime": f"{t + rng.uniform(0.5, 4.0):.3f}",
+                        "task": "diarization",
+                        "prediction": [{"label": speaker, "posterior": None}],
+                        "finalLabel": speaker,
+                        "level": "segment",
+                    }
+                )
+        labels = TASKS[task]
+        weights = [rng.random() for _ in labels]
+        total = sum(weights)
+        posteriors = [w / total for w in weights]
+        item = {
+            "id": str(i // len(tasks)),
+            "startTime": f"{t:.3f}",
+            "endTime": f"{t + rng.uniform(0.5, 4.0):.3f}",
+            "task": task,
+            "prediction": [
+                {"label": label, "posterior": f"{p:.4f}"} for label, p in zip(labels, posteriors)
+            ],
+            "finalLabel": labels[posteriors.index(max(posteriors))],
+            "level": "segment" if i % 7 else "utterance",
+        }
+        if embedding_dim:
+            item["embedding"] = json.dumps([rng.uniform(-20, 20) for _ in range(embedding_dim)])
+        results.append(item)
+    return {"pid": pid, "cid": 1, "code": 2, "message": "Processing Complete", "results": results}
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.total_requests += 1
+
+        if self.path.endswith("/auth"):
+            with self.server.lock:
+                self.server.auth_requests += 1
+            time.sleep(self.server.auth_latency)
+            self._send_json({"message": "ok"})
+            return
+
+        path = self.path.split("?")[0].rstrip("/")
+        if path.endswith("/processes"):
+            self._send_json([{"pid": pid, "cid": 1, "status": 2} for pid in range(10)])
+            return
+
+        if path.endswith("/results"):
+            pid = int(path.rsplit("/", 2)[-2])
+            body = self.server.result_payloads.get(pid)
+            if body is None:
+                payload = make_result(
+                    pid, self.server.result_items, embedding_dim=self.server.embedding_dim
+                )
+                body = json.dumps(payload).encode()
+                self.server.result_payloads[pid] = body
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        pid = path.rsplit("/", 1)[-1]
+        self._send_json({"pid": int(pid) if pid.isdigit() else 0, "cid": 1, "status": 2})
+
+    def do_POST(self):
+        # Drain the body in fixed-size pieces, so the server itself stays lightweight
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 20)))
+
+        with self.server.lock:
+            self.server.total_requests += 1
+            self.server.next_pid += 1
+            pid = self.server.next_pid
+        self._send_json({"pid": pid, "cid": 1, "status": 0})
+
+
+class FakeAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, auth_latency: float = 0.05, result_items: int = 1000, embedding_dim: int = 0
+    ):
+        super().__init__(("127.0.0.1", 0), FakeAPIHandler)
+        self.auth_latency = auth_latency
+        self.result_items = result_items
+        self.embedding_dim = embedding_dim
+        # Pre-encoded result bodies by pid, so serving them is cheap
+        self.result_payloads = {}
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.connections = 0
+        self.total_requests = 0
+        self.auth_requests = 0
+        self.next_pid = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        return f"http://{host}:{port}/v5"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
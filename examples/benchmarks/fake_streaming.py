@@ -0,0 +1,173 @@
+"""A local stand-in for the Behavioral Signals streaming API, used by the benchmarks.
+
+The servicer answers every audio chunk it receives with one ``StreamResult`` message, so
+benchmarks control the message rate through the audio they send. With ``timeline``, the
+results cover the audio received so far (instead of fixed times), and ``delay`` seconds of
+processing time per chunk simulate a server that can fall behind the audio.
+"""
+
+import os
+import time
+import tempfile
+import threading
+import subprocess
+from concurrent import futures
+
+import grpc
+
+from behavioralsignals.generated import api_pb2 as pb
+from behavioralsignals.generated import api_pb2_grpc as pb_grpc
+
+
+TASKS = {
+    "emotion": ["happy", "angry", "neutral", "sad"],
+    "positivity": ["positive", "neutral", "negative"],
+    "strength": ["strong", "neutral", "weak"],
+    "gender": ["male", "female"],
+}
+
+
+def make_stream_result(message_id: int, n_results: int = 4, embedding_dim: int = 0):
+    """Builds a realistic ``StreamResult`` with ``n_results`` segment results."""
+    tasks = list(TASKS)
+    results = []
+    for i in range(n_results):
+        task = tasks[i % len(tasks)]
+        labels = TASKS[task]
+        result = pb.InferenceResult(
+            id=str(message_id),
+            start_time=f"{message_id * 2.0:.3f}",
+            end_time=f"{message_id * 2.0 + 2.0:.3f}",
+            task=task,
+            prediction=[
+                pb.Prediction(label=label, posterior=f"{1 / len(labels):.4f}") for label in labels
+            ],
+            final_label=labels[0],
+            level=pb.Level.segment,
+        )
+        if embedding_dim:
+            result.embedding = str([0.5] * embedding_dim)
+        results.append(result)
+    return pb.StreamResult(cid=1, pid=1, message_id=message_id, result=results)
+
+
+class FakeStreamingServicer(pb_grpc.BehavioralStreamingApiServicer):
+    def __init__(
+        self,
+        results_per_message: int = 4,
+        embedding_dim: int = 0,
+        timeline: bool = False,
+        delay: float = 0.0,
+    ):
+        self.results_per_message = results_per_message
+        self.embedding_dim = embedding_dim
+        self.timeline = timeline
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.streams = 0
+        self.chunks = 0
+
+    def StreamAudio(self, request_iterator, context):
+        with self.lock:
+            self.streams += 1
+
+        first = next(request_iterator, None)
+        if first is None or not first.HasField("config"):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "First message must hold the config")
+
+        # Serialized once, every answer only differs in its message id
+        template = make_stream_result(0, self.results_per_message, self.embedding_dim)
+        bytes_per_second = 2 * first.config.sample_rate_hertz
+        audio_bytes = 0
+        for message_id, request in enumerate(request_iterator):
+            with self.lock:
+                self.chunks += 1
+            if self.delay:
+                time.sleep(self.delay)
+            template.message_id = message_id
+            if self.timeline:
+                start = audio_bytes / bytes_per_second
+                audio_bytes += len(request.audio_content)
+                end = audio_bytes / bytes_per_second
+                for result in template.result:
+                    result.start_time, result.end_time = f"{start:.3f}", f"{end:.3f}"
+            yield template
+
+    DeepfakeDetection = StreamAudio
+
+
+def make_self_signed_certificate(directory: str) -> tuple[bytes, bytes, str]:
+    """Creates a self-signed certificate for ``localhost`` with the openssl CLI.
+
+    Returns the private key, the certificate and the path of the certificate file.
+    """
+    key_path = os.path.join(directory, "key.pem")
+    cert_path = os.path.join(directory, "cert.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"]
+        + ["-keyout", key_path, "-out", cert_path, "-subj", "/CN=localhost"]
+        + ["-addext", "subjectAltName=DNS:localhost"],
+        check=True,
+        capture_output=True,
+    )
+    with open(key_path, "rb") as key, open(cert_path, "rb") as cert:
+        return key.read(), cert.read(), cert_path
+
+
+class FakeStreamingServer:
+    """Runs a ``FakeStreamingServicer`` on a free local port while used as a context manager.
+
+    With ``tls``, the server uses a self-signed certificate for ``localhost``, which it makes
+    the default gRPC root certificate of this process (clients use ``use_ssl=True``). This
+    must happen before the first TLS channel of the process is created.
+    """
+
+    def __init__(
+        self,
+        results_per_message: int = 4,
+        embedding_dim: int = 0,
+        max_workers: int = 64,
+        tls: bool = False,
+        timeline: bool = False,
+        delay: float = 0.0,
+    ):
+        self.servicer = FakeStreamingServicer(results_per_message, embedding_dim, timeline, delay)
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+        pb_grpc.add_BehavioralStreamingApiServicer_to_server(self.servicer, self.server)
+        self.tls = tls
+        if tls:
+            self._cert_dir = tempfile.TemporaryDirectory()
+            key, cert, cert_path = make_self_signed_certificate(self._cert_dir.name)
+            os.environ["GRPC_DEFAULT_SSL_ROOTS_FILE_PATH"] = cert_path
+            credentials = grpc.ssl_server_credentials([(key, cert)])
+            self.port = self.server.add_secure_port("localhost:0", credentials)
+        else:
+            self.port = self.server.add_insecure_port("127.0.0.1:0")
+
+    @property
+    def address(self) -> str:
+        return f"localhost:{self.port}" if self.tls else f"127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        self.server.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.stop(grace=None)
+        if self.tls:
+            self._cert_dir.cleanup()
+
+
+if __name__ == "__main__":
+    # Serves until killed, for benchmarks that need the servicer in a separate process
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fake streaming API server")
+    parser.add_argument("--results", type=int, default=4, help="Result items per message")
+    parser.add_argument("--max_workers", type=int, default=64, help="Concurrent streams")
+    args = parser.parse_args()
+
+    with FakeStreamingServer(args.results, max_workers=args.max_workers) as server:
+        print(server.address, flush=True)
+        sys.stdin.read()
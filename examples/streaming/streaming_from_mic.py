@@ -62,6 +62,7 @@ def audio_capture(q: Queue):
     def callback(indata, frames, time_info, status):
         if status:
             print(f"⚠️ Audio warning: {status}")
+        # sounddevice reuses its buffer, so the chunk is copied once here
         q.put(indata.copy())
 
     with sd.InputStream(
@@ -85,7 +86,8 @@ def audio_stream_from_queue(q: Queue):
         chunk = q.get()
         if chunk is None:
             break
-        yield chunk.tobytes()
+        # Numpy arrays are sent as they are, without another copy to bytes
+        yield chunk
 
 
 def parse_args():
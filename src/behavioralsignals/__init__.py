@@ -1,7 +1,87 @@
+import importlib
+from typing import TYPE_CHECKING
+
+from .cache import (
+    ResultCache,
+    DiskResultCache,
+    MemoryResultCache,
+    TieredResultCache,
+    default_result_cache,
+)
+from .retry import RetryPolicy
 from .client import Client
-from .models import StreamingOptions
+from .export import JSONLSink, ResultSink, ParquetSink
+from .models import StreamingOptions, TranscodeOptions
+from .metrics import Histogram, StreamMetrics
+from .aggregate import ResultAggregates, aggregate_results
 from .deepfakes import Deepfakes
 from .behavioral import Behavioral
+from .exceptions import (
+    RateLimitError,
+    TranscodeError,
+    APIRequestError,
+    CircuitOpenError,
+    PermanentAPIError,
+    TransientAPIError,
+    APIConnectionError,
+    AuthenticationError,
+    BehavioralSignalsError,
+)
+
+
+if TYPE_CHECKING:
+    from .manager import StreamEvent, StreamManager
+    from .async_client import AsyncClient, AsyncDeepfakes, AsyncBehavioral
+
+__all__ = [
+    "APIConnectionError",
+    "APIRequestError",
+    "AsyncBehavioral",
+    "AsyncClient",
+    "AsyncDeepfakes",
+    "AuthenticationError",
+    "Behavioral",
+    "BehavioralSignalsError",
+    "CircuitOpenError",
+    "Client",
+    "Deepfakes",
+    "DiskResultCache",
+    "Histogram",
+    "JSONLSink",
+    "MemoryResultCache",
+    "ParquetSink",
+    "PermanentAPIError",
+    "RateLimitError",
+    "ResultAggregates",
+    "ResultCache",
+    "ResultSink",
+    "RetryPolicy",
+    "StreamEvent",
+    "StreamManager",
+    "StreamMetrics",
+    "StreamingOptions",
+    "TieredResultCache",
+    "TranscodeError",
+    "TranscodeOptions",
+    "TransientAPIError",
+    "aggregate_results",
+    "default_result_cache",
+]
+
+# The asyncio client and stream manager (and asyncio itself) are only imported when first accessed
+_lazy_imports = {
+    "AsyncClient": ".async_client",
+    "AsyncBehavioral": ".async_client",
+    "AsyncDeepfakes": ".async_client",
+    "StreamManager": ".manager",
+    "StreamEvent": ".manager",
+}
 
 
-__all__ = ["Client", "Behavioral", "Deepfakes", "StreamingOptions"]
+def __getattr__(name):
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,357 @@
+from typing import TYPE_CHECKING, Any, List, Tuple, Iterable, Optional
+
+from pydantic import Field, BaseModel, ConfigDict
+
+from .models import ResultResponse, _import_numpy, _import_pyarrow
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+
+# Tasks whose final labels are not categories (transcripts, speakers, feature vectors)
+UNAGGREGATED_TASKS = ("asr", "diarization", "features")
+# Seconds of an item left without a speaker below which they are rounding errors
+_MIN_DURATION = 1e-6
+
+
+class ResultAggregates(BaseModel):
+    """Compact table of duration-weighted summaries, built by ``aggregate_results``.
+
+    There is one row per recording, (speaker,) and task. Categorical columns hold int32 codes
+    into their category list (-1 when missing), like ``ResultColumns``. ``label_fraction``
+    holds the fraction of the row's duration with each final label, NaN for labels of other
+    tasks, and ``posterior`` the duration-weighted mean posterior of each class, NaN when
+    the class is not predicted. All arrays are read-only.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    pid: Any = Field(..., description="int64 pid of each row's result, -1 if it has none")
+    speakers: List[str] = Field(..., description="Categories of the speaker column")
+    tasks: List[str] = Field(..., description="Categories of the task column")
+    labels: List[str] = Field(..., description="Final labels, the label_fraction columns")
+    classes: List[str] = Field(..., description="Predicted classes, the posterior columns")
+    speaker: Any = Field(..., description="int32 codes into speakers")
+    task: Any = Field(..., description="int32 codes into tasks")
+    dominant_label: Any = Field(..., description="int32 codes into labels of the longest label")
+    dominant_fraction: Any = Field(..., description="float32 fraction of the dominant label")
+    duration: Any = Field(..., description="float64 total duration of the items in seconds")
+    segments: Any = Field(..., description="int64 number of aggregated items")
+    label_fraction: Any = Field(..., description="float32 (n, len(labels)) duration fractions")
+    posterior: Any = Field(..., description="float32 (n, len(classes)) mean posteriors")
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def mask(
+        self,
+        task: Optional[str] = None,
+        speaker: Optional[str] = None,
+        pid: Optional[int] = None,
+    ) -> "np.ndarray":
+        """Returns a boolean mask of the rows matching all the given values.
+
+        Args:
+            task (str, optional): Keep rows of this task, e.g. "emotion".
+            speaker (str, optional): Keep rows of this speaker label, e.g. "SPEAKER_00".
+            pid (int, optional): Keep rows of this process.
+        Returns:
+            np.ndarray: Boolean array of length ``len(self)``.
+        """
+        np = _import_numpy()
+        mask = np.ones(len(self), dtype=bool)
+        for codes, categories, value in (
+            (self.task, self.tasks, task),
+            (self.speaker, self.speakers, speaker),
+        ):
+            if value is not None:
+                mask &= codes == (categories.index(value) if value in categories else -2)
+        if pid is not None:
+            mask &= self.pid == pid
+        return mask
+
+    def fraction(self, label: str) -> "np.ndarray":
+        """Returns the fraction of each row's duration with final label ``label``."""
+        np = _import_numpy()
+        if label not in self.labels:
+            return np.full(len(self), np.nan, dtype=np.float32)
+        return self.label_fraction[:, self.labels.index(label)]
+
+    def mean_posterior(self, label: str) -> "np.ndarray":
+        """Returns the duration-weighted mean posterior of class ``label`` of each row."""
+        np = _import_numpy()
+        if label not in self.classes:
+            return np.full(len(self), np.nan, dtype=np.float32)
+        return self.posterior[:, self.classes.index(label)]
+
+    def to_arrow(self) -> "pa.Table":
+        """Converts the table to a ``pyarrow.Table`` with dictionary-encoded categories and
+        nullable ``fraction_<label>`` and ``posterior_<class>`` columns. Requires pyarrow."""
+        pa = _import_pyarrow()
+        np = _import_numpy()
+
+        def _dictionary(codes, categories):
+            return pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), pa.array(categories, type=pa.string())
+            )
+
+        columns = {
+            "pid": pa.array(self.pid),
+            "speaker": _dictionary(self.speaker, self.speakers),
+            "task": _dictionary(self.task, self.tasks),
+            "dominant_label": _dictionary(self.dominant_label, self.labels),
+            "dominant_fraction": pa.array(self.dominant_fraction),
+            "duration": pa.array(self.duration),
+            "segments": pa.array(self.segments),
+        }
+        for prefix, names, matrix in (
+            ("fraction", self.labels, self.label_fraction),
+            ("posterior", self.classes, self.posterior),
+        ):
+            for i, name in enumerate(names):
+                column = matrix[:, i]
+                columns[f"{prefix}_{name}"] = pa.array(column, mask=np.isnan(column))
+        return pa.table(columns)
+
+
+def _code_map(categories: dict, names: List[str], used: Optional["np.ndarray"] = None):
+    """Maps local category codes to codes into ``categories``, adding the missing names.
+
+    The returned array has an extra trailing -1, so indexing it with a code of -1 keeps it
+    missing. With ``used``, only those local codes are mapped (the rest map to -1).
+    """
+    np = _import_numpy()
+    mapping = np.full(len(names) + 1, -1, dtype=np.int32)
+    for code in range(len(names)) if used is None else used:
+        mapping[code] = categories.setdefault(names[code], len(categories))
+    return mapping
+
+
+def _union(
+    start: "np.ndarray", end: "np.ndarray", group: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Merges the overlapping intervals of each group into disjoint ``(start, end, group)``
+    intervals, sorted by group and start time."""
+    np = _import_numpy()
+    order = np.lexsort((start, group))
+    start, end, group = start[order], end[order], group[order]
+    if not len(start):
+        return start, end, group
+
+    # Running maximum of the end times within each group, offset so that groups never mix
+    offset = (np.max(end) - np.min(start) + 1) * (group - group.min())
+    reach = np.maximum.accumulate(end + offset) - offset
+    first = np.ones(len(start), dtype=bool)
+    first[1:] = (group[1:] != group[:-1]) | (start[1:] > reach[:-1])
+    runs = np.flatnonzero(first)
+    return start[runs], np.maximum.reduceat(end, runs), group[runs]
+
+
+def _split_by_speaker(
+    result: ResultResponse, rows: "np.ndarray", speaker_task: str
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Splits each of ``rows`` at the boundaries of the ``speaker_task`` items it overlaps.
+
+    Returns:
+        tuple: ``(item, speaker, duration)`` arrays with one piece per item and speaker, in
+        item order: the index into ``rows``, the local final label code of the speaker and
+        the seconds of the item they share. The time of an item that no speaker item
+        covers is a piece of its own, with speaker -1.
+    """
+    from .intervals import IntervalIndex
+
+    np = _import_numpy()
+    columns = result.to_columns()
+    start, end = columns.start[rows], columns.end[rows]
+    items = IntervalIndex(start, end, np.arange(len(rows)))
+
+    turns = np.flatnonzero(columns.mask(task=speaker_task))
+    turns = turns[~(np.isnan(columns.start[turns]) | np.isnan(columns.end[turns]))]
+    turn_start, turn_end = columns.start[turns], columns.end[turns]
+    # Overlapping turns of one speaker count once, and speech overlapping between speakers
+    # counts for each of them
+    speaker_start, speaker_end, speaker = _union(turn_start, turn_end, columns.final_label[turns])
+    left, right, overlap = items.join(
+        IntervalIndex(speaker_start, speaker_end, np.arange(len(speaker)))
+    )
+    covered_start, covered_end, _ = _union(turn_start, turn_end, np.zeros(len(turns)))
+    covered_left, _, covered = items.join(
+        IntervalIndex(covered_start, covered_end, np.arange(len(covered_start)))
+    )
+
+    rest = (end - start) - np.bincount(covered_left, weights=covered, minlength=len(rows))
+    uncovered = np.flatnonzero(rest > _MIN_DURATION)
+    item = np.concatenate([left, uncovered])
+    speaker = np.concatenate([speaker[right], np.full(len(uncovered), -1, dtype=np.int32)])
+    duration = np.concatenate([overlap, rest[uncovered]])
+
+    # Pieces of the same item and speaker (e.g. overlapping two of its turns) are merged
+    n_speakers = len(columns.labels) + 1
+    keys, piece = np.unique(item.astype(np.int64) * n_speakers + speaker + 1, return_inverse=True)
+    duration = np.bincount(piece.reshape(-1), weights=duration, minlength=len(keys))
+    return keys // n_speakers, (keys % n_speakers - 1).astype(np.int32), duration
+
+
+def aggregate_results(
+    results: Iterable[ResultResponse],
+    tasks: Optional[List[str]] = None,
+    level: Optional[str] = "segment",
+    by_speaker: bool = True,
+    speaker_task: str = "diarization",
+) -> ResultAggregates:
+    """Summarizes many results per recording (and speaker) and task with vectorized operations.
+
+    The items of every result are read through its cached ``to_columns`` view, filtered to
+    the requested tasks and level, and concatenated; items are then weighted by their
+    duration and reduced per group in a few array operations, so there is no Python loop
+    per item. With ``by_speaker``, each item is split at the boundaries of the
+    ``speaker_task`` items it overlaps (see ``ResultResponse.interval_join``), and every
+    speaker gets the part of its duration they share: an item spanning a change of speaker
+    counts for both, weighted by its time with each, and time where speakers talk over each
+    other counts for each of them.
+
+    For example, ``fraction("spoofed")`` of the "deepfake" rows is the fraction of speech
+    flagged as deepfake and ``dominant_label`` of the "emotion" rows the time-weighted
+    dominant emotion of each speaker. Requires numpy.
+
+    Args:
+        results (Iterable[ResultResponse]): The results to aggregate.
+        tasks (List[str], optional): Tasks to aggregate. Defaults to every task except
+            those without categorical labels (asr, diarization, features).
+        level (str, optional): Only aggregate items of this level ("segment"/"utterance"),
+            so that overlapping levels are not counted twice. Defaults to "segment"; None
+            aggregates all items.
+        by_speaker (bool): Aggregate per speaker instead of per recording. Items of results
+            without ``speaker_task`` items, and the parts of items overlapping none, get no
+            speaker (-1). Defaults to True.
+        speaker_task (str): The task whose final labels are the speakers.
+            Defaults to "diarization".
+    Returns:
+        ResultAggregates: One row per result, (speaker,) and task.
+    """
+    np = _import_numpy()
+    task_names, speaker_names, label_names, class_names = {}, {}, {}, {}
+    pids, parts = [], []
+
+    for index, result in enumerate(results):
+        pids.append(result.pid if result.pid is not None else -1)
+        columns = result.to_columns()
+        keep = np.zeros(len(columns), dtype=bool)
+        for task in columns.tasks:
+            wanted = task in tasks if tasks is not None else task not in UNAGGREGATED_TASKS
+            if wanted:
+                keep |= columns.mask(task=task, level=level)
+        # NaN durations (missing times) compare False and are dropped as well
+        duration = columns.end - columns.start
+        rows = np.flatnonzero(keep & (duration > 0))
+        if not len(rows):
+            continue
+
+        duration = duration[rows]
+        speaker = np.full(len(rows), -1, dtype=np.int32)
+        if by_speaker and speaker_task in columns.tasks:
+            item, local, duration = _split_by_speaker(result, rows, speaker_task)
+            rows = rows[item]
+            used = np.unique(local[local >= 0])
+            speaker = _code_map(speaker_names, columns.labels, used)[local]
+
+        # Only categories of the kept rows are added, e.g. not the asr transcripts
+        task, label = columns.task[rows], columns.final_label[rows]
+        posterior = columns.posterior[rows]
+        used_classes = np.flatnonzero(~np.isnan(posterior).all(axis=0))
+        parts.append(
+            (
+                np.full(len(rows), index, dtype=np.int64),
+                _code_map(task_names, columns.tasks, np.unique(task))[task],
+                speaker,
+                _code_map(label_names, columns.labels, np.unique(label[label >= 0]))[label],
+                duration,
+                posterior[:, used_classes],
+                _code_map(class_names, columns.classes, used_classes)[used_classes],
+            )
+        )
+
+    n_labels, n_classes = len(label_names), len(class_names)
+    if parts:
+        result_index, task, speaker, label, duration = (
+            np.concatenate([part[i] for part in parts]) for i in range(5)
+        )
+    else:
+        result_index = np.zeros(0, dtype=np.int64)
+        task = speaker = label = np.zeros(0, dtype=np.int32)
+        duration = np.zeros(0, dtype=np.float64)
+
+    posterior = np.full((len(duration), n_classes), np.nan, dtype=np.float32)
+    offset = 0
+    for *_, local, class_codes in parts:
+        posterior[offset : offset + len(local), class_codes] = local
+        offset += len(local)
+
+    # One integer key per (result, speaker, task) group; speaker codes start at -1
+    n_tasks, n_speakers = max(len(task_names), 1), len(speaker_names) + 1
+    key = (result_index * n_speakers + speaker + 1) * n_tasks + task
+    groups, group = np.unique(key, return_inverse=True)
+    group = group.reshape(-1)
+    n_groups = len(groups)
+
+    group_task = (groups % n_tasks).astype(np.int32)
+    group_speaker = ((groups // n_tasks) % n_speakers - 1).astype(np.int32)
+    group_result = groups // n_tasks // n_speakers
+    group_duration = np.bincount(group, weights=duration, minlength=n_groups)
+    segments = np.bincount(group, minlength=n_groups)
+
+    labelled = label >= 0
+    label_duration = np.bincount(
+        group[labelled] * n_labels + label[labelled],
+        weights=duration[labelled],
+        minlength=n_groups * n_labels,
+    ).reshape(n_groups, n_labels)
+    label_fraction = (label_duration / group_duration[:, None]).astype(np.float32)
+    # Labels that never occur with a task are not applicable to its rows
+    task_labels = np.zeros((n_tasks, n_labels), dtype=bool)
+    task_labels[task[labelled], label[labelled]] = True
+    label_fraction[~task_labels[group_task]] = np.nan
+
+    if n_labels:
+        dominant_label = label_duration.argmax(axis=1).astype(np.int32)
+        dominant_fraction = label_fraction[np.arange(n_groups), dominant_label]
+        dominant_label[label_duration.max(axis=1) == 0] = -1
+        dominant_fraction[dominant_label < 0] = np.nan
+    else:
+        dominant_label = np.full(n_groups, -1, dtype=np.int32)
+        dominant_fraction = np.full(n_groups, np.nan, dtype=np.float32)
+
+    # Duration-weighted means over the predicted (non-NaN) posteriors of each group
+    predicted = ~np.isnan(posterior)
+    weighted = np.where(predicted, posterior * duration[:, None], 0)
+    weights = predicted * duration[:, None]
+    order = np.argsort(group, kind="stable")
+    starts = np.flatnonzero(np.r_[True, group[order][1:] != group[order][:-1]])
+    if len(order):
+        weighted = np.add.reduceat(weighted[order], starts, axis=0)
+        weights = np.add.reduceat(weights[order], starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_posterior = np.where(weights > 0, weighted / weights, np.nan).astype(np.float32)
+
+    columns = {
+        "pid": np.array(pids, dtype=np.int64)[group_result],
+        "speaker": group_speaker,
+        "task": group_task,
+        "dominant_label": dominant_label,
+        "dominant_fraction": dominant_fraction.astype(np.float32),
+        "duration": group_duration,
+        "segments": segments.astype(np.int64),
+        "label_fraction": label_fraction,
+        "posterior": mean_posterior,
+    }
+    for array in columns.values():
+        array.flags.writeable = False
+    return ResultAggregates(
+        speakers=list(speaker_names),
+        tasks=list(task_names),
+        labels=list(label_names),
+        classes=list(class_names),
+        **columns,
+    )
@@ -0,0 +1,600 @@
+import asyncio
+from typing import TYPE_CHECKING, Union, Literal, Iterable, Optional, AsyncIterable, AsyncIterator
+from pathlib import Path
+
+from .base import BaseClient, _result_completed
+from .retry import rewind, file_positions
+from .models import (
+    ProcessItem,
+    ResultResponse,
+    StreamingOptions,
+    AudioUploadParams,
+    ProcessListParams,
+    S3UrlUploadParams,
+    ProcessListResponse,
+    StreamingResultResponse,
+    DeepfakeAudioUploadParams,
+    DeepfakeS3UrlUploadParams,
+)
+from .framing import AudioChunk, AudioFramer, method_path
+from .metrics import StreamMetrics
+from .multipart import MultipartEncoder
+from .transport import AsyncTransport
+from .exceptions import APIRequestError, APIConnectionError
+from .configuration import Configuration
+
+
+if TYPE_CHECKING:
+    import grpc.aio
+
+    from .generated import api_pb2 as pb
+
+AudioSource = Union[Iterable[AudioChunk], AsyncIterable[AudioChunk]]
+
+
+async def _stream_results(
+    channel: "grpc.aio.Channel",
+    config: Configuration,
+    rpc_name: str,
+    audio_stream: AudioSource,
+    options: StreamingOptions,
+    raw: bool,
+    metrics: Optional[StreamMetrics] = None,
+) -> AsyncIterator[Union[StreamingResultResponse, "pb.StreamResult"]]:
+    """Runs one stream of ``rpc_name`` on ``channel``, yielding its results as they arrive."""
+    from .generated import api_pb2 as pb
+
+    # Messages are serialized by the framer, see ``BaseClient._stream``
+    framer = AudioFramer(int(config.cid), config.api_key, options)
+    messages = framer.amessages(audio_stream)
+    timer = None
+    if metrics is not None:
+        timer = metrics._start_stream(options.sample_rate)
+        messages = timer.atrack(framer, messages)
+    call = channel.stream_stream(
+        method_path(rpc_name),
+        request_serializer=None,
+        response_deserializer=pb.StreamResult.FromString,
+    )(messages)
+    try:
+        async for response in call:
+            if timer is not None:
+                timer.received(response)
+            yield response if raw else StreamingResultResponse.from_pb(response)
+    finally:
+        # The shared channel outlives the stream, see ``BaseClient._stream``
+        call.cancel()
+
+
+class AsyncBaseClient:
+    """asyncio counterpart of ``BaseClient``.
+
+    Requests go through a shared ``httpx.AsyncClient`` and streaming uses ``grpc.aio``,
+    so many uploads, polls and live streams can run concurrently on one event loop.
+    Authentication happens on the first request, or when entering ``async with``.
+    """
+
+    def __init__(
+        self,
+        cid: str,
+        api_key: str,
+        transport: Optional[AsyncTransport] = None,
+        **config_options,
+    ):
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = AsyncTransport(Configuration(cid=cid, api_key=api_key, **config_options))
+
+        self.transport = transport
+        self.config = transport.config
+        self.session = transport.session
+
+    _get_default_headers = BaseClient._get_default_headers
+    _handle_response = BaseClient._handle_response
+
+    async def _authenticate(self):
+        await self.transport.ensure_authenticated(self._send_auth_request)
+
+    async def _send_auth_request(self):
+        headers = {"X-Auth-Client": self.config.cid}
+        return await self._request(path="auth", method="GET", headers=headers)
+
+    async def _send_request(
+        self,
+        path: str,
+        method: str = "GET",
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        files: Optional[dict] = None,
+        raw: bool = False,
+    ):
+        await self._authenticate()
+        return await self._request(
+            path=path, method=method, data=data, json=json, headers=headers, files=files, raw=raw
+        )
+
+    async def _request(
+        self,
+        path: str,
+        method: str = "GET",
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        files: Optional[dict] = None,
+        raw: bool = False,
+    ):
+        url = self.config.api_url + "/" + path
+        if headers is None:
+            headers = self._get_default_headers()
+        else:
+            headers = {**self._get_default_headers(), **headers}
+
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported method: {method}")
+        if method == "POST" and isinstance(data, dict):
+            # Form fields are sent the way ``requests`` encodes them, e.g. "True"/"False"
+            data = {k: str(v) for k, v in data.items()}
+
+        breaker = self.transport.circuit_breaker
+        positions = file_positions(files)
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+
+            try:
+                response = await self._perform(method, url, headers, data, json, files)
+                result = self._handle_response(response, raw=raw)
+            except APIRequestError as e:
+                if breaker is not None:
+                    if e.transient:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
+                delay = self.config.retry.get_delay(attempt, method, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                rewind(positions)
+                attempt += 1
+                continue
+            except BaseException:
+                # Neither a success nor an API failure, which must not leave a trial request
+                # of the circuit breaker in flight forever
+                if breaker is not None:
+                    breaker.release_trial()
+                raise
+
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+    async def _perform(self, method, url, headers, data, json, files):
+        import httpx
+
+        try:
+            if method == "GET":
+                return await self.session.get(url, headers=headers, params=data)
+            if isinstance(data, MultipartEncoder):
+                # Streamed from a worker thread (see ``MultipartEncoder.__aiter__``), from the
+                # start of the file on every attempt
+                headers = {**headers, "content-length": str(len(data))}
+                return await self.session.post(url, headers=headers, content=aiter(data))
+            return await self.session.post(url, headers=headers, data=data, files=files, json=json)
+        except httpx.TransportError as e:
+            connect_failed = isinstance(
+                e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+            )
+            raise APIConnectionError(str(e), retry_safe=connect_failed) from e
+        except httpx.DecodingError as e:
+            raise APIConnectionError(f"Could not decode the response: {e}") from e
+        except httpx.RequestError as e:
+            # e.g. too many redirects or an invalid url, which repeating will not fix
+            raise APIRequestError(str(e)) from e
+
+    async def close(self):
+        """Close the session, unless it is shared with other clients."""
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self):
+        if not self.config.lazy_auth:
+            await self._authenticate()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def connect_streaming(self, timeout: Optional[float] = None) -> None:
+        """Opens the shared streaming channels ahead of the first stream, see
+        ``BaseClient.connect_streaming``."""
+        await self.transport.connect_streaming(timeout=timeout)
+
+    async def _get_result(self, path: str, pid: int) -> ResultResponse:
+        """Fetches a result, serving it from ``Configuration.result_cache`` when possible,
+        see ``BaseClient._get_result``. Cache lookups (possibly on disk) run on a thread."""
+        cache = self.config.result_cache
+        if cache is not None:
+            result = await asyncio.to_thread(cache.get, path)
+            if result is not None:
+                return result
+
+        content = await self._send_request(path=path, method="GET", raw=True)
+        result = ResultResponse.model_validate_json(content)
+
+        if cache is not None:
+            completed = _result_completed(result)
+            if completed is None:
+                completed = (await self.get_process(pid=pid)).is_completed
+            if completed:
+                await asyncio.to_thread(cache.set, path, result)
+        return result
+
+    def _stream(
+        self,
+        rpc_name: str,
+        audio_stream: AudioSource,
+        options: StreamingOptions,
+        raw: bool,
+        metrics: Optional[StreamMetrics] = None,
+    ) -> AsyncIterator[Union[StreamingResultResponse, "pb.StreamResult"]]:
+        channel = self.transport.streaming_channel()
+        return _stream_results(
+            channel, self.config, rpc_name, audio_stream, options, raw, metrics=metrics
+        )
+
+
+class AsyncBehavioral(AsyncBaseClient):
+    async def upload_audio(
+        self,
+        file_path: str,
+        name: Optional[str] = None,
+        embeddings: bool = False,
+        meta: Optional[str] = None,
+    ) -> ProcessItem:
+        """Uploads an audio file for processing and returns the process item.
+
+        Args:
+            file_path (str): Path to the audio file to upload.
+            name (str, optional): Optional name for the job request. Defaults to filename.
+            embeddings (bool): Whether to include speaker and behavioral embeddings. Defaults to False.
+            meta (str, optional): Metadata json containing any extra user-defined metadata.
+        Returns:
+            ProcessItem: The process item containing details about the submitted process.
+        """
+        params = AudioUploadParams(file_path=file_path, name=name, embeddings=embeddings, meta=meta)
+        job_name = params.name or Path(params.file_path).name
+
+        fields = {"name": job_name, "embeddings": params.embeddings}
+        if params.meta:
+            fields["meta"] = params.meta
+
+        body = MultipartEncoder(fields=fields, file_field="file", file_path=params.file_path)
+        data = await self._send_request(
+            path=f"clients/{self.config.cid}/processes/audio",
+            method="POST",
+            data=body,
+            headers={"content-type": body.content_type},
+        )
+
+        return ProcessItem(**data)
+
+    async def upload_s3_presigned_url(
+        self,
+        url: str,
+        name: Optional[str] = None,
+        embeddings: bool = False,
+        meta: Optional[str] = None,
+    ) -> ProcessItem:
+        """Uploads an S3 presigned url pointing to an audio file and returns the process item.
+
+        Args:
+            url (str): The S3 presigned url.
+            name (str, optional): Optional name for the job request. Defaults to filename.
+            embeddings (bool): Whether to include speaker and behavioral embeddings. Defaults to False.
+            meta (str, optional): Metadata json containing any extra user-defined metadata.
+        Returns:
+            ProcessItem: The process item containing details about the submitted process.
+        """
+        params = S3UrlUploadParams(url=url, name=name, embeddings=embeddings, meta=meta)
+
+        payload = {"url": params.url, "name": params.name, "embeddings": params.embeddings}
+        if params.meta:
+            payload["meta"] = params.meta
+
+        response = await self._send_request(
+            path=f"clients/{self.config.cid}/processes/s3-presigned-url",
+            method="POST",
+            json=payload,
+            headers={"content-type": "application/json"},
+        )
+
+        return ProcessItem(**response)
+
+    async def list_processes(
+        self,
+        page: int = 0,
+        page_size: int = 1000,
+        sort: Literal["asc", "desc"] = "asc",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> ProcessListResponse:
+        """Lists all processes for the authenticated user.
+
+        Args:
+            page (int): Page number for pagination (default is 0).
+            page_size (int): Number of processes per page (default is 1000).
+            sort (str): Sort order for the processes, should be "asc" or "desc". Defaults to "asc".
+            start_date (str, optional): Filter processes created on or after this date (YYYY-MM-DD).
+            end_date (str, optional): Filter processes created on or before this date (YYYY-MM-DD).
+        Returns:
+            ProcessListResponse: A list of processes associated with the user.
+        """
+        query_params = ProcessListParams(
+            page=page, page_size=page_size, sort=sort, start_date=start_date, end_date=end_date
+        )
+        query_params = query_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+        data = await self._send_request(
+            path=f"clients/{self.config.cid}/processes",
+            method="GET",
+            data=query_params,
+        )
+
+        return ProcessListResponse(processes=data)
+
+    async def get_process(self, pid: int) -> ProcessItem:
+        """Retrieves details of a specific process by its ID.
+
+        Args:
+            pid (int): The process ID to retrieve.
+        Returns:
+            ProcessItem: The process item containing details about the specified process.
+        """
+        data = await self._send_request(
+            path=f"clients/{self.config.cid}/processes/{pid}",
+            method="GET",
+        )
+
+        return ProcessItem(**data)
+
+    async def get_result(self, pid: int) -> ResultResponse:
+        """Retrieves the result of a completed process by its ID.
+
+        If the client has a ``result_cache``, completed results are served from it without
+        touching the network (see ``Behavioral.get_result``).
+
+        Args:
+            pid (int): The process ID for which to retrieve the result
+        Returns:
+            ResultResponse: The result response containing the results of the specified process.
+        """
+        return await self._get_result(
+            path=f"clients/{self.config.cid}/processes/{pid}/results", pid=pid
+        )
+
+    def stream_audio(
+        self,
+        audio_stream: AudioSource,
+        options: StreamingOptions,
+        raw: bool = False,
+        metrics: Optional[StreamMetrics] = None,
+    ) -> AsyncIterator[Union[StreamingResultResponse, "pb.StreamResult"]]:
+        """Streams audio to the behavioral streaming API and yields results as they arrive.
+
+        Args:
+            audio_stream: An iterator or async iterator of raw audio chunks (bytes or any
+                buffer, see ``Behavioral.stream_audio``).
+            options (StreamingOptions): The audio configuration of the stream.
+            raw (bool): Yield the received ``pb.StreamResult`` protobuf messages as they are,
+                skipping the conversion to models. Defaults to False.
+            metrics (StreamMetrics, optional): Records the latencies of the stream, see
+                ``Behavioral.stream_audio``.
+        Returns:
+            AsyncIterator[StreamingResultResponse]: The streaming results.
+        """
+        return self._stream("StreamAudio", audio_stream, options, raw=raw, metrics=metrics)
+
+
+class AsyncDeepfakes(AsyncBaseClient):
+    async def upload_audio(
+        self,
+        file_path: str,
+        name: Optional[str] = None,
+        embeddings: bool = False,
+        enable_generator_detection: bool = False,
+        meta: Optional[str] = None,
+    ) -> ProcessItem:
+        """Uploads an audio file for processing and returns the process item.
+
+        Args:
+            file_path (str): Path to the audio file to upload.
+            name (str, optional): Optional name for the job request. Defaults to filename.
+            embeddings (bool): Whether to include speaker embeddings. Defaults to False.
+            enable_generator_detection (bool): Whether to include prediction for the source of the deepfake (generator model). Defaults to False.
+            meta (str, optional): Metadata json containing any extra user-defined metadata.
+        Returns:
+            ProcessItem: The process item containing details about the submitted process.
+        """
+        params = DeepfakeAudioUploadParams(
+            file_path=file_path,
+            name=name,
+            embeddings=embeddings,
+            meta=meta,
+            enable_generator_detection=enable_generator_detection,
+        )
+        job_name = params.name or Path(params.file_path).name
+
+        fields = {
+            "name": job_name,
+            "embeddings": params.embeddings,
+            "enable_generator_detection": params.enable_generator_detection,
+        }
+        if params.meta:
+            fields["meta"] = params.meta
+
+        body = MultipartEncoder(fields=fields, file_field="file", file_path=params.file_path)
+        data = await self._send_request(
+            path=f"detection/clients/{self.config.cid}/processes/audio",
+            method="POST",
+            data=body,
+            headers={"content-type": body.content_type},
+        )
+
+        return ProcessItem(**data)
+
+    async def upload_s3_presigned_url(
+        self,
+        url: str,
+        name: Optional[str] = None,
+        embeddings: bool = False,
+        enable_generator_detection: bool = False,
+        meta: Optional[str] = None,
+    ) -> ProcessItem:
+        """Uploads an S3 presigned url pointing to an audio file and returns the process item.
+
+        Args:
+            url (str): The S3 presigned url.
+            name (str, optional): Optional name for the job request. Defaults to filename.
+            embeddings (bool): Whether to include speaker embeddings. Defaults to False.
+            enable_generator_detection (bool): Whether to include prediction for the source of the deepfake (generator model). Defaults to False.
+            meta (str, optional): Metadata json containing any extra user-defined metadata.
+        Returns:
+            ProcessItem: The process item containing details about the submitted process.
+        """
+        params = DeepfakeS3UrlUploadParams(
+            url=url,
+            name=name,
+            embeddings=embeddings,
+            meta=meta,
+            enable_generator_detection=enable_generator_detection,
+        )
+
+        payload = {
+            "url": params.url,
+            "name": params.name,
+            "embeddings": params.embeddings,
+            "enable_generator_detection": params.enable_generator_detection,
+        }
+        if params.meta:
+            payload["meta"] = params.meta
+
+        response = await self._send_request(
+            path=f"detection/clients/{self.config.cid}/processes/s3-presigned-url",
+            method="POST",
+            json=payload,
+            headers={"content-type": "application/json"},
+        )
+
+        return ProcessItem(**response)
+
+    async def list_processes(
+        self,
+        page: int = 0,
+        page_size: int = 1000,
+        sort: Literal["asc", "desc"] = "asc",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> ProcessListResponse:
+        """Lists all processes for the authenticated user.
+
+        Args:
+            page (int): Page number for pagination (default is 0).
+            page_size (int): Number of processes per page (default is 1000).
+            sort (str): Sort order for the processes, should be "asc" or "desc". Defaults to "asc".
+            start_date (str, optional): Filter processes created on or after this date (YYYY-MM-DD).
+            end_date (str, optional): Filter processes created on or before this date (YYYY-MM-DD).
+        Returns:
+            ProcessListResponse: A list of processes associated with the user.
+        """
+        query_params = ProcessListParams(
+            page=page, page_size=page_size, sort=sort, start_date=start_date, end_date=end_date
+        )
+        query_params = query_params.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+        data = await self._send_request(
+            path=f"detection/clients/{self.config.cid}/processes",
+            method="GET",
+            data=query_params,
+        )
+
+        return ProcessListResponse(processes=data)
+
+    async def get_process(self, pid: int) -> ProcessItem:
+        """Retrieves details of a specific process by its ID.
+
+        Args:
+            pid (int): The process ID to retrieve.
+        Returns:
+            ProcessItem: The process item containing details about the specified process.
+        """
+        data = await self._send_request(
+            path=f"detection/clients/{self.config.cid}/processes/{pid}",
+            method="GET",
+        )
+
+        return ProcessItem(**data)
+
+    async def get_result(self, pid: int) -> ResultResponse:
+        """Retrieves the result of a completed process by its ID.
+
+        If the client has a ``result_cache``, completed results are served from it without
+        touching the network (see ``Behavioral.get_result``).
+
+        Args:
+            pid (int): The process ID for which to retrieve the result
+        Returns:
+            ResultResponse: The result response containing the results of the specified process.
+        """
+        return await self._get_result(
+            path=f"detection/clients/{self.config.cid}/processes/{pid}/results", pid=pid
+        )
+
+    def stream_audio(
+        self,
+        audio_stream: AudioSource,
+        options: StreamingOptions,
+        raw: bool = False,
+        metrics: Optional[StreamMetrics] = None,
+    ) -> AsyncIterator[Union[StreamingResultResponse, "pb.StreamResult"]]:
+        """Streams audio to the deepfake detection streaming API and yields results as they arrive.
+
+        Args:
+            audio_stream: An iterator or async iterator of raw audio chunks (bytes or any
+                buffer, see ``Behavioral.stream_audio``).
+            options (StreamingOptions): The audio configuration of the stream.
+            raw (bool): Yield the received ``pb.StreamResult`` protobuf messages as they are,
+                skipping the conversion to models. Defaults to False.
+            metrics (StreamMetrics, optional): Records the latencies of the stream, see
+                ``Behavioral.stream_audio``.
+        Returns:
+            AsyncIterator[StreamingResultResponse]: The streaming results.
+        """
+        return self._stream("DeepfakeDetection", audio_stream, options, raw=raw, metrics=metrics)
+
+
+async_client_map = {
+    "behavioral": AsyncBehavioral,
+    "deepfakes": AsyncDeepfakes,
+}
+
+
+class AsyncClient(AsyncBaseClient):
+    """asyncio entry point of the SDK, mirroring ``Client``.
+
+    Example:
+        async with AsyncClient(cid, api_key) as client:
+            process = await client.behavioral.upload_audio(file_path="audio.wav")
+    """
+
+    def __getattr__(self, name):
+        if name in async_client_map:
+            instance = async_client_map[name](
+                cid=self.config.cid, api_key=self.config.api_key, transport=self.transport
+            )
+            setattr(self, name, instance)
+            return instance
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
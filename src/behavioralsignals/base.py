@@ -1,17 +1,113 @@
-from typing import Optional
+import json
+import time
+from typing import TYPE_CHECKING, Union, Callable, Iterable, Iterator, Optional
+from pathlib import Path
+from datetime import date, datetime, timezone, timedelta
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-import grpc
+import urllib3
 import requests
 
-from .models import APIError
+from .dedup import hash_file
+from .retry import rewind, file_positions
+from .export import ResultSink, result_rows
+from .models import (
+    ResultItem,
+    ProcessItem,
+    UploadResult,
+    ExportSummary,
+    ProcessStatus,
+    ResultResponse,
+    StreamingOptions,
+    ProcessListParams,
+    StreamingResultResponse,
+)
+from .framing import AudioChunk, AudioFramer, method_path
+from .metrics import StreamMetrics
+from .multipart import MultipartEncoder
+from .transcode import TranscodeType, transcoded_file, resolve_transcode_options
+from .transport import Transport
+from .exceptions import (
+    APIRequestError,
+    APIConnectionError,
+    BehavioralSignalsError,
+    error_from_response,
+)
+from .jsonstream import iter_array_objects
 from .configuration import Configuration
 
 
+if TYPE_CHECKING:
+    from .generated import api_pb2 as pb
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # optional, only makes decoding large payloads faster
+    json_loads = json.loads
+
+# Failures of one upload or fetch of a batch, which are reported instead of aborting it:
+# API and network errors, unreadable files and invalid parameters or responses
+_ITEM_ERRORS = (BehavioralSignalsError, requests.RequestException, OSError, ValueError)
+
+
+def _iter_body(response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+    try:
+        yield from response.iter_content(chunk_size)
+    except requests.RequestException as e:
+        raise APIConnectionError(f"Connection lost while reading the response: {e}") from e
+
+
+def _result_completed(result: ResultResponse) -> Optional[bool]:
+    """Returns whether the process of a result has completed, as reported by the status
+    ``code`` of the result response, or None when the response does not include it."""
+    if result.code is None:
+        return None
+    return result.code == ProcessStatus.COMPLETED
+
+
+def _run_concurrently(fn: Callable, args: Iterator[tuple], max_concurrency: int) -> Iterator:
+    """Calls ``fn(*a)`` for every ``a`` of ``args`` on at most ``max_concurrency`` threads,
+    yielding the return values as the calls finish. ``args`` is only consumed as threads
+    free up, so arbitrarily long (lazy) inputs are processed with bounded memory."""
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        in_flight = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < max_concurrency:
+                try:
+                    a = next(args)
+                except StopIteration:
+                    exhausted = True
+                    break
+                in_flight.add(executor.submit(fn, *a))
+
+            if not in_flight:
+                break
+
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+
+
 class BaseClient:
-    def __init__(self, cid: str, api_key: str):
-        self.config = Configuration(cid=cid, api_key=api_key)
-        self.session = requests.Session()
-        self._authenticate()
+    def __init__(
+        self, cid: str, api_key: str, transport: Optional[Transport] = None, **config_options
+    ):
+        # Clients created from the same ``Client`` share its transport, i.e. one
+        # connection pool and one authentication. Otherwise a private one is created.
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = Transport(Configuration(cid=cid, api_key=api_key, **config_options))
+
+        self.transport = transport
+        self.config = transport.config
+        self.session = transport.session
+
+        if not self.config.lazy_auth:
+            self._authenticate()
 
     def _get_default_headers(self):
         headers = {
@@ -20,19 +116,26 @@ class BaseClient:
         }
         return headers
 
-    def _handle_response(self, response: requests.Response) -> dict:
+    def _handle_response(
+        self, response: requests.Response, raw: bool = False, stream: bool = False
+    ):
+        """Returns the decoded JSON body, or its raw bytes with ``raw`` (e.g. to let pydantic
+        validate large payloads straight from JSON), or the response itself with ``stream``
+        (for its body to be consumed incrementally)."""
         if response.status_code != 200:
-            try:
-                error = APIError(**response.json())
-                raise Exception(f"API Error {error.code}: {error.message}")
-            except ValueError:
-                raise Exception(f"HTTP {response.status_code}: {response.text}")
+            raise error_from_response(response)
+        if stream:
+            return response
+        if raw:
+            return response.content
         return response.json()
 
     def _authenticate(self):
-        headers = self._get_default_headers()
-        headers["X-Auth-Client"] = self.config.cid
-        response = self._send_request(path="auth", method="GET", headers=headers)
+        self.transport.ensure_authenticated(self._send_auth_request)
+
+    def _send_auth_request(self):
+        headers = {"X-Auth-Client": self.config.cid}
+        response = self._request(path="auth", method="GET", headers=headers)
         return response
 
     def _send_request(
@@ -43,6 +146,31 @@ class BaseClient:
         json: Optional[dict] = None,
         headers: Optional[dict] = None,
         files: Optional[dict] = None,
+        raw: bool = False,
+        stream: bool = False,
+    ):
+        self._authenticate()
+        return self._request(
+            path=path,
+            method=method,
+            data=data,
+            json=json,
+            headers=headers,
+            files=files,
+            raw=raw,
+            stream=stream,
+        )
+
+    def _request(
+        self,
+        path: str,
+        method: str = "GET",
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        files: Optional[dict] = None,
+        raw: bool = False,
+        stream: bool = False,
     ):
         url = self.config.api_url + "/" + path
         if headers is None:
@@ -50,22 +178,409 @@ class BaseClient:
         else:
             headers = {**self._get_default_headers(), **headers}
 
-        if method == "GET":
-            response = self.session.get(
-                url, headers=headers, params=data, timeout=self.config.timeout
-            )
-        elif method == "POST":
-            response = self.session.post(
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported method: {method}")
+
+        breaker = self.transport.circuit_breaker
+        positions = file_positions(files)
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+
+            try:
+                response = self._perform(method, url, headers, data, json, files, stream=stream)
+                result = self._handle_response(response, raw=raw, stream=stream)
+            except APIRequestError as e:
+                if breaker is not None:
+                    # A permanent (4xx) error still proves the API is up
+                    if e.transient:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
+                delay = self.config.retry.get_delay(attempt, method, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                rewind(positions)
+                attempt += 1
+                continue
+            except BaseException:
+                # Neither a success nor an API failure, which must not leave a trial request
+                # of the circuit breaker in flight forever
+                if breaker is not None:
+                    breaker.release_trial()
+                raise
+
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+    def _perform(
+        self, method, url, headers, data, json, files, stream: bool = False
+    ) -> requests.Response:
+        try:
+            if method == "GET":
+                return self.session.get(
+                    url, headers=headers, params=data, timeout=self.config.timeout, stream=stream
+                )
+            return self.session.post(
                 url, headers=headers, data=data, files=files, json=json, timeout=self.config.timeout
             )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            # Failing to connect means nothing reached the server, so even uploads can be retried
+            connect_failed = isinstance(e, requests.ConnectTimeout) or isinstance(
+                getattr(e.args[0], "reason", None) if e.args else None,
+                urllib3.exceptions.ConnectTimeoutError,
+            )
+            raise APIConnectionError(str(e), retry_safe=connect_failed) from e
+        except (
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ContentDecodingError,
+        ) as e:
+            raise APIConnectionError(f"Could not read the response: {e}") from e
+        except requests.RequestException as e:
+            # e.g. too many redirects or an invalid url, which repeating will not fix
+            raise APIRequestError(str(e)) from e
+
+    def _get_result(self, path: str, pid: int) -> ResultResponse:
+        """Fetches a result, serving it from ``Configuration.result_cache`` when possible."""
+        cache = self.config.result_cache
+        if cache is not None:
+            result = cache.get(path)
+            if result is not None:
+                return result
+
+        # Validating straight from the response bytes skips building an intermediate dict
+        content = self._send_request(path=path, method="GET", raw=True)
+        result = ResultResponse.model_validate_json(content)
+
+        # Results only become immutable once the process has completed successfully
+        if cache is not None:
+            completed = _result_completed(result)
+            if completed is None:
+                completed = self.get_process(pid=pid).is_completed
+            if completed:
+                cache.set(path, result)
+        return result
+
+    def _iter_result(self, path: str, chunk_size: int = 1 << 16) -> Iterator[ResultItem]:
+        """Streams a result and yields its items as they are decoded from the response body.
+
+        Completed results found in ``Configuration.result_cache`` are served from it.
+        """
+        cache = self.config.result_cache
+        if cache is not None:
+            result = cache.get(path)
+            if result is not None:
+                yield from result.results or []
+                return
+
+        response = self._send_request(path=path, method="GET", stream=True)
+        try:
+            for raw_item in iter_array_objects(_iter_body(response, chunk_size), "results"):
+                yield ResultItem.model_validate_json(raw_item)
+        finally:
+            # Returns the connection to the pool once the body has been read to the end
+            response.close()
+
+    def _get_result_json(self, path: str) -> dict:
+        """Fetches a result as plain, unvalidated JSON, decoded with orjson when available."""
+        content = self._send_request(path=path, method="GET", raw=True)
+        return json_loads(content)
+
+    def _upload_file(
+        self,
+        path: str,
+        file_path: str,
+        fields: dict,
+        transcode: Optional[TranscodeType] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        dedup: bool = False,
+    ) -> ProcessItem:
+        """Uploads a local file as a streamed multipart request, optionally transcoding it first.
+
+        With ``dedup``, the file content is hashed and looked up in the local submission index
+        first: if the same content was already uploaded with the same options, the existing
+        process is returned instead, unless it failed.
+        """
+        options = resolve_transcode_options(transcode)
+
+        if dedup:
+            index = self.transport.submission_index
+            content_hash = hash_file(file_path)
+            # The job name is only a label, any other field changes the processing
+            dedup_options = {k: v for k, v in fields.items() if k != "name"}
+            dedup_options["transcode"] = options.model_dump() if options is not None else None
+
+            pid = index.lookup(path, content_hash, dedup_options)
+            if pid is not None:
+                process = self.get_process(pid=pid)
+                if not (process.is_failed or process.status == ProcessStatus.INSUFFICIENT_CREDITS):
+                    return process
+                index.forget(path, content_hash, dedup_options)
+
+        if options is None:
+            upload_context = nullcontext(file_path)
         else:
-            raise ValueError(f"Unsupported method: {method}")
+            upload_context = transcoded_file(file_path, options)
+
+        with upload_context as upload_path:
+            # Stream the multipart body from disk, instead of building it in memory
+            body = MultipartEncoder(
+                fields=fields,
+                file_field="file",
+                file_path=upload_path,
+                progress=progress,
+            )
+            data = self._send_request(
+                path=path,
+                method="POST",
+                data=body,
+                headers={"content-type": body.content_type},
+            )
+        process = ProcessItem(**data)
+
+        if dedup:
+            index.record(path, content_hash, dedup_options, process.pid)
+        return process
+
+    def _upload_many(
+        self,
+        sources: Iterable[Union[str, Path]],
+        max_concurrency: int = 8,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        file_options: Optional[dict] = None,
+        **upload_options,
+    ) -> Iterator[UploadResult]:
+        """Uploads many files and/or presigned urls concurrently, yielding results as they finish.
+
+        Sources starting with ``http://`` or ``https://`` go through ``upload_s3_presigned_url``,
+        everything else through ``upload_audio``. At most ``max_concurrency`` uploads are in
+        flight and sources are only pulled from ``sources`` as slots free up, so arbitrarily
+        long (lazy) inputs are consumed with bounded memory. A failed upload is reported in
+        its ``UploadResult`` and does not affect the rest of the batch. ``file_options`` are
+        only passed to ``upload_audio``.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        total = len(sources) if hasattr(sources, "__len__") else None
+        sources = enumerate(sources)
+
+        def _upload(index: int, source: Union[str, Path]) -> UploadResult:
+            source = str(source)
+            try:
+                if source.startswith(("http://", "https://")):
+                    process = self.upload_s3_presigned_url(url=source, **upload_options)
+                else:
+                    process = self.upload_audio(
+                        file_path=source, **upload_options, **(file_options or {})
+                    )
+            except _ITEM_ERRORS as e:
+                return UploadResult(index=index, source=source, error=e)
+            return UploadResult(index=index, source=source, process=process)
+
+        results = _run_concurrently(_upload, sources, max_concurrency)
+        for done_count, result in enumerate(results, start=1):
+            if progress is not None:
+                progress(done_count, total)
+            yield result
+
+    def _export_results(
+        self,
+        pids: Iterable[int],
+        sink: ResultSink,
+        max_concurrency: int = 8,
+        row_group_size: int = 100_000,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> ExportSummary:
+        """Fetches results concurrently and appends their rows to ``sink`` in row groups.
+
+        Pids already in ``sink.written_pids()`` are skipped, so an interrupted export resumes
+        where it stopped. Results are fetched by at most ``max_concurrency`` threads and rows
+        are buffered until ``row_group_size`` of them can be written at once, so memory stays
+        bounded by both. A pid that fails to be fetched is reported in the summary.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        written = sink.written_pids()
+        summary = ExportSummary()
+        total = len(pids) if hasattr(pids, "__len__") else None
+        buffer, buffer_pids = [], []
+
+        def _pending() -> Iterator[tuple]:
+            for pid in pids:
+                if pid in written:
+                    summary.skipped += 1
+                else:
+                    yield (pid,)
+
+        def _fetch(pid: int) -> tuple:
+            try:
+                return pid, result_rows(pid, self.get_result(pid=pid)), None
+            except _ITEM_ERRORS as e:
+                return pid, None, e
+
+        def _flush():
+            sink.write(buffer, buffer_pids)
+            summary.rows += len(buffer)
+            buffer.clear()
+            buffer_pids.clear()
+
+        fetched = _run_concurrently(_fetch, _pending(), max_concurrency)
+        for done_count, (pid, rows, error) in enumerate(fetched, start=1):
+            if error is not None:
+                summary.failed[pid] = error
+            else:
+                # All rows of a pid go in the same row group, which also records it as
+                # written (even without rows, so it is not fetched again on resume)
+                buffer.extend(rows)
+                buffer_pids.append(pid)
+                summary.exported += 1
+                if len(buffer) >= row_group_size or len(buffer_pids) >= row_group_size:
+                    _flush()
+            if progress is not None:
+                progress(done_count, total)
+
+        if buffer_pids:
+            _flush()
+        return summary
 
-        return self._handle_response(response)
+    def _iter_processes(
+        self,
+        path: str,
+        sort: str = "asc",
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        page_size: int = 1000,
+        prefetch: bool = True,
+    ) -> Iterator[ProcessItem]:
+        """Walks all pages of the process listing at ``path``, yielding processes lazily.
+
+        Each page is fetched as raw JSON and its items are only turned into ``ProcessItem``s
+        as they are consumed. With ``prefetch``, the next page is requested on a background
+        thread while the caller works through the current one.
+        """
+
+        def _fetch(page: int) -> list:
+            query_params = ProcessListParams(
+                page=page, page_size=page_size, sort=sort, start_date=start_date, end_date=end_date
+            )
+            return self._send_request(
+                path=path,
+                method="GET",
+                data=query_params.model_dump(by_alias=True, exclude_none=True),
+            )
+
+        if not prefetch:
+            page = 0
+            while True:
+                items = _fetch(page)
+                for item in items:
+                    yield ProcessItem(**item)
+                if len(items) < page_size:
+                    return
+                page += 1
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bs-prefetch")
+        try:
+            page = 0
+            future = executor.submit(_fetch, page)
+            while future is not None:
+                items = future.result()
+                # A short page is the last one
+                if len(items) < page_size:
+                    future = None
+                else:
+                    page += 1
+                    future = executor.submit(_fetch, page)
+
+                for item in items:
+                    yield ProcessItem(**item)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _wait_for_completion(
+        self,
+        pids: Iterable[int],
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+    ) -> Iterator[ProcessItem]:
+        """Polls the given processes until they reach a terminal status, yielding each one.
+
+        Statuses are refreshed in bulk by paging through ``list_processes`` restricted to
+        ``[start_date, end_date]``. Pids that the listing does not cover are refreshed
+        individually through ``get_process``, which is also used once the number of
+        outstanding pids drops below the number of pages a bulk refresh takes. Without a
+        ``start_date``, the window starts yesterday and is widened to cover the unfinished
+        processes those individual refreshes find outside of it.
+        """
+        pending = {int(pid) for pid in pids}
+        derive_start_date = start_date is None
+        if derive_start_date:
+            # Dates are interpreted by the API; start a day earlier to be timezone-safe
+            start_date = datetime.now(timezone.utc).date() - timedelta(days=1)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        page_size = 1000
+        pages_per_refresh = 1
+
+        while pending:
+            refreshed = {}
+            if len(pending) > pages_per_refresh:
+                pages_per_refresh = 0
+                page = 0
+                while True:
+                    listing = self.list_processes(
+                        page=page,
+                        page_size=page_size,
+                        sort="desc",
+                        start_date=start_date,
+                        end_date=end_date,
+                    )
+                    pages_per_refresh += 1
+                    for process in listing.processes:
+                        if process.pid in pending:
+                            refreshed[process.pid] = process
+
+                    if len(refreshed) == len(pending) or listing.total_count < page_size:
+                        break
+                    page += 1
+
+            missing = pending - refreshed.keys()
+            for pid in missing:
+                refreshed[pid] = self.get_process(pid=pid)
+
+            if derive_start_date:
+                # So that the next listings cover the older processes still to be polled
+                created = [
+                    refreshed[pid].datetime.date()
+                    for pid in missing
+                    if refreshed[pid].datetime is not None and not refreshed[pid].is_terminal
+                ]
+                if created:
+                    start_date = min(start_date, min(created) - timedelta(days=1))
+
+            for pid, process in refreshed.items():
+                if process.is_terminal:
+                    pending.discard(pid)
+                    yield process
+
+            if not pending:
+                break
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(f"{len(pending)} processes did not finish within {timeout}s")
+            time.sleep(poll_interval)
 
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """Close the session, unless it is shared with other clients."""
+        if self._owns_transport:
+            self.transport.close()
 
     def __enter__(self):
         return self
@@ -73,10 +588,48 @@ class BaseClient:
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
 
-    def _get_channel_context(self):
-        """Returns the channel context for gRPC connections."""
-        if self.config.use_ssl:
-            credentials = grpc.ssl_channel_credentials()
-            return grpc.secure_channel(self.config.streaming_api_url, credentials=credentials)
-        else:
-            return grpc.insecure_channel(self.config.streaming_api_url)
+    def connect_streaming(self, timeout: Optional[float] = None) -> None:
+        """Opens the shared streaming channels ahead of the first stream.
+
+        Streams reuse the channels of the client's transport, so only the first stream pays
+        for connecting. Calling this beforehand moves that cost out of the first stream's
+        time to first result.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the channels to connect.
+        """
+        self.transport.connect_streaming(timeout=timeout)
+
+    def _stream(
+        self,
+        rpc_name: str,
+        audio_stream: Iterable[AudioChunk],
+        options: StreamingOptions,
+        raw: bool,
+        metrics: Optional[StreamMetrics] = None,
+    ) -> Iterator[Union[StreamingResultResponse, "pb.StreamResult"]]:
+        from .generated import api_pb2 as pb
+
+        # Messages are serialized by the framer (the first one holds the audio configuration
+        # and authentication details, as the streaming API requires), so they are sent as is
+        framer = AudioFramer(int(self.config.cid), self.config.api_key, options)
+        messages = framer.messages(audio_stream)
+        timer = None
+        if metrics is not None:
+            timer = metrics._start_stream(options.sample_rate)
+            messages = timer.track(framer, messages)
+        call = self.transport.streaming_channel().stream_stream(
+            method_path(rpc_name),
+            request_serializer=None,
+            response_deserializer=pb.StreamResult.FromString,
+        )
+        response_stream = call(messages)
+        try:
+            for response in response_stream:
+                if timer is not None:
+                    timer.received(response)
+                yield response if raw else StreamingResultResponse.from_pb(response)
+        finally:
+            # The shared channel outlives the stream, so a stream abandoned by its consumer
+            # has to be cancelled explicitly (a no-op once it completed)
+            response_stream.cancel()
@@ -0,0 +1,165 @@
+import os
+import mmap
+import zlib
+import hashlib
+import tempfile
+import threading
+from typing import Union, Optional
+from pathlib import Path
+from collections import OrderedDict
+
+from .models import ResultResponse
+
+
+class ResultCache:
+    """Interface of the caches used by ``get_result``.
+
+    Only results of completed processes are stored, since they never change afterwards.
+    Keys identify the API, client and process of a result. Cached results are shared
+    between callers and should be treated as read-only.
+    """
+
+    def get(self, key: str) -> Optional[ResultResponse]:
+        raise NotImplementedError
+
+    def set(self, key: str, result: ResultResponse) -> None:
+        raise NotImplementedError
+
+
+class MemoryResultCache(ResultCache):
+    """Thread-safe in-memory LRU cache holding up to ``max_items`` results."""
+
+    def __init__(self, max_items: int = 128):
+        self.max_items = max_items
+        self._items: OrderedDict[str, ResultResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ResultResponse]:
+        with self._lock:
+            result = self._items.get(key)
+            if result is not None:
+                self._items.move_to_end(key)
+            return result
+
+    def set(self, key: str, result: ResultResponse) -> None:
+        with self._lock:
+            self._items[key] = result
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+
+class DiskResultCache(ResultCache):
+    """On-disk cache of zlib-compressed result JSON, bounded to ``max_bytes``.
+
+    Entries are written atomically (temporary file + rename), so several processes can share
+    a directory, and read back through ``mmap``. When the directory grows beyond
+    ``max_bytes``, the least recently used entries are evicted.
+    """
+
+    suffix = ".json.z"
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        max_bytes: int = 1 << 30,
+        compression_level: int = 6,
+    ):
+        if directory is None:
+            cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            directory = Path(cache_dir) / "behavioralsignals" / "results"
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+
+        self._lock = threading.Lock()
+        self._size = sum(p.stat().st_size for p in self.directory.glob(f"*{self.suffix}"))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (hashlib.sha1(key.encode()).hexdigest() + self.suffix)
+
+    def get(self, key: str) -> Optional[ResultResponse]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                raw = zlib.decompress(m)
+        except (OSError, ValueError, zlib.error):
+            # Missing (or concurrently evicted / truncated) entry
+            return None
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return ResultResponse.model_validate_json(raw)
+
+    def set(self, key: str, result: ResultResponse) -> None:
+        data = zlib.compress(result.model_dump_json().encode(), self.compression_level)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Other processes may have written to the directory, so start from its real size
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if self._size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self._size -= size
+
+
+class TieredResultCache(ResultCache):
+    """Chains caches from fastest to slowest, e.g. memory in front of disk.
+
+    A hit in a slower cache is copied into the faster ones.
+    """
+
+    def __init__(self, *caches: ResultCache):
+        self.caches = caches
+
+    def get(self, key: str) -> Optional[ResultResponse]:
+        for i, cache in enumerate(self.caches):
+            result = cache.get(key)
+            if result is not None:
+                for faster in self.caches[:i]:
+                    faster.set(key, result)
+                return result
+        return None
+
+    def set(self, key: str, result: ResultResponse) -> None:
+        for cache in self.caches:
+            cache.set(key, result)
+
+
+def default_result_cache(
+    directory: Optional[Union[str, Path]] = None, max_items: int = 128, max_bytes: int = 1 << 30
+) -> ResultCache:
+    """An in-memory LRU in front of a size-bounded on-disk cache."""
+    return TieredResultCache(
+        MemoryResultCache(max_items=max_items),
+        DiskResultCache(directory=directory, max_bytes=max_bytes),
+    )
@@ -1,4 +1,5 @@
 import importlib
+import threading
 
 from .base import BaseClient
 
@@ -10,13 +11,25 @@ client_map = {
 
 
 class Client(BaseClient):
+    def __init__(self, cid: str, api_key: str, **config_options):
+        super().__init__(cid=cid, api_key=api_key, **config_options)
+        self._client_lock = threading.Lock()
+
     def __getattr__(self, name):
         if name in client_map:
-            module_path, class_name = client_map[name]
-            module = importlib.import_module(module_path)
-            client_class = getattr(module, class_name)
-            instance = client_class(cid=self.config.cid, api_key=self.config.api_key)
-            setattr(self, name, instance)
-            return instance
+            # Sub-clients are created once and reuse this client's transport, so they
+            # neither open new connections nor authenticate again.
+            with self._client_lock:
+                if name in self.__dict__:
+                    return self.__dict__[name]
+
+                module_path, class_name = client_map[name]
+                module = importlib.import_module(module_path)
+                client_class = getattr(module, class_name)
+                instance = client_class(
+                    cid=self.config.cid, api_key=self.config.api_key, transport=self.transport
+                )
+                setattr(self, name, instance)
+                return instance
 
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
@@ -0,0 +1,173 @@
+import sys
+from typing import List, Tuple, Optional
+
+from .models import ResultItem, ResultResponse, ModelPredictions
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def _to_str(value: Optional[float]) -> Optional[str]:
+    return repr(value) if value is not None else None
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+class CompactPrediction:
+    """Slotted counterpart of ``ModelPredictions`` with an interned label and a float posterior."""
+
+    __slots__ = ("dominant_in_segments", "label", "posterior")
+
+    def __init__(
+        self,
+        label: Optional[str],
+        posterior: Optional[float],
+        dominant_in_segments: Optional[Tuple[int, ...]] = None,
+    ):
+        self.label = label
+        self.posterior = posterior
+        self.dominant_in_segments = dominant_in_segments
+
+    def __repr__(self) -> str:
+        return f"CompactPrediction(label={self.label!r}, posterior={self.posterior!r})"
+
+    @classmethod
+    def from_model(cls, prediction: ModelPredictions) -> "CompactPrediction":
+        segments = prediction.dominantInSegments
+        return cls(
+            _intern(prediction.label),
+            _to_float(prediction.posterior),
+            tuple(segments) if segments is not None else None,
+        )
+
+    def to_model(self) -> ModelPredictions:
+        segments = self.dominant_in_segments
+        return ModelPredictions(
+            label=self.label,
+            posterior=_to_str(self.posterior),
+            dominantInSegments=list(segments) if segments is not None else None,
+        )
+
+
+class CompactResultItem:
+    """Slotted counterpart of ``ResultItem``.
+
+    Start/end times and posteriors are parsed to floats once, and the task, level and
+    label strings are interned, so they are shared by all items instead of being copied
+    into each one.
+    """
+
+    __slots__ = ("embedding", "et", "final_label", "id", "level", "prediction", "st", "task")
+
+    def __init__(
+        self,
+        id: Optional[str],
+        st: Optional[float],
+        et: Optional[float],
+        task: Optional[str],
+        level: Optional[str],
+        final_label: Optional[str],
+        prediction: Optional[Tuple[CompactPrediction, ...]] = None,
+        embedding: Optional[str] = None,
+    ):
+        self.id = id
+        self.st = st
+        self.et = et
+        self.task = task
+        self.level = level
+        self.final_label = final_label
+        self.prediction = prediction
+        self.embedding = embedding
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactResultItem(id={self.id!r}, task={self.task!r}, st={self.st!r}, "
+            f"et={self.et!r}, final_label={self.final_label!r})"
+        )
+
+    @classmethod
+    def from_model(cls, item: ResultItem) -> "CompactResultItem":
+        prediction = item.prediction
+        return cls(
+            item.id,
+            _to_float(item.startTime),
+            _to_float(item.endTime),
+            _intern(item.task),
+            _intern(item.level),
+            _intern(item.finalLabel),
+            tuple(CompactPrediction.from_model(p) for p in prediction)
+            if prediction is not None
+            else None,
+            item.embedding,
+        )
+
+    def to_model(self) -> ResultItem:
+        return ResultItem(
+            id=self.id,
+            startTime=_to_str(self.st),
+            endTime=_to_str(self.et),
+            task=self.task,
+            prediction=[p.to_model() for p in self.prediction]
+            if self.prediction is not None
+            else None,
+            finalLabel=self.final_label,
+            level=self.level,
+            embedding=self.embedding,
+        )
+
+
+class CompactResult:
+    """Memory-efficient, read-mostly copy of a ``ResultResponse``.
+
+    Meant for holding many results at once: a compact item takes a fraction of the memory
+    of a ``ResultItem`` (see ``examples/benchmarks/bench_result_memory.py``). Converting back
+    with ``to_model`` restores equal models, except that numeric strings come back in their
+    canonical form (e.g. a posterior of "0.2500" becomes "0.25").
+    """
+
+    __slots__ = ("cid", "code", "message", "pid", "results")
+
+    def __init__(
+        self,
+        pid: Optional[int] = None,
+        cid: Optional[int] = None,
+        code: Optional[int] = None,
+        message: Optional[str] = None,
+        results: Optional[List[CompactResultItem]] = None,
+    ):
+        self.pid = pid
+        self.cid = cid
+        self.code = code
+        self.message = message
+        self.results = results
+
+    def __repr__(self) -> str:
+        n_results = len(self.results) if self.results is not None else None
+        return f"CompactResult(pid={self.pid!r}, results={n_results})"
+
+    @classmethod
+    def from_model(cls, result: ResultResponse) -> "CompactResult":
+        results = result.results
+        return cls(
+            result.pid,
+            result.cid,
+            result.code,
+            result.message,
+            [CompactResultItem.from_model(item) for item in results]
+            if results is not None
+            else None,
+        )
+
+    def to_model(self) -> ResultResponse:
+        return ResultResponse(
+            pid=self.pid,
+            cid=self.cid,
+            code=self.code,
+            message=self.message,
+            results=[item.to_model() for item in self.results]
+            if self.results is not None
+            else None,
+        )
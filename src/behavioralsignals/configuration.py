@@ -1,20 +1,56 @@
 from typing import Union, Optional
 
-from pydantic import field_validator
+from pydantic import Field, ConfigDict, field_validator
 from pydantic.dataclasses import dataclass
 
+from .cache import ResultCache
+from .retry import RetryPolicy
+
 
 TimeoutType = Union[float, tuple[float, float]]
 
 
-@dataclass
+@dataclass(config=ConfigDict(arbitrary_types_allowed=True))
 class Configuration:
     cid: Union[str, int]
     api_key: str
     api_url: str = "https://api.behavioralsignals.com/v5"
     streaming_api_url: str = "streaming.behavioralsignals.com:443"
-    timeout: Optional[TimeoutType] = None
+    # (connect, read) timeout in seconds, so that a hung socket cannot block forever
+    timeout: Optional[TimeoutType] = (10.0, 120.0)
     use_ssl: bool = True
+    # Maximum number of pooled HTTP connections, i.e. the number of threads that can
+    # talk to the API concurrently without opening throwaway connections.
+    pool_maxsize: int = Field(10, ge=1)
+    pool_block: bool = False
+    # Seconds after which authentication is repeated. None authenticates only once.
+    auth_ttl: Optional[float] = Field(None, gt=0)
+    # Defer authentication until the first request instead of doing it on construction.
+    lazy_auth: bool = False
+    retry: RetryPolicy = Field(default_factory=RetryPolicy)
+    # Consecutive transient failures after which requests fail fast. None disables it.
+    circuit_breaker_threshold: Optional[int] = Field(5, ge=1)
+    # Seconds the circuit stays open before a trial request is let through
+    circuit_breaker_recovery_time: float = Field(30.0, gt=0)
+    # SQLite index used by deduplicated uploads. Defaults to ~/.cache/behavioralsignals/
+    submission_index_path: Optional[str] = None
+    # Cache of completed results used by get_result, e.g. ``default_result_cache()``
+    result_cache: Optional[ResultCache] = None
+    # Number of long-lived gRPC channels streams are spread over (round-robin). Each
+    # channel is one HTTP/2 connection, which servers cap at ~100 concurrent streams.
+    streaming_channels: int = Field(1, ge=1)
+    # Seconds between keepalive pings on a streaming channel. None disables them.
+    grpc_keepalive_time: Optional[float] = Field(60.0, gt=0)
+    # Seconds to wait for a keepalive ping to be acknowledged before reconnecting
+    grpc_keepalive_timeout: float = Field(20.0, gt=0)
+    # Also ping idle channels, keeping them warm behind NATs/load balancers. Servers may
+    # reject pings more frequent than their policy allows, so only enable it if permitted.
+    grpc_keepalive_without_calls: bool = False
+    # Upper bound of the backoff between reconnection attempts, in seconds
+    grpc_max_reconnect_backoff: Optional[float] = Field(None, gt=0)
+    # Maximum size of a single sent/received gRPC message, in bytes. None keeps gRPC's
+    # defaults (4 MiB received, unlimited sent).
+    grpc_max_message_size: Optional[int] = Field(None, gt=0)
 
     @field_validator("cid", mode="before")
     @classmethod
@@ -0,0 +1,79 @@
+import os
+import json
+import hashlib
+import sqlite3
+from typing import Optional, Generator
+from pathlib import Path
+from contextlib import contextmanager
+
+
+def default_index_path() -> Path:
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_dir) / "behavioralsignals" / "submissions.sqlite"
+
+
+def hash_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """Returns the BLAKE2b content hash of a file, reading it through one reusable buffer."""
+    digest = hashlib.blake2b(digest_size=20)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(file_path, "rb") as f:
+        while n := f.readinto(buffer):
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+class SubmissionIndex:
+    """Local SQLite index of uploaded audio, mapping ``(api, content_hash, options)`` to a pid.
+
+    Every operation opens its own short-lived connection, and the database runs in WAL mode
+    with a busy timeout, so one index file can be shared by many threads and processes.
+    """
+
+    def __init__(self, path: Optional[str] = None, timeout: float = 30.0):
+        self.path = Path(path) if path is not None else default_index_path()
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS submissions ("
+                "api TEXT NOT NULL, content_hash TEXT NOT NULL, options TEXT NOT NULL, "
+                "pid INTEGER NOT NULL, PRIMARY KEY (api, content_hash, options))"
+            )
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _options_key(options: dict) -> str:
+        return json.dumps(options, sort_keys=True, default=str)
+
+    def lookup(self, api: str, content_hash: str, options: dict) -> Optional[int]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT pid FROM submissions WHERE api = ? AND content_hash = ? AND options = ?",
+                (api, content_hash, self._options_key(options)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(self, api: str, content_hash: str, options: dict, pid: int):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO submissions (api, content_hash, options, pid) "
+                "VALUES (?, ?, ?, ?)",
+                (api, content_hash, self._options_key(options), pid),
+            )
+
+    def forget(self, api: str, content_hash: str, options: dict):
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM submissions WHERE api = ? AND content_hash = ? AND options = ?",
+                (api, content_hash, self._options_key(options)),
+            )
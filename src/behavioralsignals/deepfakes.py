@@ -1,21 +1,27 @@
-from typing import Literal, Iterator, Optional
+from typing import TYPE_CHECKING, Union, Literal, Callable, Iterable, Iterator, Optional
 from pathlib import Path
 
-from google.protobuf.json_format import MessageToDict
-
 from .base import BaseClient
+from .export import ResultSink
 from .models import (
+    ResultItem,
     ProcessItem,
+    UploadResult,
+    ExportSummary,
     ResultResponse,
     StreamingOptions,
+    TranscodeOptions,
     ProcessListParams,
     ProcessListResponse,
     StreamingResultResponse,
     DeepfakeAudioUploadParams,
     DeepfakeS3UrlUploadParams,
 )
-from .generated import api_pb2 as pb
-from .generated import api_pb2_grpc as pb_grpc
+from .metrics import StreamMetrics
+
+
+if TYPE_CHECKING:
+    from .generated import api_pb2 as pb
 
 
 class Deepfakes(BaseClient):
@@ -26,6 +32,9 @@ class Deepfakes(BaseClient):
         embeddings: bool = False,
         enable_generator_detection: bool = False,
         meta: Optional[str] = None,
+        transcode: Optional[Union[Literal["flac", "opus"], TranscodeOptions]] = None,
+        dedup: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
     ) -> ProcessItem:
         """Uploads an audio file for processing and returns the process item.
 
@@ -35,6 +44,13 @@ class Deepfakes(BaseClient):
             embeddings (bool): Whether to include speaker embeddings. Defaults to False.
             enable_generator_detection (bool): Whether to include prediction for the source of the deepfake (generator model). Defaults to False.
             meta (str, optional): Metadata json containing any extra user-defined metadata.
+            transcode (str | TranscodeOptions, optional): Transcode the file with ffmpeg before
+                uploading it, e.g. "flac" or "opus" (16kHz mono), to reduce upload size.
+            dedup (bool): Skip the upload if the same file content was already submitted with the
+                same options, returning the existing process (unless it failed). Submissions are
+                tracked in a local SQLite index (``submission_index_path``). Defaults to False.
+            progress (Callable, optional): Called as ``progress(bytes_sent, total_bytes)`` while
+                the file is being uploaded.
         Returns:
             ProcessItem: The process item containing details about the submitted process.
         """
@@ -50,25 +66,23 @@ class Deepfakes(BaseClient):
         # Use provided name or default to filename
         job_name = params.name or Path(params.file_path).name
 
-        with open(params.file_path, "rb") as audio_file:
-            files = {"file": audio_file}
-            data = {
-                "name": job_name,
-                "embeddings": params.embeddings,
-                "enable_generator_detection": params.enable_generator_detection,
-            }
-
-            if params.meta:
-                data["meta"] = params.meta
-
-            data = self._send_request(
-                path=f"detection/clients/{self.config.cid}/processes/audio",
-                method="POST",
-                files=files,
-                data=data,
-            )
+        data = {
+            "name": job_name,
+            "embeddings": params.embeddings,
+            "enable_generator_detection": params.enable_generator_detection,
+        }
 
-        return ProcessItem(**data)
+        if params.meta:
+            data["meta"] = params.meta
+
+        return self._upload_file(
+            path=f"detection/clients/{self.config.cid}/processes/audio",
+            file_path=params.file_path,
+            fields=data,
+            transcode=transcode,
+            progress=progress,
+            dedup=dedup,
+        )
 
     def upload_s3_presigned_url(
         self,
@@ -122,6 +136,49 @@ class Deepfakes(BaseClient):
 
         return ProcessItem(**response)
 
+    def upload_many(
+        self,
+        sources: Iterable[Union[str, Path]],
+        max_concurrency: int = 8,
+        embeddings: bool = False,
+        enable_generator_detection: bool = False,
+        meta: Optional[str] = None,
+        transcode: Optional[Union[Literal["flac", "opus"], TranscodeOptions]] = None,
+        dedup: bool = False,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Iterator[UploadResult]:
+        """Uploads many audio files and/or S3 presigned urls concurrently.
+
+        Results are yielded in completion order, as soon as each upload finishes. Sources are
+        read lazily and at most ``max_concurrency`` uploads are in flight at any time. Failed
+        uploads are reported through ``UploadResult.error`` without aborting the batch.
+        For best throughput, configure the client with ``pool_maxsize >= max_concurrency``.
+
+        Args:
+            sources (Iterable[str | Path]): File paths and/or presigned urls (http/https) to upload.
+            max_concurrency (int): Maximum number of concurrent uploads. Defaults to 8.
+            embeddings (bool): Whether to include speaker embeddings. Defaults to False.
+            enable_generator_detection (bool): Whether to include prediction for the source of the deepfake (generator model). Defaults to False.
+            meta (str, optional): Metadata json containing any extra user-defined metadata.
+            transcode (str | TranscodeOptions, optional): Transcode local files before uploading
+                them (see ``upload_audio``). Transcoding runs in ffmpeg processes, overlapping
+                with the uploads of other files.
+            dedup (bool): Skip local files that were already submitted (see ``upload_audio``).
+            progress (Callable, optional): Called as ``progress(done, total)`` after every upload;
+                ``total`` is None when ``sources`` has no length.
+        Returns:
+            Iterator[UploadResult]: The outcome of every upload, tagged with its source and index.
+        """
+        return self._upload_many(
+            sources,
+            max_concurrency=max_concurrency,
+            progress=progress,
+            file_options={"transcode": transcode, "dedup": dedup},
+            embeddings=embeddings,
+            enable_generator_detection=enable_generator_detection,
+            meta=meta,
+        )
+
     def list_processes(
         self,
         page: int = 0,
@@ -155,6 +212,38 @@ class Deepfakes(BaseClient):
 
         return ProcessListResponse(processes=data)
 
+    def iter_processes(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        sort: Literal["asc", "desc"] = "asc",
+        page_size: int = 1000,
+        prefetch: bool = True,
+    ) -> Iterator[ProcessItem]:
+        """Iterates over all processes of the authenticated user, across all pages.
+
+        Processes are yielded lazily, one page at a time, and the next page is fetched on a
+        background thread while the current one is being consumed. Iteration stops after the
+        last page.
+
+        Args:
+            start_date (str, optional): Filter processes created on or after this date (YYYY-MM-DD).
+            end_date (str, optional): Filter processes created on or before this date (YYYY-MM-DD).
+            sort (str): Sort order for the processes, should be "asc" or "desc". Defaults to "asc".
+            page_size (int): Number of processes fetched per request (default is 1000).
+            prefetch (bool): Whether to fetch the next page in the background. Defaults to True.
+        Returns:
+            Iterator[ProcessItem]: The processes, in the requested order.
+        """
+        return self._iter_processes(
+            path=f"detection/clients/{self.config.cid}/processes",
+            sort=sort,
+            start_date=start_date,
+            end_date=end_date,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
     def get_process(self, pid: int) -> ProcessItem:
         """Retrieves details of a specific process by its ID.
 
@@ -171,46 +260,140 @@ class Deepfakes(BaseClient):
 
         return ProcessItem(**data)
 
+    def wait_for_completion(
+        self,
+        pids: Iterable[int],
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[ProcessItem]:
+        """Waits for the given processes to finish, yielding each one as it reaches a terminal status.
+
+        Statuses are refreshed in bulk through the paginated ``list_processes`` endpoint, so each
+        poll costs a few requests instead of one per pid. Pids outside the listed date window, and
+        the last few stragglers, are refreshed individually with ``get_process``.
+
+        Args:
+            pids (Iterable[int]): The process IDs to wait for.
+            poll_interval (float): Seconds to wait between polls. Defaults to 1.0.
+            timeout (float, optional): Maximum seconds to wait before raising ``TimeoutError``.
+            start_date (str, optional): Earliest submission date (YYYY-MM-DD) of the processes.
+                Defaults to the day before the oldest unfinished process, found with the first
+                poll (yesterday, UTC, until then).
+            end_date (str, optional): Latest submission date (YYYY-MM-DD) of the processes.
+        Returns:
+            Iterator[ProcessItem]: The processes, in the order they finish (completed or failed).
+        """
+        return self._wait_for_completion(
+            pids,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
     def get_result(self, pid: int) -> ResultResponse:
         """Retrieves the result of a completed process by its ID.
 
+        If the client has a ``result_cache``, completed results are served from it without
+        touching the network.
+
         Args:
             pid (int): The process ID for which to retrieve the result
         Returns:
             ResultResponse: The result response containing the results of the specified process.
         """
-        data = self._send_request(
-            path=f"detection/clients/{self.config.cid}/processes/{pid}/results",
-            method="GET",
+        return self._get_result(
+            path=f"detection/clients/{self.config.cid}/processes/{pid}/results", pid=pid
+        )
+
+    def get_result_json(self, pid: int) -> dict:
+        """Retrieves the result of a completed process as plain JSON, without validation.
+
+        This skips building ``ResultResponse``/``ResultItem`` models entirely and is meant for
+        throughput-critical consumers that trust the API's schema. It decodes with ``orjson``
+        when installed and does not use the ``result_cache``.
+
+        Args:
+            pid (int): The process ID for which to retrieve the result
+        Returns:
+            dict: The decoded result payload, with the same keys as the API response.
+        """
+        return self._get_result_json(
+            path=f"detection/clients/{self.config.cid}/processes/{pid}/results"
+        )
+
+    def iter_result(self, pid: int) -> Iterator[ResultItem]:
+        """Streams the result of a completed process, yielding its items as they arrive.
+
+        Unlike ``get_result``, the response body is parsed incrementally while it downloads,
+        so memory use stays constant for huge results (e.g. long recordings with embeddings)
+        and processing can start before the download finishes. The request is sent when
+        iteration starts. Results in the ``result_cache`` are served from it.
+
+        Args:
+            pid (int): The process ID for which to retrieve the result
+        Returns:
+            Iterator[ResultItem]: The result items, in the order returned by the API.
+        """
+        return self._iter_result(
+            path=f"detection/clients/{self.config.cid}/processes/{pid}/results"
+        )
+
+    def export_results(
+        self,
+        pids: Iterable[int],
+        sink: ResultSink,
+        max_concurrency: int = 8,
+        row_group_size: int = 100_000,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> ExportSummary:
+        """Fetches the results of many processes concurrently and appends them to a sink.
+
+        Every ``ResultItem`` becomes one row tagged with its pid, task and level (see
+        ``result_rows``). Rows are buffered and written in row groups of about
+        ``row_group_size`` rows, all rows of a pid in the same group, so memory is bounded
+        regardless of the number of pids. Pids already in the sink are skipped, so re-running
+        an interrupted export with the same sink resumes it.
+
+        Args:
+            pids (Iterable[int]): The process IDs to export; read lazily.
+            sink (ResultSink): Where to write the rows, e.g. ``JSONLSink`` or ``ParquetSink``.
+            max_concurrency (int): Maximum number of concurrent result fetches. Defaults to 8.
+            row_group_size (int): Number of rows buffered before a write. Defaults to 100000.
+            progress (Callable, optional): Called as ``progress(done, total)`` after every
+                fetched pid; ``total`` is None when ``pids`` has no length.
+        Returns:
+            ExportSummary: Counts of exported, skipped pids and written rows, and the failures.
+        """
+        return self._export_results(
+            pids,
+            sink,
+            max_concurrency=max_concurrency,
+            row_group_size=row_group_size,
+            progress=progress,
         )
-        return ResultResponse(**data)
 
     def stream_audio(
-        self, audio_stream: Iterator[bytes], options: StreamingOptions
-    ) -> Iterator[ResultResponse]:
-        with self._get_channel_context() as channel:
-            stub = pb_grpc.BehavioralStreamingApiStub(channel)
-
-            def _request_generator() -> Iterator[pb.AudioStream]:
-                # Streaming API always requires the first message to contain
-                # the audio configuration and authentication details
-                audio_config = options.to_pb_config()
-                req = pb.AudioStream(
-                    cid=int(self.config.cid),
-                    x_auth_token=self.config.api_key,
-                    config=audio_config,
-                )
-                yield req
-
-                for chunk in audio_stream:
-                    yield pb.AudioStream(
-                        cid=int(self.config.cid),
-                        x_auth_token=self.config.api_key,
-                        audio_content=chunk,
-                    )
-
-            response_stream = stub.DeepfakeDetection(_request_generator())
-            for response in response_stream:
-                resp_dict = MessageToDict(response, always_print_fields_with_no_presence=True)
-                response_data = StreamingResultResponse(**resp_dict)
-                yield response_data
+        self,
+        audio_stream: Iterator[bytes],
+        options: StreamingOptions,
+        raw: bool = False,
+        metrics: Optional[StreamMetrics] = None,
+    ) -> Iterator[Union[StreamingResultResponse, "pb.StreamResult"]]:
+        """Streams audio to the deepfake detection streaming API and yields results as they arrive.
+
+        Args:
+            audio_stream (Iterator[bytes]): The raw audio chunks, as bytes or any buffer
+                (memoryview, numpy array...), which is framed without intermediate copies.
+                Set ``options.frame_duration`` to coalesce tiny chunks into larger messages.
+            options (StreamingOptions): The audio configuration of the stream.
+            raw (bool): Yield the received ``pb.StreamResult`` protobuf messages as they are,
+                skipping the conversion to models. Defaults to False.
+            metrics (StreamMetrics, optional): Records the latencies of the stream, see
+                ``Behavioral.stream_audio``.
+        Returns:
+            Iterator[StreamingResultResponse]: The streaming results.
+        """
+        return self._stream("DeepfakeDetection", audio_stream, options, raw=raw, metrics=metrics)
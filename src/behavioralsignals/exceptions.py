@@ -0,0 +1,121 @@
+import time
+from typing import Optional
+from email.utils import parsedate_to_datetime
+
+from .models import APIError
+
+
+# Statuses for which the same request may succeed if repeated later
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Statuses with which the server signals it did not act on the request at all
+NOT_PROCESSED_STATUS_CODES = frozenset({429, 503})
+
+
+class BehavioralSignalsError(Exception):
+    """Base class for all errors raised by the SDK."""
+
+
+class APIRequestError(BehavioralSignalsError):
+    """A request to the API failed.
+
+    Attributes:
+        status_code: The HTTP status code, or None if no response was received.
+        code: The API error code, if the response contained one.
+        details: Extra error details returned by the API.
+        retry_after: Seconds the server asked us to wait before retrying, if any.
+        retry_safe: Whether the server is known not to have acted on the request, so that
+            even a non-idempotent request (e.g. an upload) can safely be repeated.
+    """
+
+    transient = False
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        code: Optional[int] = None,
+        details: Optional[dict] = None,
+        retry_after: Optional[float] = None,
+        retry_safe: bool = False,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.code = code
+        self.details = details
+        self.retry_after = retry_after
+        self.retry_safe = retry_safe
+
+
+class TransientAPIError(APIRequestError):
+    """A failure that may go away if the request is repeated later (5xx, 429, network errors)."""
+
+    transient = True
+
+
+class PermanentAPIError(APIRequestError):
+    """A failure that repeating the same request will not fix (4xx)."""
+
+
+class AuthenticationError(PermanentAPIError):
+    """The credentials were rejected (401/403)."""
+
+
+class RateLimitError(TransientAPIError):
+    """The API rejected the request because of rate limiting (429)."""
+
+
+class APIConnectionError(TransientAPIError):
+    """No response was received, because of a connection error or a timeout."""
+
+
+class CircuitOpenError(TransientAPIError):
+    """The request was not sent because the circuit breaker is open after repeated failures."""
+
+
+class TranscodeError(BehavioralSignalsError):
+    """ffmpeg failed to transcode an audio file before upload, or to decode it for streaming."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def error_from_response(response) -> APIRequestError:
+    """Builds the typed exception for a failed ``requests``/``httpx`` response."""
+    status = response.status_code
+    code, details = None, None
+    try:
+        error = APIError(**response.json())
+        code, details = error.code, error.details
+        message = f"API Error {error.code}: {error.message}"
+    except (TypeError, ValueError):
+        message = f"HTTP {status}: {response.text}"
+
+    if status == 429:
+        error_class = RateLimitError
+    elif status in TRANSIENT_STATUS_CODES:
+        error_class = TransientAPIError
+    elif status in (401, 403):
+        error_class = AuthenticationError
+    else:
+        error_class = PermanentAPIError
+
+    return error_class(
+        message,
+        status_code=status,
+        code=code,
+        details=details,
+        retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        retry_safe=status in NOT_PROCESSED_STATUS_CODES,
+    )
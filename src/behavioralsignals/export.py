@@ -0,0 +1,267 @@
+import os
+import re
+import json
+from typing import Set, List, Union, Optional
+from pathlib import Path
+
+from .models import ResultResponse
+
+
+_PART_NUMBER = re.compile(r"part-(\d+)\.parquet")
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    return float(value) if value is not None and value != "" else None
+
+
+def result_rows(pid: int, result: ResultResponse) -> List[dict]:
+    """Flattens the items of a result into rows, one per item, tagged with the pid.
+
+    Start/end times and posteriors are converted to floats, so every row has the same
+    typed layout: ``pid, id, task, level, start, end, final_label, prediction, embedding``,
+    where ``prediction`` is a list of ``{"label", "posterior"}`` records.
+    """
+    return [
+        {
+            "pid": pid,
+            "id": item.id,
+            "task": item.task,
+            "level": item.level,
+            "start": _to_float(item.startTime),
+            "end": _to_float(item.endTime),
+            "final_label": item.finalLabel,
+            "prediction": [
+                {"label": p.label, "posterior": _to_float(p.posterior)}
+                for p in item.prediction or []
+            ],
+            "embedding": item.embedding,
+        }
+        for item in result.results or []
+    ]
+
+
+class ResultSink:
+    """Interface of the destinations ``export_results`` appends rows to.
+
+    A sink receives all rows of a pid in the same ``write`` call, and ``write`` calls are
+    the row groups of the export. Each call also lists the pids it completes (including
+    pids without any row), and ``written_pids`` reports the pids that are safely stored, so
+    an interrupted export can resume without duplicating or losing rows.
+    """
+
+    def written_pids(self) -> Set[int]:
+        raise NotImplementedError
+
+    def write(self, rows: List[dict], pids: List[int]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _row_pid(line: bytes) -> int:
+    # Rows written by JSONLSink start with their pid, so most lines are not decoded at all
+    if line.startswith(b'{"pid":'):
+        end = line.find(b",", 7)
+        if end != -1:
+            try:
+                return int(line[7:end])
+            except ValueError:
+                pass
+    return json.loads(line)["pid"]
+
+
+def _read_manifest(path: Path) -> List[dict]:
+    """Reads the entries of a manifest, truncating away a partially written last line."""
+    if not path.exists():
+        return []
+    with open(path, "rb") as f:
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    if end < len(data):
+        os.truncate(path, end)
+    return [json.loads(line) for line in data[:end].splitlines()]
+
+
+def _append_manifest(path: Path, entry: dict) -> None:
+    with open(path, "ab") as f:
+        f.write(json.dumps(entry, separators=(",", ":")).encode() + b"\n")
+
+
+def _write_manifest(path: Path, entries: List[dict]) -> None:
+    """Replaces the entries of a manifest atomically."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    lines = (json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+    with open(tmp_path, "wb") as f:
+        f.write("".join(lines).encode())
+    os.replace(tmp_path, path)
+
+
+class JSONLSink(ResultSink):
+    """Appends rows to a JSON Lines file.
+
+    Completed pids are recorded in a ``<name>.manifest`` file next to it, together with the
+    size of the data file once their rows were written. When an existing file is opened,
+    anything written after the last recorded size (the rows of a write interrupted by a
+    crash) is truncated away, and only the pids missing from the manifest are exported again.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.path.with_name(self.path.name + ".manifest")
+        self._written = self._recover()
+
+    def _recover(self) -> Set[int]:
+        if not self.path.exists():
+            self.manifest_path.unlink(missing_ok=True)
+            return set()
+
+        size = self.path.stat().st_size
+        entries = _read_manifest(self.manifest_path)
+        if not entries and size:
+            # Written without a manifest: the complete lines are taken as the written pids
+            entries = [self._index_lines()]
+            _write_manifest(self.manifest_path, entries)
+
+        # Writes whose rows did not reach the disk (e.g. lost on a power failure) are undone
+        committed = [entry for entry in entries if entry["offset"] <= size]
+        if len(committed) < len(entries):
+            _write_manifest(self.manifest_path, committed)
+        offset = committed[-1]["offset"] if committed else 0
+        if size > offset:
+            os.truncate(self.path, offset)
+
+        pids = set()
+        for entry in committed:
+            pids.update(entry["pids"])
+        return pids
+
+    def _index_lines(self) -> dict:
+        pids, offset = set(), 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                pids.add(_row_pid(line))
+                offset += len(line)
+        return {"offset": offset, "pids": sorted(pids)}
+
+    def written_pids(self) -> Set[int]:
+        return set(self._written)
+
+    def write(self, rows: List[dict], pids: List[int]) -> None:
+        if not rows and not pids:
+            return
+        data = "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows)
+        with open(self.path, "ab") as f:
+            f.write(data.encode())
+            f.flush()
+            offset = f.tell()
+        # The pids only count as written once their rows are
+        _append_manifest(self.manifest_path, {"offset": offset, "pids": list(pids)})
+        self._written.update(pids)
+
+
+class ParquetSink(ResultSink):
+    """Writes rows to a directory of Parquet files, one row group per ``write``.
+
+    Every export run appends a new ``part-NNNNN.parquet`` file to the directory, since a
+    Parquet file cannot be extended once closed; together the files form one dataset (e.g.
+    ``pyarrow.dataset.dataset(directory)``). The pids completed in each part are recorded
+    in ``_manifest.jsonl`` (ignored by dataset readers). Parts left unreadable by an
+    interrupted run are renamed to ``_*.corrupt`` (also ignored) when the directory is opened
+    again, so their pids are exported again. Requires pyarrow.
+
+    Args:
+        directory (str or Path): The dataset directory.
+        compression (str): Parquet compression codec. Defaults to "zstd".
+    """
+
+    def __init__(self, directory: Union[str, Path], compression: str = "zstd"):
+        from .models import _import_pyarrow
+
+        pa = _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        self._pa, self._pq = pa, pq
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.directory / "_manifest.jsonl"
+        self.compression = compression
+        prediction = pa.struct([("label", pa.string()), ("posterior", pa.float32())])
+        self.schema = pa.schema(
+            [
+                ("pid", pa.int64()),
+                ("id", pa.string()),
+                ("task", pa.string()),
+                ("level", pa.string()),
+                ("start", pa.float64()),
+                ("end", pa.float64()),
+                ("final_label", pa.string()),
+                ("prediction", pa.list_(prediction)),
+                ("embedding", pa.string()),
+            ]
+        )
+        self._written = self._recover()
+        self._writer = None
+        self._part = None
+
+    def _parts(self) -> List[Path]:
+        return sorted(self.directory.glob("part-*.parquet"))
+
+    def _recover(self) -> Set[int]:
+        manifest = {}
+        for entry in _read_manifest(self.manifest_path):
+            manifest.setdefault(entry["part"], set()).update(entry["pids"])
+
+        pids, entries = set(), []
+        for part in self._parts():
+            try:
+                self._pq.read_metadata(part)
+            except self._pa.ArrowInvalid:
+                # Missing footer: the run writing this part did not finish
+                part.rename(part.with_name(f"_{part.name}.corrupt"))
+                continue
+            part_pids = manifest.get(part.name)
+            if part_pids is None:
+                # Written without a manifest
+                table = self._pq.read_table(part, columns=["pid"])
+                part_pids = set(table.column("pid").unique().to_pylist())
+            pids.update(part_pids)
+            entries.append({"part": part.name, "pids": sorted(part_pids)})
+
+        # Rewritten without the entries of corrupt parts
+        _write_manifest(self.manifest_path, entries)
+        return pids
+
+    def written_pids(self) -> Set[int]:
+        return set(self._written)
+
+    def write(self, rows: List[dict], pids: List[int]) -> None:
+        if not rows and not pids:
+            return
+        if self._writer is None:
+            # Numbered after all parts, corrupt ones included, so none is ever overwritten
+            names = (path.name for path in self.directory.glob("*part-*"))
+            numbers = [int(m.group(1)) for m in map(_PART_NUMBER.search, names) if m]
+            index = max(numbers) + 1 if numbers else 0
+            self._part = f"part-{index:05d}.parquet"
+            self._writer = self._pq.ParquetWriter(
+                self.directory / self._part, self.schema, compression=self.compression
+            )
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self.schema))
+        # Only valid once the part is closed: entries of parts left corrupt are dropped
+        _append_manifest(self.manifest_path, {"part": self._part, "pids": list(pids)})
+        self._written.update(pids)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,129 @@
+import functools
+from typing import Any, List, Union, Iterable, Iterator, Optional, AsyncIterable, AsyncIterator
+
+from .models import StreamingOptions
+
+
+# Key of ``AudioStream.audio_content`` (field 4, length-delimited) in the protobuf wire format
+_AUDIO_CONTENT_KEY = bytes([(4 << 3) | 2])
+_SERVICE = "behavioral_api.grpc.v1.BehavioralStreamingApi"
+
+AudioChunk = Union[bytes, bytearray, memoryview, Any]
+
+
+@functools.lru_cache(maxsize=4096)
+def _varint(value: int) -> bytes:
+    # Cached, since chunks of a stream mostly have the same few sizes
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _byte_view(chunk: AudioChunk) -> Union[bytes, memoryview]:
+    """Returns ``chunk`` as bytes or a flat byte view of any buffer-protocol object, copying
+    only if it is not contiguous (e.g. a strided numpy slice)."""
+    if type(chunk) is bytes:
+        return chunk
+    view = memoryview(chunk)
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    return view
+
+
+def method_path(rpc_name: str) -> str:
+    """Returns the full gRPC method path of a streaming RPC, e.g. for ``channel.stream_stream``."""
+    return f"/{_SERVICE}/{rpc_name}"
+
+
+class AudioFramer:
+    """Serializes the ``pb.AudioStream`` messages of one stream straight to wire bytes.
+
+    The fields repeated in every message (``cid`` and ``x_auth_token``) are serialized once,
+    and each audio message is that prefix plus the audio content, joined in one copy from
+    any buffer-protocol chunk (``bytes``, ``bytearray``, ``memoryview``, numpy arrays...).
+    No protobuf message is built per chunk and callers do not need ``tobytes()`` copies.
+
+    With ``options.frame_duration``, consecutive chunks smaller than that are coalesced into
+    one message, which cuts the per-message overhead of sources that produce tiny chunks.
+    The coalesced chunks are only read when their message is built, so they must not be
+    modified after being handed over (e.g. reused capture buffers need to be copied).
+
+    Args:
+        cid (int): The client ID.
+        api_key (str): The API key sent with every message.
+        options (StreamingOptions): The audio configuration of the stream.
+    """
+
+    def __init__(self, cid: int, api_key: str, options: StreamingOptions):
+        from .generated import api_pb2 as pb
+
+        header = pb.AudioStream(cid=cid, x_auth_token=api_key)
+        self.prefix = header.SerializeToString() + _AUDIO_CONTENT_KEY
+        header.config.CopyFrom(options.to_pb_config())
+        self.config_message = header.SerializeToString()
+        self.frame_bytes = options.frame_bytes()
+
+        self._pending: List[Union[bytes, memoryview]] = []
+        self._pending_bytes = 0
+        # Audio bytes in the messages built so far
+        self.audio_bytes = 0
+
+    def push(self, chunk: AudioChunk) -> Optional[bytes]:
+        """Adds a chunk, returning the next message once ``frame_bytes`` have accumulated."""
+        view = _byte_view(chunk)
+        size = len(view)
+        if not size:
+            return None
+        if not self._pending and size >= self.frame_bytes:
+            # Nothing to coalesce with, the message is built right away
+            self.audio_bytes += size
+            return b"".join((self.prefix, _varint(size), view))
+        self._pending.append(view)
+        self._pending_bytes += size
+        if self._pending_bytes < self.frame_bytes:
+            return None
+        return self.flush()
+
+    def flush(self) -> Optional[bytes]:
+        """Returns the message of the pending chunks, if any."""
+        if not self._pending:
+            return None
+        message = b"".join((self.prefix, _varint(self._pending_bytes), *self._pending))
+        self.audio_bytes += self._pending_bytes
+        self._pending, self._pending_bytes = [], 0
+        return message
+
+    def messages(self, audio_stream: Iterable[AudioChunk]) -> Iterator[bytes]:
+        """Yields the config message, then the audio messages of ``audio_stream``."""
+        yield self.config_message
+        for chunk in audio_stream:
+            message = self.push(chunk)
+            if message is not None:
+                yield message
+        message = self.flush()
+        if message is not None:
+            yield message
+
+    async def amessages(
+        self, audio_stream: Union[Iterable[AudioChunk], AsyncIterable[AudioChunk]]
+    ) -> AsyncIterator[bytes]:
+        """Async counterpart of ``messages``, accepting sync or async iterables."""
+        yield self.config_message
+        if hasattr(audio_stream, "__aiter__"):
+            async for chunk in audio_stream:
+                message = self.push(chunk)
+                if message is not None:
+                    yield message
+        else:
+            for chunk in audio_stream:
+                message = self.push(chunk)
+                if message is not None:
+                    yield message
+        message = self.flush()
+        if message is not None:
+            yield message
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, Tuple
+
+from .models import _import_numpy
+
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class IntervalIndex:
+    """Sorted index over the ``[start, end)`` time intervals of one task's result items.
+
+    Intervals are sorted by start time, next to the running maximum of their end times,
+    so both bounds of a query are found with binary searches: point and range queries take
+    O(log n + k) for the k candidates between them, which are the matches themselves when
+    the intervals do not nest (as with segments of one task and level). Items without a
+    start or end time are left out. Query results are row numbers into
+    ``ResultResponse.results`` (and ``to_columns()``), in start time order.
+
+    Args:
+        start (np.ndarray): Start times of the indexed items, in seconds.
+        end (np.ndarray): End times of the indexed items, in seconds.
+        rows (np.ndarray): Row number of each item.
+    """
+
+    def __init__(self, start: "np.ndarray", end: "np.ndarray", rows: "np.ndarray"):
+        np = _import_numpy()
+        valid = ~(np.isnan(start) | np.isnan(end))
+        start, end, rows = start[valid], end[valid], rows[valid]
+
+        order = np.argsort(start, kind="stable")
+        self.start = start[order]
+        self.end = end[order]
+        self.rows = rows[order]
+        # Non-decreasing, so the first interval that may still be open at t is searchable
+        self._max_end = np.maximum.accumulate(self.end) if len(self.end) else self.end
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _candidates(self, start: float, end: float) -> slice:
+        lo = int(self._max_end.searchsorted(start, side="right"))
+        hi = int(self.start.searchsorted(end, side="left"))
+        return slice(lo, max(lo, hi))
+
+    def at(self, t: float) -> "np.ndarray":
+        """Returns the rows of the intervals containing time ``t``, i.e. ``start <= t < end``."""
+        lo = int(self._max_end.searchsorted(t, side="right"))
+        window = slice(lo, max(lo, int(self.start.searchsorted(t, side="right"))))
+        matches = self.end[window] > t
+        return self.rows[window][matches]
+
+    def overlapping(self, start: float, end: float) -> "np.ndarray":
+        """Returns the rows of the intervals overlapping ``[start, end)``."""
+        window = self._candidates(start, end)
+        matches = self.end[window] > start
+        return self.rows[window][matches]
+
+    def join(self, other: "IntervalIndex") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Finds every pair of overlapping intervals between this index and ``other``.
+
+        All pairs are computed with array operations, without a Python loop per interval.
+
+        Args:
+            other (IntervalIndex): The index to join with, e.g. of another task.
+        Returns:
+            tuple: ``(left, right, overlap)`` arrays: the row in this index and the row in
+            ``other`` of each overlapping pair, and the duration of their overlap in seconds.
+        """
+        np = _import_numpy()
+        lo = other._max_end.searchsorted(self.start, side="right")
+        hi = other.start.searchsorted(self.end, side="left")
+        counts = np.maximum(hi - lo, 0)
+
+        # Expand every interval of this index into its window of candidates in ``other``
+        left = np.repeat(np.arange(len(self)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        right = np.repeat(lo, counts) + offsets
+
+        matches = other.end[right] > self.start[left]
+        left, right = left[matches], right[matches]
+        overlap = np.minimum(self.end[left], other.end[right]) - np.maximum(
+            self.start[left], other.start[right]
+        )
+        return self.rows[left], other.rows[right], overlap
@@ -0,0 +1,95 @@
+import re
+import json
+from typing import Iterable, Iterator
+
+
+# Bytes that change the parser state outside of JSON strings
+_STRUCTURAL = re.compile(rb'[\[\]{}"]')
+_BACKSLASH = ord("\\")
+
+
+def iter_array_objects(chunks: Iterable[bytes], key: str) -> Iterator[bytes]:
+    """Incrementally extracts the objects of an array from a streamed JSON document.
+
+    The document must be a JSON object holding the array under its top-level ``key``. Only
+    the structure of the document is tracked (nesting depth and string boundaries, found
+    with searches rather than byte by byte), and the raw JSON of each object in
+    the array is yielded as soon as it is complete, e.g. to be validated with
+    ``model_validate_json``. Memory use is bounded by the chunk size plus the largest object.
+
+    Args:
+        chunks (Iterable[bytes]): The document, in arbitrarily split pieces.
+        key (str): The top-level key of the array.
+    Returns:
+        Iterator[bytes]: The raw JSON of each object of the array, in order.
+    """
+    target = json.dumps(key).encode()
+    buffer = bytearray()
+    pos = 0
+    depth = 0
+    in_string = False
+    string_start = 0
+    # The last string closed directly inside the top-level object, i.e. the key of a following
+    # array (values are always preceded by their key)
+    last_key = None
+    in_array = False
+    object_start = None
+
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            if in_string:
+                # Strings hold the bulk of the data (e.g. embeddings), so they are skipped
+                # with a plain (memchr) search for the closing quote
+                quote = buffer.find(b'"', pos)
+                if quote == -1:
+                    pos = len(buffer)
+                    break
+                pos = quote + 1
+                # The string is kept in the buffer until it is closed, so all the backslashes
+                # escaping the quote are visible
+                escapes = 0
+                while buffer[quote - 1 - escapes] == _BACKSLASH:
+                    escapes += 1
+                if escapes % 2:
+                    continue
+                in_string = False
+                if depth == 1:
+                    last_key = bytes(buffer[string_start:pos])
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            char = match.group()
+            pos = match.end()
+            if char == b'"':
+                in_string = True
+                string_start = match.start()
+            elif char in (b"{", b"["):
+                depth += 1
+                if depth == 2 and char == b"[" and last_key == target:
+                    in_array = True
+                elif in_array and depth == 3 and char == b"{":
+                    object_start = match.start()
+            else:
+                depth -= 1
+                if in_array and depth == 2 and object_start is not None:
+                    yield bytes(buffer[object_start:pos])
+                    object_start = None
+                elif in_array and depth == 1:
+                    in_array = False
+
+        # Drop everything that was parsed and is not part of a pending object or key
+        keep = pos
+        if object_start is not None:
+            keep = min(keep, object_start)
+        if in_string:
+            keep = min(keep, string_start)
+        if keep:
+            del buffer[:keep]
+            pos -= keep
+            string_start -= keep
+            if object_start is not None:
+                object_start -= keep
@@ -0,0 +1,408 @@
+import queue
+import asyncio
+import threading
+import collections
+from typing import Any, List, Union, Literal, Iterable, Iterator, Optional, AsyncIterable
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import Field, BaseModel, ConfigDict
+
+from .base import BaseClient
+from .models import StreamingOptions
+from .metrics import StreamMetrics
+from .transport import _AioChannelPool
+from .exceptions import BehavioralSignalsError
+from .async_client import _stream_results
+
+
+_RPC_NAMES = {"behavioral": "StreamAudio", "deepfakes": "DeepfakeDetection"}
+# Marks the end of a pushed audio stream, and of the events once the manager is closed
+_END = object()
+
+
+class _PushedAudio:
+    """Buffer of the chunks pushed to one stream from any thread, consumed on the event loop.
+
+    ``put`` only appends under a lock and wakes the event loop when the stream is waiting
+    for audio, so producers do not wait for a round trip through the loop per chunk.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, size: int, metrics: Optional[StreamMetrics] = None
+    ):
+        self._loop = loop
+        self._size = size
+        self._metrics = metrics
+        self._chunks = collections.deque()
+        self._space = threading.Semaphore(size)
+        self._lock = threading.Lock()
+        self._ready = asyncio.Event()
+        self._waiting = False
+        self._closed = False
+
+    def put(self, chunk: Any) -> None:
+        self._space.acquire()
+        with self._lock:
+            if self._closed:
+                self._space.release()
+                raise KeyError("The stream has ended")
+            self._chunks.append(chunk)
+            depth = len(self._chunks)
+            wake, self._waiting = self._waiting, False
+        if wake:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        if self._metrics is not None:
+            self._metrics.record("send_queue", depth)
+
+    def close(self) -> None:
+        """Rejects further chunks and unblocks the producers waiting for space."""
+        with self._lock:
+            self._closed = True
+        self._space.release(self._size)
+
+    async def __aiter__(self):
+        while True:
+            with self._lock:
+                chunk = self._chunks.popleft() if self._chunks else None
+                if chunk is None:
+                    self._waiting = True
+                    self._ready.clear()
+            if chunk is None:
+                await self._ready.wait()
+                continue
+            self._space.release()
+            if chunk is _END:
+                return
+            yield chunk
+
+
+class _GuardedSource:
+    """Passes the chunks of an audio source through, keeping the exception it fails with.
+
+    grpc.aio consumes the audio on a task of its own and merely cancels the call when the
+    source fails, so the exception would otherwise never reach the stream.
+    """
+
+    def __init__(self, source: AsyncIterable[bytes]):
+        self._source = source
+        self.error: Optional[Exception] = None
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._source:
+                yield chunk
+        except Exception as e:
+            self.error = e
+            raise
+
+
+class StreamEvent(BaseModel):
+    """A result of one of the streams of a ``StreamManager``, tagged with the stream's key.
+
+    Every stream ends with one event without a result (``done``), holding the exception
+    that ended the stream, if any: an RPC or SDK error, or the exception raised by its
+    audio source. Streams removed with ``remove`` end without an error.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    key: Any = Field(..., description="The key the stream was added with")
+    result: Optional[Any] = Field(
+        None, description="The StreamingResultResponse (a pb.StreamResult with raw=True)"
+    )
+    error: Optional[Exception] = Field(None, description="The exception that ended the stream")
+
+    @property
+    def done(self) -> bool:
+        return self.result is None
+
+
+class StreamManager:
+    """Multiplexes many concurrent audio streams over a few shared gRPC channels.
+
+    All streams are driven by a single background thread running an asyncio event loop
+    with ``grpc.aio``, instead of one thread blocking on ``stream_audio`` per stream, so
+    hundreds of concurrent streams cost a few threads. Their results are fanned into one
+    thread-safe queue of ``StreamEvent``s, tagged with the key of their stream, which can
+    be consumed with ``get``, by iterating over the manager (until it is closed) or with
+    ``iter_until_idle`` (until every stream has ended). Streams can be added and
+    removed at any time, from any thread.
+
+    Audio comes either from a source given to ``add`` or is pushed with ``send``/``end``:
+
+    * async iterables are consumed on the event loop; they must not block it.
+    * other iterables (e.g. generators reading files) are pulled on a pool of
+      ``source_threads`` threads shared by all streams.
+    * without a source, chunks are pushed with ``send(key, chunk)`` (e.g. from the
+      callbacks of a telephony library) and the audio is ended with ``end(key)``.
+
+    At most ``max_streams`` streams are open at once; streams added beyond that wait for a
+    slot. The channels are configured by the client's ``Configuration`` (see
+    ``streaming_channels``), with servers typically allowing ~100 streams per channel.
+
+    The event queue is unbounded: the event loop never blocks on it, since that would stall
+    every stream. If the consumer falls behind, events pile up in memory; ``pending_events``
+    and the ``receive_queue`` histogram of ``metrics`` report how many are waiting.
+
+    Args:
+        client (BaseClient): A ``Client``, ``Behavioral`` or ``Deepfakes`` client whose
+            configuration (credentials, streaming url, channel options) is used.
+        max_streams (int): Maximum number of concurrently open streams. Defaults to 1000.
+        source_threads (int): Threads pulling chunks from blocking iterables. Defaults to 8.
+        push_buffer (int): Chunks buffered per pushed stream before ``send`` blocks.
+            Defaults to 64.
+        raw (bool): Emit the received ``pb.StreamResult`` messages as they are, skipping the
+            conversion to models. Defaults to False.
+        metrics (StreamMetrics, optional): Records the latencies of all streams, as well as
+            the depths of the pushed audio buffers (``send_queue``) and of the event queue
+            (``receive_queue``). Defaults to None.
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        max_streams: int = 1000,
+        source_threads: int = 8,
+        push_buffer: int = 64,
+        raw: bool = False,
+        metrics: Optional[StreamMetrics] = None,
+    ):
+        if max_streams < 1:
+            raise ValueError("max_streams must be at least 1")
+
+        self.config = client.config
+        self.max_streams = max_streams
+        self.push_buffer = push_buffer
+        self.raw = raw
+        self.metrics = metrics
+        self.events: queue.Queue[StreamEvent] = queue.Queue()
+
+        self._loop = asyncio.new_event_loop()
+        self._source_executor = ThreadPoolExecutor(
+            max_workers=source_threads, thread_name_prefix="stream-source"
+        )
+        # Modified on the event loop thread only
+        self._tasks: dict = {}
+        self._pushed: dict = {}
+        # Keys of the streams cancelled by ``remove`` or ``close``, which end without an error
+        self._removing: set = set()
+        self._channel_pool = _AioChannelPool(self.config)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._closed = False
+
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(ready,), name="stream-manager", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+
+    def _run_loop(self, ready: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        self._slots = asyncio.Semaphore(self.max_streams)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        ready.set()
+        self._loop.run_forever()
+
+    def _call(self, coroutine) -> Any:
+        """Runs ``coroutine`` on the event loop and waits for its result."""
+        if self._closed:
+            coroutine.close()
+            raise RuntimeError("The StreamManager is closed")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def add(
+        self,
+        key: Any,
+        options: StreamingOptions,
+        audio_stream: Optional[Union[Iterable[bytes], AsyncIterable[bytes]]] = None,
+        api: Literal["behavioral", "deepfakes"] = "behavioral",
+    ) -> None:
+        """Starts a new stream, whose results are emitted as events tagged with ``key``.
+
+        Args:
+            key (Any): Hashable identifier of the stream, e.g. the phone line.
+            options (StreamingOptions): The audio configuration of the stream.
+            audio_stream (Iterable[bytes] | AsyncIterable[bytes], optional): The audio
+                chunks. If omitted, they are pushed with ``send`` and ended with ``end``.
+            api (str): "behavioral" or "deepfakes". Defaults to "behavioral".
+        Raises:
+            ValueError: If a stream with this key is still running, or ``api`` is unknown.
+        """
+        if api not in _RPC_NAMES:
+            raise ValueError(f"api must be one of {list(_RPC_NAMES)}, got {api!r}")
+        self._call(self._add(key, options, audio_stream, _RPC_NAMES[api]))
+
+    async def _add(self, key, options, audio_stream, rpc_name):
+        if key in self._tasks:
+            raise ValueError(f"A stream with key {key!r} is already running")
+
+        if audio_stream is None:
+            audio_stream = self._pushed[key] = _PushedAudio(
+                self._loop, self.push_buffer, self.metrics
+            )
+        elif not hasattr(audio_stream, "__aiter__"):
+            audio_stream = self._iter_blocking(audio_stream)
+        audio_stream = _GuardedSource(audio_stream)
+
+        self._idle.clear()
+        self._tasks[key] = asyncio.create_task(self._run(key, options, audio_stream, rpc_name))
+
+    async def _iter_blocking(self, audio_stream: Iterable[bytes]):
+        iterator = iter(audio_stream)
+        while True:
+            chunk = await self._loop.run_in_executor(self._source_executor, next, iterator, _END)
+            if chunk is _END:
+                return
+            yield chunk
+
+    async def _run(self, key, options, audio_stream: _GuardedSource, rpc_name):
+        import grpc.aio
+
+        error = None
+        try:
+            async with self._slots:
+                channel = self._channel_pool.next()
+                async for result in _stream_results(
+                    channel, self.config, rpc_name, audio_stream, options, self.raw, self.metrics
+                ):
+                    self._emit(StreamEvent.model_construct(key=key, result=result))
+        except asyncio.CancelledError as e:
+            # Also raised when grpc cancels the call because the audio source failed
+            if key not in self._removing:
+                error = audio_stream.error or e
+        except (grpc.aio.AioRpcError, BehavioralSignalsError) as e:
+            error = audio_stream.error or e
+        finally:
+            pushed = self._pushed.pop(key, None)
+            if pushed is not None:
+                pushed.close()
+            self._removing.discard(key)
+            self._emit(StreamEvent.model_construct(key=key, result=None, error=error))
+            # Only after the final event, so that no stream is running once it is queued
+            self._tasks.pop(key, None)
+            if not self._tasks:
+                self._idle.set()
+
+    def _emit(self, event: StreamEvent):
+        self.events.put(event)
+        if self.metrics is not None:
+            self.metrics.record("receive_queue", self.events.qsize())
+
+    @property
+    def pending_events(self) -> int:
+        """The number of events waiting to be consumed (approximate, like ``Queue.qsize``)."""
+        return self.events.qsize()
+
+    def send(self, key: Any, chunk: bytes) -> None:
+        """Pushes an audio chunk to a stream added without a source.
+
+        Blocks while ``push_buffer`` chunks of the stream are waiting to be sent.
+
+        Raises:
+            KeyError: If no running stream with this key accepts pushed audio.
+        """
+        pushed = self._pushed.get(key)
+        if pushed is None:
+            raise KeyError(f"No running stream with key {key!r} accepts pushed audio")
+        pushed.put(chunk)
+
+    def end(self, key: Any) -> None:
+        """Ends the audio of a stream added without a source; its remaining results follow."""
+        self.send(key, _END)
+
+    def remove(self, key: Any) -> bool:
+        """Cancels a running stream. Returns False if there is no stream with this key."""
+        return self._call(self._remove(key))
+
+    async def _remove(self, key) -> bool:
+        task = self._tasks.get(key)
+        if task is None:
+            return False
+        self._removing.add(key)
+        task.cancel()
+        return True
+
+    @property
+    def active(self) -> List[Any]:
+        """The keys of the running (or waiting) streams."""
+        return self._call(self._active())
+
+    async def _active(self) -> List[Any]:
+        return list(self._tasks)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Waits until no stream is running, e.g. after the sources of all streams ended.
+
+        Raises:
+            TimeoutError: If streams are still running after ``timeout`` seconds.
+        """
+        future = asyncio.run_coroutine_threadsafe(self._idle.wait(), self._loop)
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def get(self, timeout: Optional[float] = None) -> StreamEvent:
+        """Returns the next event of any stream.
+
+        Raises:
+            queue.Empty: If no event arrives within ``timeout`` seconds.
+        """
+        return self.events.get(timeout=timeout)
+
+    def __iter__(self) -> Iterator[StreamEvent]:
+        """Yields the events of all streams, until the manager is closed."""
+        while True:
+            event = self.events.get()
+            if event is _END:
+                self.events.put(_END)
+                return
+            yield event
+
+    def iter_until_idle(self) -> Iterator[StreamEvent]:
+        """Yields the events of all streams, until no stream is running and all their events
+        were yielded, e.g. to consume the results of streams whose audio ends.
+
+        Streams added while iterating are waited for too. Meant for a single consumer: events
+        taken from the queue by another one are not yielded here.
+        """
+        while True:
+            # A stream is removed from the running ones only after queueing its final event
+            if not self._tasks and self.events.empty():
+                return
+            event = self.events.get()
+            if event is _END:
+                self.events.put(_END)
+                return
+            yield event
+
+    def close(self) -> None:
+        """Cancels the running streams, closes the channels and stops the event loop."""
+        if self._closed:
+            return
+        self._call(self._shutdown())
+        self._closed = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._source_executor.shutdown(wait=False, cancel_futures=True)
+        self.events.put(_END)
+
+    async def _shutdown(self):
+        tasks = list(self._tasks.values())
+        self._removing.update(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._channel_pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,237 @@
+import time
+import bisect
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Tuple,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    AsyncIterable,
+    AsyncIterator,
+)
+
+
+if TYPE_CHECKING:
+    from .framing import AudioFramer
+    from .generated import api_pb2 as pb
+
+
+# ~26% wide buckets from 1 ms to 1000 s, for latencies in seconds
+LATENCY_BOUNDS = tuple(10 ** (k / 10) for k in range(-30, 31))
+# Powers of two, for queue depths
+DEPTH_BOUNDS = (0,) + tuple(2**k for k in range(21))
+# Sends older than this many seconds of audio before the latest result are forgotten
+_LAG_HORIZON = 60.0
+
+
+class Histogram:
+    """Thread-safe histogram of observations in fixed buckets.
+
+    Recording an observation is a bisection and a few additions, so histograms can be fed
+    from hot paths; quantiles are estimated from the buckets (within one bucket's width).
+
+    Args:
+        bounds (Sequence[float], optional): Increasing upper bounds of the buckets; larger
+            observations fall in an overflow bucket. Defaults to ``LATENCY_BOUNDS``.
+    """
+
+    def __init__(self, bounds: Optional[Sequence[float]] = None):
+        self.bounds = tuple(LATENCY_BOUNDS if bounds is None else bounds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.sum = 0.0
+            self.min = float("inf")
+            self.max = float("-inf")
+
+    def record(self, value: float, count: int = 1) -> None:
+        """Records ``count`` observations of ``value``."""
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += count
+            self.count += count
+            self.sum += value * count
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    @property
+    def buckets(self) -> List[Tuple[float, int]]:
+        """The ``(upper bound, count)`` of every bucket, the overflow bucket bound being inf."""
+        with self._lock:
+            counts = list(self._counts)
+        return list(zip(self.bounds + (float("inf"),), counts))
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates the ``q`` quantile (e.g. 0.99) as the upper bound of its bucket.
+
+        Returns:
+            float: The estimate, clamped to the observed range, or None without observations.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        with self._lock:
+            if not self.count:
+                return None
+            rank, seen = q * self.count, 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if count and seen >= rank:
+                    break
+            bound = self.bounds[index] if index < len(self.bounds) else self.max
+            return min(max(bound, self.min), self.max)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Count, mean, max and the 50th, 90th and 99th percentiles, e.g. for logging."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max if self.count else None,
+        }
+
+
+class StreamMetrics:
+    """Opt-in latency instrumentation of streaming sessions.
+
+    Pass one instance to ``stream_audio(..., metrics=...)`` of the sync and async clients,
+    or to a ``StreamManager``, to record into its histograms (shared by all the streams it
+    is passed to):
+
+    * ``time_to_first_result``: seconds from the start of a stream to its first result.
+    * ``result_lag``: for every result item, seconds between sending the audio up to the
+      item's end time (``ResultItem.et``) and receiving the item.
+    * ``audio_backlog``: seconds of audio sent but not yet covered by a result, sampled at
+      every received message. A growing backlog means the server is falling behind.
+    * ``send_queue``: chunks waiting to be sent in the buffer of a stream pushed to with
+      ``StreamManager.send``, sampled at every push.
+    * ``receive_queue``: events waiting in the queue of a ``StreamManager``, sampled at every
+      event.
+
+    Without ``metrics``, streams are not instrumented and pay nothing.
+
+    Args:
+        callback (Callable, optional): Called as ``callback(name, value)`` for every
+            observation (``name`` being one of the histograms above), e.g. to feed an
+            external metrics system or to alert when ``result_lag`` exceeds an SLO. It runs
+            on the streaming threads and should return quickly.
+    """
+
+    NAMES = ("time_to_first_result", "result_lag", "audio_backlog", "send_queue", "receive_queue")
+
+    def __init__(self, callback: Optional[Callable[[str, float], None]] = None):
+        self.callback = callback
+        self.time_to_first_result = Histogram()
+        self.result_lag = Histogram()
+        self.audio_backlog = Histogram()
+        self.send_queue = Histogram(DEPTH_BOUNDS)
+        self.receive_queue = Histogram(DEPTH_BOUNDS)
+
+    def record(self, name: str, value: float, count: int = 1) -> None:
+        """Records ``count`` observations of ``value`` into the histogram ``name``."""
+        getattr(self, name).record(value, count)
+        if self.callback is not None:
+            for _ in range(count):
+                self.callback(name, value)
+
+    def summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """The ``Histogram.summary`` of every histogram, by name."""
+        return {name: getattr(self, name).summary() for name in self.NAMES}
+
+    def reset(self) -> None:
+        for name in self.NAMES:
+            getattr(self, name).reset()
+
+    def _start_stream(self, sample_rate: int) -> "_StreamTimer":
+        return _StreamTimer(self, sample_rate)
+
+
+class _StreamTimer:
+    """Relates the audio timeline of one stream to the wall clock.
+
+    The send time of every message is kept with the end of the audio it completes, so a
+    result ending at ``et`` is timed against the send of the message holding that audio.
+    """
+
+    def __init__(self, metrics: StreamMetrics, sample_rate: int):
+        self._metrics = metrics
+        # LINEAR_PCM is 16-bit mono
+        self._bytes_per_second = sample_rate * 2
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+        self._ends: List[float] = []
+        self._times: List[float] = []
+        self._sent = 0.0
+        self._latest = 0.0
+        self._received = False
+
+    def sent(self, audio_bytes: int) -> None:
+        """Records the hand-off of a message, ``audio_bytes`` being the audio sent so far."""
+        end = audio_bytes / self._bytes_per_second
+        with self._lock:
+            if end > self._sent:
+                self._sent = end
+                self._ends.append(end)
+                self._times.append(time.monotonic())
+
+    def received(self, message: "pb.StreamResult") -> None:
+        now = time.monotonic()
+        record = self._metrics.record
+        if not self._received:
+            self._received = True
+            record("time_to_first_result", now - self._start)
+
+        # The items of a message mostly share their end time (one per task)
+        end_times: Dict[str, int] = {}
+        for result in message.result:
+            end_times[result.end_time] = end_times.get(result.end_time, 0) + 1
+
+        lags = []
+        with self._lock:
+            if self._ends:
+                for end_time, count in end_times.items():
+                    et = float(end_time)
+                    index = min(bisect.bisect_left(self._ends, et), len(self._ends) - 1)
+                    lags.append((now - self._times[index], count))
+                    self._latest = max(self._latest, et)
+                self._forget(self._latest - _LAG_HORIZON)
+            backlog = max(self._sent - self._latest, 0.0)
+
+        for lag, count in lags:
+            record("result_lag", lag, count)
+        record("audio_backlog", backlog)
+
+    def _forget(self, before: float) -> None:
+        # Drops old sends in batches, keeping at least the last one
+        index = min(bisect.bisect_left(self._ends, before), len(self._ends) - 1)
+        if index > 1024 and index * 2 > len(self._ends):
+            del self._ends[:index]
+            del self._times[:index]
+
+    def track(self, framer: "AudioFramer", messages: Iterable[bytes]) -> Iterator[bytes]:
+        """Passes the messages of ``framer`` through, recording when each one is handed over."""
+        for message in messages:
+            self.sent(framer.audio_bytes)
+            yield message
+
+    async def atrack(
+        self, framer: "AudioFramer", messages: AsyncIterable[bytes]
+    ) -> AsyncIterator[bytes]:
+        """Async counterpart of ``track``."""
+        async for message in messages:
+            self.sent(framer.audio_bytes)
+            yield message
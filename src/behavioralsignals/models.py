@@ -1,13 +1,107 @@
 import json
 from enum import IntEnum
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Literal, Optional
 from pathlib import Path
 from datetime import date
 from datetime import datetime as datetime_aliased
 
-from pydantic import Field, BaseModel, ConfigDict, computed_field, field_validator
-
-from .generated import api_pb2 as pb
+from pydantic import Field, BaseModel, ConfigDict, PrivateAttr, computed_field, field_validator
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+    from .compact import CompactResult
+    from .generated import api_pb2 as pb
+    from .intervals import IntervalIndex
+
+
+# Names of the pb.Level values, filled on first use so protobuf is only loaded for streaming
+_LEVEL_NAMES = {}
+
+
+def _level_name(level: int) -> str:
+    if not _LEVEL_NAMES:
+        from .generated import api_pb2 as pb
+
+        _LEVEL_NAMES.update({value: name for name, value in pb.Level.items()})
+    return _LEVEL_NAMES.get(level, str(level))
+
+
+def _inference_result_fields(result: "pb.InferenceResult") -> dict:
+    """Reads the fields of a ``pb.InferenceResult`` as ``MessageToDict`` would report them."""
+    fields = {
+        "id": result.id,
+        "startTime": result.start_time,
+        "endTime": result.end_time,
+        "task": result.task,
+        "prediction": [
+            {"label": p.label, "posterior": p.posterior}
+            if p.HasField("posterior")
+            else {"label": p.label}
+            for p in result.prediction
+        ],
+        "finalLabel": result.final_label,
+    }
+    # Unset optional fields are left out
+    if result.HasField("level"):
+        fields["level"] = _level_name(result.level)
+    if result.HasField("embedding"):
+        fields["embedding"] = result.embedding
+    return fields
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Array accessors require numpy. Install it with `pip install behavioralsignals[numpy]`."
+        ) from e
+    return numpy
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow export requires pyarrow. Install it with `pip install behavioralsignals[arrow]`."
+        ) from e
+    return pyarrow
+
+
+def _to_float(value: Optional[str]) -> float:
+    return float(value) if value is not None else float("nan")
+
+
+def _decode_embeddings(embeddings: List[str]) -> "np.ndarray":
+    """Decodes stringified embeddings of equal length into a float32 ``(n, d)`` matrix.
+
+    The strings are parsed by numpy's ``loadtxt``, one row per embedding, without building
+    intermediate Python lists or floats.
+    """
+    np = _import_numpy()
+    bodies = []
+    lengths = set()
+    for embedding in embeddings:
+        body = embedding.strip()
+        if body.startswith("[") and body.endswith("]"):
+            body = body[1:-1]
+        bodies.append(body)
+        lengths.add(body.count(",") + 1 if body.strip() else 0)
+
+    if len(lengths) > 1:
+        raise ValueError(f"Embeddings have different lengths: {sorted(lengths)}")
+    dim = lengths.pop() if lengths else 0
+    if not dim:
+        return np.empty((len(bodies), 0), dtype=np.float32)
+
+    try:
+        return np.loadtxt(bodies, dtype=np.float32, delimiter=",", ndmin=2)
+    except ValueError as e:
+        raise ValueError("Malformed embedding, expected a stringified array of numbers") from e
 
 
 class ProcessStatus(IntEnum):
@@ -35,9 +129,24 @@ class StreamingOptions(BaseModel):
         "Use 'segment' for segment-level results, 'utterance' for utterance-level results. "
         "Use 'all' for both segment and utterance results.",
     )
+    frame_duration: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Coalesce consecutive audio chunks into messages of at least this many "
+        "seconds of audio. None sends every chunk as its own message.",
+    )
+
+    def frame_bytes(self) -> int:
+        """Returns the number of audio bytes in ``frame_duration`` (0 without coalescing)."""
+        if self.frame_duration is None:
+            return 0
+        # LINEAR_PCM is 16-bit mono
+        return int(self.frame_duration * self.sample_rate) * 2
 
-    def to_pb_config(self) -> pb.AudioConfig:
+    def to_pb_config(self) -> "pb.AudioConfig":
         """Convert the level to a protobuf Level enum."""
+        from .generated import api_pb2 as pb
+
         level = {
             "segment": pb.Level.segment,
             "utterance": pb.Level.utterance,
@@ -51,6 +160,15 @@ class StreamingOptions(BaseModel):
         return config
 
 
+class TranscodeOptions(BaseModel):
+    codec: Literal["flac", "opus"] = Field(
+        "flac", description="Codec to encode to: lossless FLAC or (much smaller) lossy Opus."
+    )
+    sample_rate: int = Field(16000, gt=0, description="Sample rate (Hz) to resample to.")
+    channels: int = Field(1, ge=1, le=2, description="Number of channels to downmix to.")
+    bitrate: str = Field("32k", description="Target bitrate, used only for Opus.")
+
+
 class AudioUploadParams(BaseModel):
     file_path: str = Field(..., description="Path to the audio file to upload")
     name: Optional[str] = Field(None, description="Optional name for the job request")
@@ -147,6 +265,42 @@ class ProcessItem(BaseModel):
     def is_pending(self) -> bool:
         return self.status == ProcessStatus.PENDING
 
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the process has reached a final state and will not change anymore."""
+        return self.status is not None and self.status not in (
+            ProcessStatus.PENDING,
+            ProcessStatus.PROCESSING,
+        )
+
+
+class UploadResult(BaseModel):
+    """Outcome of a single upload submitted through ``upload_many``"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(..., description="Position of the source in the submitted sequence")
+    source: str = Field(..., description="The file path or presigned url that was uploaded")
+    process: Optional[ProcessItem] = Field(None, description="The created process, on success")
+    error: Optional[Exception] = Field(None, description="The exception raised, on failure")
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ExportSummary(BaseModel):
+    """Outcome of an ``export_results`` run"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    exported: int = Field(0, description="Number of pids whose results were written")
+    skipped: int = Field(0, description="Number of pids already in the sink, not fetched again")
+    rows: int = Field(0, description="Number of rows written")
+    failed: Dict[int, Exception] = Field(
+        default_factory=dict, description="The exception raised for each pid that failed"
+    )
+
 
 class ProcessListParams(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
@@ -227,6 +381,26 @@ class ResultItem(BaseModel):
         example="[11.614513397216797, -15.228992462158203, -4.92175817489624, ...]",
     )
 
+    _embedding_array: Any = PrivateAttr(None)
+
+    @classmethod
+    def from_pb(cls, result: "pb.InferenceResult") -> "ResultItem":
+        """Converts a streamed ``pb.InferenceResult``, see ``StreamingResultResponse.from_pb``."""
+        return cls.model_validate(_inference_result_fields(result))
+
+    def embedding_array(self) -> Optional["np.ndarray"]:
+        """Returns the embedding as a read-only float32 array, or None if there is none.
+
+        The embedding is decoded on first access and cached on the item. Requires numpy.
+        """
+        if self.embedding is None:
+            return None
+        if self._embedding_array is None:
+            array = _decode_embeddings([self.embedding])[0]
+            array.flags.writeable = False
+            self._embedding_array = array
+        return self._embedding_array
+
     @computed_field
     @property
     def st(self) -> float:
@@ -238,6 +412,140 @@ class ResultItem(BaseModel):
         return float(self.endTime)
 
 
+class ResultColumns(BaseModel):
+    """Typed columnar view of the items of a result, built by ``ResultResponse.to_columns``.
+
+    Row ``i`` of every column describes ``results[i]``. Categorical columns hold int32 codes
+    into their category list (-1 when missing), times are float64 seconds and posteriors
+    float32, with NaN when missing. All arrays are read-only.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    pid: Optional[int] = Field(None, description="Unique ID of the processing job")
+    ids: List[Optional[str]] = Field(..., description="The id of each segment/utterance")
+    tasks: List[str] = Field(..., description="Categories of the task column")
+    levels: List[str] = Field(..., description="Categories of the level column")
+    labels: List[str] = Field(..., description="Categories of the final_label column")
+    classes: List[str] = Field(..., description="Predicted classes, the posterior columns")
+    task: Any = Field(..., description="int32 codes into tasks")
+    level: Any = Field(..., description="int32 codes into levels")
+    final_label: Any = Field(..., description="int32 codes into labels")
+    start: Any = Field(..., description="float64 start times in seconds")
+    end: Any = Field(..., description="float64 end times in seconds")
+    posterior: Any = Field(
+        ..., description="float32 (n, len(classes)) matrix of posteriors, NaN if not predicted"
+    )
+
+    @classmethod
+    def from_items(cls, items: List[ResultItem], pid: Optional[int] = None) -> "ResultColumns":
+        np = _import_numpy()
+        tasks, levels, labels, classes = {}, {}, {}, {}
+
+        def _code(categories: dict, value: Optional[str]) -> int:
+            if value is None:
+                return -1
+            return categories.setdefault(value, len(categories))
+
+        task, level, final_label, start, end, predictions = [], [], [], [], [], []
+        for item in items:
+            task.append(_code(tasks, item.task))
+            level.append(_code(levels, item.level))
+            final_label.append(_code(labels, item.finalLabel))
+            start.append(_to_float(item.startTime))
+            end.append(_to_float(item.endTime))
+            predictions.append(
+                [(_code(classes, p.label), _to_float(p.posterior)) for p in item.prediction or []]
+            )
+
+        posterior = np.full((len(items), len(classes)), np.nan, dtype=np.float32)
+        for row, prediction in enumerate(predictions):
+            for column, value in prediction:
+                if column >= 0:
+                    posterior[row, column] = value
+
+        columns = {
+            "task": np.array(task, dtype=np.int32),
+            "level": np.array(level, dtype=np.int32),
+            "final_label": np.array(final_label, dtype=np.int32),
+            "start": np.array(start, dtype=np.float64),
+            "end": np.array(end, dtype=np.float64),
+            "posterior": posterior,
+        }
+        for array in columns.values():
+            array.flags.writeable = False
+        return cls(
+            pid=pid,
+            ids=[item.id for item in items],
+            tasks=list(tasks),
+            levels=list(levels),
+            labels=list(labels),
+            classes=list(classes),
+            **columns,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def mask(
+        self,
+        task: Optional[str] = None,
+        level: Optional[str] = None,
+        final_label: Optional[str] = None,
+    ) -> "np.ndarray":
+        """Returns a boolean mask of the rows matching all the given values.
+
+        Args:
+            task (str, optional): Keep rows of this task, e.g. "emotion".
+            level (str, optional): Keep rows of this level ("segment"/"utterance").
+            final_label (str, optional): Keep rows with this final label.
+        Returns:
+            np.ndarray: Boolean array of length ``len(self)``.
+        """
+        np = _import_numpy()
+        mask = np.ones(len(self), dtype=bool)
+        for codes, categories, value in (
+            (self.task, self.tasks, task),
+            (self.level, self.levels, level),
+            (self.final_label, self.labels, final_label),
+        ):
+            if value is not None:
+                code = categories.index(value) if value in categories else -2
+                mask &= codes == code
+        return mask
+
+    def posteriors(self, label: str) -> "np.ndarray":
+        """Returns the posterior column of a class, NaN for rows that do not predict it."""
+        np = _import_numpy()
+        if label not in self.classes:
+            return np.full(len(self), np.nan, dtype=np.float32)
+        return self.posterior[:, self.classes.index(label)]
+
+    def to_arrow(self) -> "pa.Table":
+        """Converts the columns to a ``pyarrow.Table``, see ``ResultResponse.to_arrow``."""
+        pa = _import_pyarrow()
+        np = _import_numpy()
+
+        def _dictionary(codes, categories):
+            return pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), pa.array(categories, type=pa.string())
+            )
+
+        columns = {
+            "pid": pa.array([self.pid] * len(self), type=pa.int64()),
+            "id": pa.array(self.ids, type=pa.string()),
+            "task": _dictionary(self.task, self.tasks),
+            "level": _dictionary(self.level, self.levels),
+            "start": pa.array(self.start),
+            "end": pa.array(self.end),
+            "final_label": _dictionary(self.final_label, self.labels),
+        }
+        for i, label in enumerate(self.classes):
+            column = self.posterior[:, i]
+            columns[f"posterior_{label}"] = pa.array(column, mask=np.isnan(column))
+        return pa.table(columns)
+
+
 class ResultResponse(BaseModel):
     pid: Optional[int] = Field(None, description="Unique ID for the processing job")
     cid: Optional[int] = Field(None, description="Client ID that requested the processing")
@@ -245,6 +553,116 @@ class ResultResponse(BaseModel):
     message: Optional[str] = Field(None, description="Description of status")
     results: Optional[List[ResultItem]] = None
 
+    _columns: Optional[ResultColumns] = PrivateAttr(None)
+    _intervals: dict = PrivateAttr(default_factory=dict)
+
+    def to_columns(self) -> ResultColumns:
+        """Returns a typed columnar view of ``results`` for vectorized filtering and aggregation.
+
+        The string fields of all items are parsed in one pass on the first call and the view
+        is cached, so it does not reflect later changes to ``results``. Requires numpy.
+
+        Returns:
+            ResultColumns: Categorical task/level/final label codes, float start/end times
+            and a per-class posterior matrix.
+        """
+        if self._columns is None:
+            self._columns = ResultColumns.from_items(self.results or [], pid=self.pid)
+        return self._columns
+
+    def to_arrow(self) -> "pa.Table":
+        """Returns the results as a ``pyarrow.Table``, one row per item.
+
+        Task, level and final label are dictionary-encoded, start/end are float64 seconds and
+        every class gets a nullable ``posterior_<label>`` column. Requires numpy and pyarrow.
+        """
+        return self.to_columns().to_arrow()
+
+    def to_compact(self) -> "CompactResult":
+        """Returns a memory-efficient slotted copy of this result, see ``CompactResult``."""
+        from .compact import CompactResult
+
+        return CompactResult.from_model(self)
+
+    def interval_index(self, task: str, level: Optional[str] = None) -> "IntervalIndex":
+        """Returns the (cached) interval index over the start/end times of a task's items.
+
+        Args:
+            task (str): The task to index, e.g. "asr" or "emotion".
+            level (str, optional): Only index items of this level ("segment"/"utterance").
+        Returns:
+            IntervalIndex: Answers point, range and join queries with row numbers into
+            ``results``.
+        """
+        from .intervals import IntervalIndex
+
+        key = (task, level)
+        if key not in self._intervals:
+            np = _import_numpy()
+            columns = self.to_columns()
+            rows = np.flatnonzero(columns.mask(task=task, level=level))
+            self._intervals[key] = IntervalIndex(columns.start[rows], columns.end[rows], rows)
+        return self._intervals[key]
+
+    def items_at(self, task: str, t: float, level: Optional[str] = None) -> List[ResultItem]:
+        """Returns the items of a task active at time ``t`` (in seconds)."""
+        return [self.results[row] for row in self.interval_index(task, level).at(t)]
+
+    def items_overlapping(
+        self, task: str, start: float, end: float, level: Optional[str] = None
+    ) -> List[ResultItem]:
+        """Returns the items of a task overlapping the ``[start, end)`` time range (in seconds)."""
+        index = self.interval_index(task, level)
+        return [self.results[row] for row in index.overlapping(start, end)]
+
+    def interval_join(
+        self,
+        left_task: str,
+        right_task: str,
+        left_level: Optional[str] = None,
+        right_level: Optional[str] = None,
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Pairs up the time-overlapping items of two tasks, e.g. asr words with emotions.
+
+        Args:
+            left_task (str): The first task, e.g. "asr".
+            right_task (str): The second task, e.g. "emotion".
+            left_level (str, optional): Only join items of the first task with this level.
+            right_level (str, optional): Only join items of the second task with this level.
+        Returns:
+            tuple: ``(left, right, overlap)`` arrays: the rows (into ``results`` and
+            ``to_columns()``) of each overlapping pair and their overlap in seconds.
+        """
+        left = self.interval_index(left_task, left_level)
+        return left.join(self.interval_index(right_task, right_level))
+
+    def embedding_matrix(self, task: str, level: Optional[str] = None) -> "np.ndarray":
+        """Stacks the embeddings of all items of a task into one float32 ``(n, d)`` matrix.
+
+        Row ``i`` belongs to the ``i``-th item of ``results`` with this task (and level, if
+        given) that has an embedding. All embeddings are decoded in a single pass, and each
+        item caches its row as a view, so later ``embedding_array`` calls are free. The
+        matrix is shared with the items and therefore read-only. Requires numpy.
+
+        Args:
+            task (str): The task to collect embeddings for, e.g. "diarization" or "features".
+            level (str, optional): Only include items of this level ("segment"/"utterance").
+        Returns:
+            np.ndarray: The contiguous ``(n, d)`` embedding matrix.
+        """
+        items = [
+            item
+            for item in self.results or []
+            if item.task == task
+            and item.embedding is not None
+            and (level is None or item.level == level)
+        ]
+        matrix = _decode_embeddings([item.embedding for item in items])
+        matrix.flags.writeable = False
+        for item, row in zip(items, matrix):
+            item._embedding_array = row
+        return matrix
+
 
 class StreamingResultResponse(BaseModel):
     pid: Optional[int] = Field(None, description="Unique ID for the processing job")
@@ -255,3 +673,20 @@ class StreamingResultResponse(BaseModel):
     results: Optional[List[ResultItem]] = Field(
         None, alias="result", description="List of result items"
     )
+
+    @classmethod
+    def from_pb(cls, message: "pb.StreamResult") -> "StreamingResultResponse":
+        """Converts a streamed ``pb.StreamResult`` into the equivalent model.
+
+        The typed fields of the message are read directly into a plain dict that pydantic
+        validates in one call, instead of generically serializing the message with
+        ``MessageToDict`` (which also stringifies the 64-bit ids) and validating that.
+        """
+        return cls.model_validate(
+            {
+                "pid": message.pid,
+                "cid": message.cid,
+                "messageId": message.message_id,
+                "result": [_inference_result_fields(result) for result in message.result],
+            }
+        )
@@ -0,0 +1,115 @@
+import os
+import uuid
+from typing import Callable, Iterator, Optional, AsyncIterator
+
+
+class MultipartEncoder:
+    """Streams a ``multipart/form-data`` body with one file part in constant memory.
+
+    ``requests`` encodes ``files=`` uploads entirely in memory before sending them. This
+    encoder instead yields the body piece by piece, reading the file with ``readinto`` into
+    a single reusable buffer, so memory use does not depend on the file size. It defines
+    ``__len__``, so ``requests`` sends it with a regular ``Content-Length`` header, and every
+    iteration restarts from the beginning of the file, so a retried request resends the
+    whole body. Async iteration (for ``httpx.AsyncClient``) reads the file on a worker
+    thread, so the event loop is never blocked on disk I/O.
+
+    Args:
+        fields (dict): Form fields sent before the file, as ``requests`` would encode them.
+        file_field (str): The name of the file part.
+        file_path (str): Path of the file to upload.
+        filename (str, optional): The filename reported to the server. Defaults to the basename.
+        chunk_size (int): Size of the reusable read buffer in bytes. Defaults to 1 MiB.
+        progress (Callable, optional): Called as ``progress(bytes_sent, total_bytes)`` whenever
+            a piece of the body has been handed to the connection.
+    """
+
+    def __init__(
+        self,
+        fields: dict,
+        file_field: str,
+        file_path: str,
+        filename: Optional[str] = None,
+        chunk_size: int = 1 << 20,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        filename = (filename or os.path.basename(file_path)).replace('"', "%22")
+        parts = []
+        for name, value in fields.items():
+            parts.append(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            )
+        parts.append(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n\r\n'
+        )
+        self._head = "".join(parts).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._file_size = os.path.getsize(file_path)
+
+    def __len__(self) -> int:
+        return len(self._head) + self._file_size + len(self._tail)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        total = len(self)
+        sent = 0
+
+        def _report(n: int):
+            nonlocal sent
+            sent += n
+            if self.progress is not None:
+                self.progress(sent, total)
+
+        yield memoryview(self._head)
+        _report(len(self._head))
+
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        with open(self.file_path, "rb") as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                # The same buffer is refilled on the next iteration, after the connection
+                # has written this piece out
+                yield view[:n]
+                _report(n)
+
+        yield memoryview(self._tail)
+        _report(len(self._tail))
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        import asyncio
+
+        total = len(self)
+        sent = len(self._head)
+        yield self._head
+        if self.progress is not None:
+            self.progress(sent, total)
+
+        loop = asyncio.get_running_loop()
+        f = await loop.run_in_executor(None, open, self.file_path, "rb")
+        try:
+            while True:
+                # A new chunk per read, since the connection may still hold the previous one
+                chunk = await loop.run_in_executor(None, f.read, self.chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+                sent += len(chunk)
+                if self.progress is not None:
+                    self.progress(sent, total)
+        finally:
+            f.close()
+
+        yield self._tail
+        if self.progress is not None:
+            self.progress(total, total)
@@ -0,0 +1,112 @@
+import time
+import random
+import threading
+from typing import Optional
+
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+from .exceptions import APIRequestError, CircuitOpenError
+
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before repeating a failed request.
+
+    Only transient failures (5xx, 429, timeouts, connection errors) are retried. Idempotent
+    requests are retried freely, while uploads are only retried when the server is known not
+    to have acted on them (429/503 responses or failures to connect), since repeating them
+    otherwise may create duplicate processes. Set ``retry_unsafe=True`` to lift that rule.
+    """
+
+    max_retries: int = Field(3, ge=0)
+    backoff_factor: float = Field(0.5, ge=0)
+    max_backoff: float = Field(30.0, ge=0)
+    respect_retry_after: bool = True
+    retry_unsafe: bool = False
+
+    def get_delay(self, attempt: int, method: str, error: APIRequestError) -> Optional[float]:
+        """Returns the seconds to sleep before retry number ``attempt + 1``, or None to give up."""
+        if attempt >= self.max_retries or not error.transient:
+            return None
+        if method not in IDEMPOTENT_METHODS and not (error.retry_safe or self.retry_unsafe):
+            return None
+
+        if self.respect_retry_after and error.retry_after is not None:
+            # Waiting longer than we are willing to back off is treated as a failure
+            return error.retry_after if error.retry_after <= self.max_backoff else None
+
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))
+
+
+class CircuitBreaker:
+    """Fails requests fast while the API keeps failing.
+
+    After ``failure_threshold`` consecutive transient failures the circuit opens and every
+    request raises ``CircuitOpenError`` without touching the network. Once ``recovery_time``
+    seconds have passed a single trial request is let through: success closes the circuit,
+    failure opens it again for another ``recovery_time`` seconds, and any other outcome (e.g.
+    an unexpected response body or an interrupt) lets the next request be the trial.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_request(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            remaining = self._opened_at + self.recovery_time - time.monotonic()
+            if remaining > 0 or self._trial_in_flight:
+                raise CircuitOpenError(
+                    "Circuit breaker is open after repeated API failures, not sending request",
+                    retry_after=max(remaining, 0.0),
+                )
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Ends a request that neither succeeded nor failed, without changing the state."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+def file_positions(files: Optional[dict]) -> list:
+    """Remembers the position of every file object in ``files`` so a retry can rewind them."""
+    positions = []
+    for value in (files or {}).values():
+        file_obj = value[1] if isinstance(value, tuple) else value
+        if hasattr(file_obj, "seek") and hasattr(file_obj, "tell"):
+            positions.append((file_obj, file_obj.tell()))
+    return positions
+
+
+def rewind(positions: list):
+    for file_obj, position in positions:
+        file_obj.seek(position)
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import subprocess
+from typing import Union, Optional, Generator
+from pathlib import Path
+from contextlib import contextmanager
+
+from .models import TranscodeOptions
+from .exceptions import TranscodeError
+
+
+TranscodeType = Union[str, TranscodeOptions]
+
+_CODECS = {
+    # codec: (ffmpeg encoder arguments, container format, file extension)
+    "flac": (["-c:a", "flac"], "flac", ".flac"),
+    "opus": (["-c:a", "libopus", "-application", "voip"], "ogg", ".opus"),
+}
+
+
+def resolve_transcode_options(transcode: Optional[TranscodeType]) -> Optional[TranscodeOptions]:
+    """Accepts either a codec name ("flac"/"opus") or full ``TranscodeOptions``."""
+    if transcode is None or isinstance(transcode, TranscodeOptions):
+        return transcode
+    return TranscodeOptions(codec=transcode)
+
+
+def transcode_command(file_path: str, output_path: str, options: TranscodeOptions) -> list:
+    # Imported lazily: pydub is only needed to locate the ffmpeg binary it is configured with
+    from pydub.utils import get_encoder_name
+
+    codec_args, container, _ = _CODECS[options.codec]
+    command = [get_encoder_name(), "-nostdin", "-hide_banner", "-loglevel", "error", "-y"]
+    command += ["-i", file_path, "-vn", "-map_metadata", "-1"]
+    command += ["-ac", str(options.channels), "-ar", str(options.sample_rate)]
+    command += codec_args
+    if options.codec == "opus":
+        command += ["-b:a", options.bitrate]
+    command += ["-f", container, output_path]
+    return command
+
+
+@contextmanager
+def transcoded_file(file_path: str, options: TranscodeOptions) -> Generator[str, None, None]:
+    """Transcodes ``file_path`` to a temporary file and yields its path.
+
+    ffmpeg decodes and encodes incrementally, so memory stays bounded whatever the input
+    length, and since it runs as a separate process several transcodes (e.g. from
+    ``upload_many`` workers) proceed in parallel, overlapping with other uploads.
+    The temporary file is removed on exit.
+    """
+    _, _, extension = _CODECS[options.codec]
+    with tempfile.TemporaryDirectory(prefix="behavioralsignals-") as tmp:
+        output_path = os.path.join(tmp, Path(file_path).stem + extension)
+        command = transcode_command(file_path, output_path, options)
+        try:
+            result = subprocess.run(
+                command, stdin=subprocess.DEVNULL, capture_output=True, check=False
+            )
+        except FileNotFoundError as e:
+            raise TranscodeError(f"Could not run ffmpeg to transcode {file_path}: {e}") from e
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace").strip()
+            raise TranscodeError(f"ffmpeg failed to transcode {file_path}: {stderr}")
+
+        yield output_path
@@ -0,0 +1,254 @@
+import time
+import threading
+from typing import TYPE_CHECKING, Any, List, Tuple, Callable, Optional, Awaitable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .dedup import SubmissionIndex
+from .retry import CircuitBreaker
+from .configuration import Configuration
+
+
+if TYPE_CHECKING:
+    import grpc
+    import grpc.aio
+
+
+def _make_circuit_breaker(config: Configuration) -> Optional[CircuitBreaker]:
+    if config.circuit_breaker_threshold is None:
+        return None
+    return CircuitBreaker(
+        failure_threshold=config.circuit_breaker_threshold,
+        recovery_time=config.circuit_breaker_recovery_time,
+    )
+
+
+def _grpc_options(config: Configuration) -> List[Tuple[str, Any]]:
+    options = []
+    if config.grpc_keepalive_time is not None:
+        options += [
+            ("grpc.keepalive_time_ms", int(config.grpc_keepalive_time * 1000)),
+            ("grpc.keepalive_timeout_ms", int(config.grpc_keepalive_timeout * 1000)),
+            ("grpc.keepalive_permit_without_calls", int(config.grpc_keepalive_without_calls)),
+            ("grpc.http2.max_pings_without_data", 0),
+        ]
+    if config.grpc_max_reconnect_backoff is not None:
+        options.append(
+            ("grpc.max_reconnect_backoff_ms", int(config.grpc_max_reconnect_backoff * 1000))
+        )
+    if config.grpc_max_message_size is not None:
+        options += [
+            ("grpc.max_send_message_length", config.grpc_max_message_size),
+            ("grpc.max_receive_message_length", config.grpc_max_message_size),
+        ]
+    return options
+
+
+def _make_channel(channel_module: Any, config: Configuration):
+    """Creates a streaming API channel with ``channel_module`` being ``grpc`` or ``grpc.aio``."""
+    import grpc
+
+    options = _grpc_options(config)
+    if config.use_ssl:
+        credentials = grpc.ssl_channel_credentials()
+        return channel_module.secure_channel(
+            config.streaming_api_url, credentials=credentials, options=options
+        )
+    return channel_module.insecure_channel(config.streaming_api_url, options=options)
+
+
+class _AioChannelPool:
+    """``Configuration.streaming_channels`` ``grpc.aio`` channels, opened on first use and
+    handed out in turn. The channels are bound to the event loop they are first used in."""
+
+    def __init__(self, config: Configuration):
+        self.config = config
+        self._channels: list = []
+        self._next_channel = 0
+
+    def next(self) -> "grpc.aio.Channel":
+        if not self._channels:
+            import grpc.aio
+
+            self._channels = [
+                _make_channel(grpc.aio, self.config) for _ in range(self.config.streaming_channels)
+            ]
+        channel = self._channels[self._next_channel % len(self._channels)]
+        self._next_channel += 1
+        return channel
+
+    async def close(self) -> None:
+        channels, self._channels = self._channels, []
+        for channel in channels:
+            await channel.close()
+
+
+class Transport:
+    """Connection state shared by every client created from the same ``Client``.
+
+    Owns a single ``requests.Session`` whose connection pool is sized by
+    ``Configuration.pool_maxsize`` and keeps track of authentication, so the
+    ``/auth`` round trip happens once (or once per ``auth_ttl`` seconds) no matter
+    how many sub-clients or threads use the transport.
+
+    It also owns the gRPC channels of the streaming API: ``Configuration.streaming_channels``
+    long-lived channels, opened on first use and shared by all streams, so only the first
+    stream pays for the TCP/TLS/HTTP2 handshakes. gRPC reconnects them transparently.
+    """
+
+    def __init__(self, config: Configuration):
+        self.config = config
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.circuit_breaker = _make_circuit_breaker(config)
+
+        self._auth_lock = threading.Lock()
+        self._authenticated_at: Optional[float] = None
+        self._index_lock = threading.Lock()
+        self._submission_index: Optional[SubmissionIndex] = None
+        self._channel_lock = threading.Lock()
+        self._channels: list = []
+        self._next_channel = 0
+
+    @property
+    def submission_index(self) -> SubmissionIndex:
+        """The local index of uploaded files, created on first use."""
+        with self._index_lock:
+            if self._submission_index is None:
+                self._submission_index = SubmissionIndex(self.config.submission_index_path)
+            return self._submission_index
+
+    @property
+    def is_authenticated(self) -> bool:
+        if self._authenticated_at is None:
+            return False
+        ttl = self.config.auth_ttl
+        return ttl is None or time.monotonic() - self._authenticated_at < ttl
+
+    def ensure_authenticated(self, authenticate: Callable[[], Any]) -> None:
+        """Runs ``authenticate`` unless a previous authentication is still valid.
+
+        Concurrent callers block until the first one finishes, so only a single
+        ``/auth`` request is issued per expiry period.
+        """
+        if self.is_authenticated:
+            return
+
+        with self._auth_lock:
+            if self.is_authenticated:
+                return
+            authenticate()
+            self._authenticated_at = time.monotonic()
+
+    def streaming_channel(self) -> "grpc.Channel":
+        """Returns the next shared streaming channel, opening the channels on first use."""
+        with self._channel_lock:
+            if not self._channels:
+                import grpc
+
+                self._channels = [
+                    _make_channel(grpc, self.config) for _ in range(self.config.streaming_channels)
+                ]
+            channel = self._channels[self._next_channel % len(self._channels)]
+            self._next_channel += 1
+            return channel
+
+    def connect_streaming(self, timeout: Optional[float] = None) -> None:
+        """Opens the streaming channels and waits until they are connected.
+
+        Raises:
+            grpc.FutureTimeoutError: If a channel is not connected within ``timeout`` seconds.
+        """
+        import grpc
+
+        for _ in range(self.config.streaming_channels):
+            grpc.channel_ready_future(self.streaming_channel()).result(timeout=timeout)
+
+    def close(self):
+        """Close the underlying session and its connection pool, and the streaming channels."""
+        self.session.close()
+        with self._channel_lock:
+            channels, self._channels = self._channels, []
+        for channel in channels:
+            channel.close()
+
+
+class AsyncTransport:
+    """asyncio counterpart of ``Transport``, backed by a shared ``httpx.AsyncClient``."""
+
+    def __init__(self, config: Configuration):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncClient requires httpx. Install it with `pip install behavioralsignals[async]`."
+            ) from e
+
+        self.config = config
+
+        timeout = config.timeout
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+
+        self.session = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=config.pool_maxsize, max_keepalive_connections=config.pool_maxsize
+            ),
+        )
+        self.circuit_breaker = _make_circuit_breaker(config)
+
+        import asyncio
+
+        self._auth_lock = asyncio.Lock()
+        self._authenticated_at: Optional[float] = None
+        self._channel_pool = _AioChannelPool(config)
+
+    @property
+    def is_authenticated(self) -> bool:
+        if self._authenticated_at is None:
+            return False
+        ttl = self.config.auth_ttl
+        return ttl is None or time.monotonic() - self._authenticated_at < ttl
+
+    async def ensure_authenticated(self, authenticate: Callable[[], Awaitable[Any]]) -> None:
+        """Awaits ``authenticate`` unless a previous authentication is still valid."""
+        if self.is_authenticated:
+            return
+
+        async with self._auth_lock:
+            if self.is_authenticated:
+                return
+            await authenticate()
+            self._authenticated_at = time.monotonic()
+
+    def streaming_channel(self) -> "grpc.aio.Channel":
+        """Returns the next shared ``grpc.aio`` streaming channel, see ``Transport``.
+
+        The channels are bound to the event loop they are first used in.
+        """
+        return self._channel_pool.next()
+
+    async def connect_streaming(self, timeout: Optional[float] = None) -> None:
+        """Opens the streaming channels and waits until they are connected.
+
+        Raises:
+            asyncio.TimeoutError: If a channel is not connected within ``timeout`` seconds.
+        """
+        import asyncio
+
+        for _ in range(self.config.streaming_channels):
+            await asyncio.wait_for(self.streaming_channel().channel_ready(), timeout)
+
+    async def close(self):
+        """Close the underlying ``httpx.AsyncClient`` and the streaming channels."""
+        await self.session.aclose()
+        await self._channel_pool.close()
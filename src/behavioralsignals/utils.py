@@ -1,12 +1,167 @@
-from typing import Tuple, Iterator
+import mmap
+import struct
+import tempfile
+import subprocess
+from typing import Tuple, Callable, Iterator, Optional
 
-from pydub import AudioSegment
-from pydub.utils import make_chunks
+from .exceptions import TranscodeError
+
+
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# Not available on every platform (e.g. Windows)
+_MADV_DONTNEED = getattr(mmap, "MADV_DONTNEED", None)
+_RELEASE_BYTES = 1 << 20
+
+
+class _WavHeader:
+    def __init__(self, format_tag: int, channels: int, sample_rate: int, bits: int, size: int):
+        self.format_tag = format_tag
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.bits = bits
+        # Size of the data chunk; unreliable for streamed WAVs (e.g. 0 or 0xFFFFFFFF)
+        self.size = size
+
+    @property
+    def is_pcm16_mono(self) -> bool:
+        return self.format_tag == _WAVE_FORMAT_PCM and self.channels == 1 and self.bits == 16
+
+
+def _read_wav_header(read: Callable[[int], bytes]) -> _WavHeader:
+    """Reads a RIFF/WAVE header up to the start of the ``data`` chunk's samples.
+
+    Raises:
+        ValueError: If the input is not a WAV file.
+    """
+    riff = read(12)
+    if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+
+    fmt = None
+    while True:
+        chunk = read(8)
+        if len(chunk) < 8:
+            raise ValueError("No data chunk in WAV file")
+        chunk_id, size = chunk[:4], int.from_bytes(chunk[4:], "little")
+        if chunk_id == b"data":
+            break
+        # Chunks are padded to an even size
+        body = read(size + (size & 1))
+        if chunk_id == b"fmt ":
+            fmt = body
+    if fmt is None or len(fmt) < 16:
+        raise ValueError("No fmt chunk in WAV file")
+
+    format_tag, channels, sample_rate, _, _, bits = struct.unpack("<HHIIHH", fmt[:16])
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        format_tag = struct.unpack("<H", fmt[24:26])[0]
+    return _WavHeader(format_tag, channels, sample_rate, bits, size)
+
+
+def _wav_chunks(file_path: str, chunk_size: float) -> Optional[Tuple[Iterator[bytes], int]]:
+    """Streams 16-bit mono PCM WAV files straight from a memory map, or returns None."""
+    with open(file_path, "rb") as f:
+        try:
+            header = _read_wav_header(f.read)
+        except ValueError:
+            return None
+        if not header.is_pcm16_mono:
+            return None
+        offset = f.tell()
+
+    def _chunks() -> Iterator[bytes]:
+        with open(file_path, "rb") as f:
+            length = f.seek(0, 2)
+            if length <= offset:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    data.madvise(mmap.MADV_SEQUENTIAL)
+                # Trailing chunks after the samples (and truncated files) are respected
+                end = min(offset + header.size, length) if header.size else length
+                step = max(int(chunk_size * header.sample_rate), 1) * 2
+                released = 0
+                for start in range(offset, end, step):
+                    yield data[start : min(start + step, end)]
+                    # Unmaps the pages already read, which would otherwise add up in the RSS
+                    read = (start + step) // mmap.PAGESIZE * mmap.PAGESIZE
+                    if _MADV_DONTNEED is not None and read - released >= _RELEASE_BYTES:
+                        data.madvise(_MADV_DONTNEED, released, read - released)
+                        released = read
+
+    return _chunks(), header.sample_rate
+
+
+def _ffmpeg_chunks(file_path: str, chunk_size: float) -> Iterator:
+    """Decodes any audio file to 16-bit mono PCM with ffmpeg, yielding the sample rate first
+    and then the chunks, read incrementally from ffmpeg's output."""
+    from pydub.utils import get_encoder_name
+
+    command = [get_encoder_name(), "-nostdin", "-hide_banner", "-loglevel", "error"]
+    command += ["-i", file_path, "-vn", "-map_metadata", "-1", "-ac", "1"]
+    command += ["-c:a", "pcm_s16le", "-f", "wav", "-"]
+    # Not a pipe: ffmpeg would block once it fills the pipe's buffer (e.g. with a warning
+    # per damaged frame), since stderr is only read on failure
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(
+            command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr
+        )
+
+        def _fail(reason: str):
+            process.kill()
+            process.wait()
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace").strip()
+            raise TranscodeError(f"ffmpeg failed to decode {file_path}: {message or reason}")
+
+        try:
+            try:
+                header = _read_wav_header(process.stdout.read)
+            except ValueError as e:
+                _fail(str(e))
+            yield header.sample_rate
+
+            step = max(int(chunk_size * header.sample_rate), 1) * 2
+            while True:
+                chunk = process.stdout.read(step)
+                if not chunk:
+                    break
+                yield chunk
+            if process.wait() != 0:
+                _fail(f"exit status {process.returncode}")
+        finally:
+            # Also stops ffmpeg when the consumer does not read the stream to its end
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            process.stdout.close()
+
+
+def _pydub_chunks(file_path: str, chunk_size: float) -> Tuple[Iterator[bytes], int]:
+    # Decodes the whole file in memory, only used when ffmpeg is not available
+    from pydub import AudioSegment
+    from pydub.utils import make_chunks
+
+    snd = AudioSegment.from_file(file_path)
+    snd = snd.set_sample_width(2)
+    snd = snd.set_channels(1)
+
+    chunks = (chunk.raw_data for chunk in make_chunks(snd, chunk_size * 1000))
+    return chunks, snd.frame_rate
 
 
 def make_audio_stream(file_path: str, chunk_size: float = 0.25) -> Tuple[Iterator[bytes], int]:
     """Create an audio stream from a file, yielding chunks of raw audio data.
 
+    The audio is decoded lazily, so memory use stays constant whatever the file length and
+    the first chunk is available immediately: 16-bit mono PCM WAV files are read straight
+    from a memory map, any other file is decoded to 16-bit mono PCM by an ffmpeg process
+    whose output is read chunk by chunk. If ffmpeg is not installed, the file is decoded
+    in memory with pydub (which can only decode WAV files without ffmpeg). Both downmix
+    multichannel audio by averaging the channels, ffmpeg rounding where pydub truncates,
+    so their samples may differ by 1.
+
     Args:
         file_path (str): Path to the audio file.
         chunk_size (float): Size of each chunk in seconds. Default is 0.25 seconds.
@@ -14,11 +169,16 @@ def make_audio_stream(file_path: str, chunk_size: float = 0.25) -> Tuple[Iterato
     Returns:
         Iterator[bytes]: An iterator yielding raw audio data chunks.
         int: Sample rate of the audio.
+    Raises:
+        TranscodeError: If ffmpeg cannot decode the file.
     """
+    stream = _wav_chunks(file_path, chunk_size)
+    if stream is not None:
+        return stream
 
-    snd = AudioSegment.from_file(file_path)
-    snd = snd.set_sample_width(2)
-    snd = snd.set_channels(1)
-
-    chunks = iter([chunk.raw_data for chunk in make_chunks(snd, chunk_size * 1000)])
-    return chunks, snd.frame_rate
+    chunks = _ffmpeg_chunks(file_path, chunk_size)
+    try:
+        sample_rate = next(chunks)
+    except FileNotFoundError:
+        return _pydub_chunks(file_path, chunk_size)
+    return chunks, sample_rate
@@ -0,0 +1,76 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from behavioralsignals import Client, StreamManager, StreamingOptions
+
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "examples" / "benchmarks"))
+from fake_streaming import FakeStreamingServer
+
+
+OPTIONS = StreamingOptions(sample_rate=16000, encoding="LINEAR_PCM")
+CHUNK = bytes(640)
+
+
+@pytest.fixture
+def manager():
+    with FakeStreamingServer() as server:
+        client = Client(1, "key", streaming_api_url=server.address, use_ssl=False, lazy_auth=True)
+        with StreamManager(client) as manager:
+            yield manager
+        client.close()
+
+
+def failing_source():
+    yield CHUNK
+    raise OSError("device unplugged")
+
+
+async def failing_async_source():
+    yield CHUNK
+    raise ValueError("bad chunk")
+
+
+def endless_source():
+    while True:
+        time.sleep(0.01)
+        yield CHUNK
+
+
+def final_events(manager):
+    return {event.key: event.error for event in manager.iter_until_idle() if event.done}
+
+
+def test_failing_source_ends_with_its_error(manager):
+    manager.add("ok", OPTIONS, [CHUNK] * 3)
+    manager.add("sync", OPTIONS, failing_source())
+    manager.add("async", OPTIONS, failing_async_source())
+
+    errors = final_events(manager)
+
+    assert errors["ok"] is None
+    assert isinstance(errors["sync"], OSError)
+    assert isinstance(errors["async"], ValueError)
+
+
+def test_removed_stream_ends_without_error(manager):
+    manager.add("line", OPTIONS, endless_source())
+    time.sleep(0.2)
+    assert manager.remove("line")
+
+    assert final_events(manager) == {"line": None}
+
+
+def test_iter_until_idle_stops_after_pushed_streams_end(manager):
+    manager.add("line", OPTIONS)
+    manager.send("line", CHUNK)
+    manager.end("line")
+
+    events = list(manager.iter_until_idle())
+
+    assert [event.key for event in events if event.done] == ["line"]
+    assert len(events) > 1
+    assert list(manager.iter_until_idle()) == []